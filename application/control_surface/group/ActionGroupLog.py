@@ -35,3 +35,18 @@ class ActionGroupLog(ActionGroupInterface):
             name="log missing vsts",
             on_press=self._container.get(LogService).log_missing_vsts,
         )
+
+        # SEQuences encoder
+        self.add_encoder(
+            identifier=6,
+            name="log running sequences",
+            on_press=self._container.get(LogService).log_running_sequences,
+        )
+
+        # PROFile encoder
+        self.add_encoder(
+            identifier=7,
+            name="log sequence profile",
+            on_press=self._container.get(LogService).log_sequence_profile,
+            on_long_press=self._container.get(LogService).toggle_sequence_profiling,
+        )
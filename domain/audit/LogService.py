@@ -1,3 +1,5 @@
+import json
+
 from protocol0.domain.lom.device.DeviceEnum import DeviceEnum
 from protocol0.domain.lom.device.PluginDevice import PluginDevice
 from protocol0.domain.lom.set.AbletonSet import AbletonSet
@@ -6,6 +8,8 @@ from protocol0.domain.lom.track.group_track.AbstractGroupTrack import AbstractGr
 from protocol0.domain.shared.backend.Backend import Backend
 from protocol0.shared.SongFacade import SongFacade
 from protocol0.shared.logging.Logger import Logger
+from protocol0.shared.sequence.Sequence import Sequence
+from protocol0.shared.sequence.SequenceProfiler import SequenceProfiler
 
 
 class LogService(object):
@@ -212,3 +216,35 @@ class LogService(object):
             for device in track.devices.all:
                 if device.name in DeviceEnum.missing_plugin_names():
                     Logger.warning((track, device))
+
+    def log_running_sequences(self):
+        # type: () -> None
+        Logger.clear()
+        self.focus_window()
+        stats = Sequence.get_running_sequences_stats()
+        Logger.info("********* RUNNING SEQUENCES *************")
+        Logger.info("count: %s" % stats["count"])
+        Logger.info()
+        Logger.info("by name:")
+        for name, count in sorted(stats["by_name"].items(), key=lambda i: -i[1]):
+            Logger.info("%s: %s" % (name, count))
+        Logger.info()
+        Logger.info("by waiting for:")
+        for waiting_for, count in sorted(stats["by_waiting_for"].items(), key=lambda i: -i[1]):
+            Logger.info("%s: %s" % (waiting_for, count))
+
+    def log_sequence_profile(self):
+        # type: () -> None
+        Logger.clear()
+        self.focus_window()
+        if not SequenceProfiler.ENABLED:
+            Logger.warning("Sequence profiling is disabled")
+        Logger.info("********* SEQUENCE PROFILE *************")
+        Logger.info("slowest steps: %s" % SequenceProfiler.slowest_steps())
+        Logger.info(json.dumps(SequenceProfiler.to_dict(), indent=2, sort_keys=True))
+
+    def toggle_sequence_profiling(self):
+        # type: () -> None
+        SequenceProfiler.ENABLED = not SequenceProfiler.ENABLED
+        SequenceProfiler.reset()
+        Logger.info("Sequence profiling: %s" % SequenceProfiler.ENABLED)
@@ -6,6 +6,7 @@ from protocol0.domain.lom.device.Device import Device
 from protocol0.domain.lom.device.DeviceEnum import DeviceEnum
 from protocol0.domain.lom.device.DrumRackDevice import DrumRackDevice
 from protocol0.domain.lom.device.SimplerDevice import SimplerDevice
+from protocol0.domain.lom.instrument.preset.preset_importer.PresetCache import PresetCache
 from protocol0.domain.shared.utils.list import find_if
 from protocol0.shared.SongFacade import SongFacade
 
@@ -82,5 +83,6 @@ class DevicesStats(object):
         output["play instances"] = self.play_instances
         output["opus instances"] = self.opus_instances
         output["kontakt instances"] = self.kontakt_instances
+        output["preset cache"] = PresetCache.get_stats()
 
         return output
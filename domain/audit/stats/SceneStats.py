@@ -2,6 +2,8 @@ import collections
 
 from typing import Dict, Any
 
+from protocol0.domain.lom.scene.SceneLength import SceneLength
+from protocol0.domain.lom.scene.ScenePlaybackGraph import ScenePlaybackGraph
 from protocol0.domain.shared.utils.utils import get_minutes_legend
 from protocol0.shared.SongFacade import SongFacade
 
@@ -11,21 +13,15 @@ class SceneStats(object):
         # type: () -> None
         beat_duration = float(60) / SongFacade.tempo()
 
-        current_scene = SongFacade.scenes()[0]
-        scenes = [current_scene]
-
-        while current_scene.next_scene and current_scene.next_scene != current_scene:
-            current_scene = current_scene.next_scene
-            scenes.append(current_scene)
-
-        self.count = len(scenes)
-        self.bar_length = sum([scene.bar_length for scene in scenes])
-        self.total_duration = sum([scene.length for scene in scenes]) * beat_duration
+        self.count = ScenePlaybackGraph.played_scene_count()
+        self.bar_length = ScenePlaybackGraph.bar_length()
+        self.total_duration = ScenePlaybackGraph.length() * beat_duration
 
     def to_dict(self):
         # type: () -> Dict
         output = collections.OrderedDict()  # type: Dict[str, Any]
         output["count"] = self.count
         output["total duration"] = get_minutes_legend(self.total_duration)
+        output["length cache"] = SceneLength.get_cache_stats()
 
         return output
@@ -1,7 +1,7 @@
 from functools import partial
 
 import Live
-from _Framework.SubjectSlot import SlotManager
+from _Framework.SubjectSlot import SlotManager, subject_slot
 from typing import Optional, List, cast
 
 from protocol0.domain.lom.clip.ClipAppearance import ClipAppearance
@@ -38,6 +38,10 @@ class Clip(SlotManager, Observable):
         )  # type: ClipPlayingPosition
 
         self.loop.register_observer(self)
+        self._muted_listener.subject = live_clip
+        self._playing_status_listener.subject = live_clip
+        self._has_envelopes_listener.subject = live_clip
+        self._is_recording = bool(self.is_recording)
 
     def __eq__(self, clip):
         # type: (object) -> bool
@@ -52,6 +56,27 @@ class Clip(SlotManager, Observable):
         if isinstance(observable, ClipLoop):
             self.notify_observers()
 
+    @subject_slot("muted")
+    def _muted_listener(self):
+        # type: () -> None
+        self.notify_observers()
+
+    @subject_slot("has_envelopes")
+    def _has_envelopes_listener(self):
+        # type: () -> None
+        self.automation.invalidate()
+
+    @subject_slot("playing_status")
+    def _playing_status_listener(self):
+        # type: () -> None
+        """Only notifying recording state changes"""
+        # envelopes drawn since the last play are not notified by Live
+        self.automation.invalidate()
+        is_recording = bool(self.is_recording)
+        if is_recording != self._is_recording:
+            self._is_recording = is_recording
+            self.notify_observers()
+
     name = cast(str, ForwardTo("appearance", "name"))
     color = cast(int, ForwardTo("appearance", "color"))
     length = cast(float, ForwardTo("loop", "length"))
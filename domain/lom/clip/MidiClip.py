@@ -3,16 +3,21 @@ from __future__ import division
 from functools import partial
 
 import Live
-from typing import List, Optional, Iterator, Any
+from _Framework.SubjectSlot import subject_slot
+from typing import List, Optional, Any
 
 from protocol0.domain.lom.clip.Clip import Clip
+from protocol0.domain.lom.clip.ClipLoop import ClipLoop
 from protocol0.domain.lom.device_parameter.DeviceParameter import DeviceParameter
 from protocol0.domain.lom.device_parameter.LinkedDeviceParameters import LinkedDeviceParameters
 from protocol0.domain.lom.instrument.instrument.InstrumentSimpler import InstrumentSimpler
 from protocol0.domain.lom.note.Note import Note
+from protocol0.domain.lom.note.NoteBuffer import NoteBuffer
+from protocol0.domain.lom.note.NoteVelocityCache import NoteVelocityCache
 from protocol0.domain.shared.errors.Protocol0Warning import Protocol0Warning
 from protocol0.domain.shared.utils.list import find_if
 from protocol0.shared.SongFacade import SongFacade
+from protocol0.shared.observer.Observable import Observable
 from protocol0.shared.sequence.Sequence import Sequence
 
 
@@ -20,12 +25,37 @@ class MidiClip(Clip):
     def __init__(self, *a, **k):
         # type: (Any, Any) -> None
         super(MidiClip, self).__init__(*a, **k)
-        self._cached_notes = []  # type: List[Note]
+        self._velocity_cache = NoteVelocityCache()
+        self._hash = None  # type: Optional[int]
+        # incremented on any notes change, for the track caches depending on the clip content
+        self.notes_version = 0
+
+        self._notes_listener.subject = self._clip
+
+    def update(self, observable):
+        # type: (Observable) -> None
+        if isinstance(observable, ClipLoop):
+            # the notes are fetched in the loop
+            self._invalidate_hash()
+        super(MidiClip, self).update(observable)
+
+    @subject_slot("notes")
+    def _notes_listener(self):
+        # type: () -> None
+        self._invalidate_hash()
+
+    def _invalidate_hash(self):
+        # type: () -> None
+        self._hash = None
+        self.notes_version += 1
 
     @property
     def hash(self):
         # type: () -> int
-        return hash(tuple(note.to_data() for note in self.get_notes()))
+        """notes content digest"""
+        if self._hash is None:
+            self._hash = self._get_note_buffer().hash()
+        return self._hash
 
     def matches(self, other):
         # type: (MidiClip) -> bool
@@ -34,42 +64,42 @@ class MidiClip(Clip):
     @property
     def starts_at_1(self):
         # type: () -> bool
-        return any(note.start == 0 for note in self.get_notes())
+        return self._get_note_buffer().has_note_at(0)
 
     def get_notes(self):
         # type: () -> List[Note]
+        return self._get_note_buffer().to_notes()
+
+    def _get_note_buffer(self):
+        # type: () -> NoteBuffer
         if not self._clip:
-            return []
-        # noinspection PyArgumentList
-        clip_notes = [
-            Note(*note) for note in self._clip.get_notes(self.loop.start, 0, self.length, 128)
-        ]
-        notes = list(self._get_notes_from_cache(notes=clip_notes))
-        notes.sort(key=lambda x: x.start)
-        return notes
-
-    def _get_notes_from_cache(self, notes):
-        # type: (List[Note]) -> Iterator[Note]
-        for note in notes:
-            yield next(
-                (cached_note for cached_note in self._cached_notes if cached_note == note), note
-            )
+            return NoteBuffer()
+
+        buffer = NoteBuffer.from_live_notes(
+            self._clip.get_notes(self.loop.start, 0, self.length, 128)
+        )
+        self._velocity_cache.apply(buffer)
+        return buffer
 
     def set_notes(self, notes):
         # type: (List[Note]) -> Optional[Sequence]
+        return self._set_note_buffer(NoteBuffer.from_notes(notes))
+
+    def _set_note_buffer(self, buffer):
+        # type: (NoteBuffer) -> Optional[Sequence]
         if not self._clip:
             return None
-        self._cached_notes = notes
+        self._velocity_cache.set(buffer)
         self._clip.select_all_notes()  # noqa
         seq = Sequence()
-        seq.add(partial(self._clip.replace_selected_notes, tuple(note.to_data() for note in notes)))
+        seq.add(partial(self._clip.replace_selected_notes, buffer.to_live_notes()))
         # noinspection PyUnresolvedReferences
         seq.defer()
         return seq.done()
 
     def on_added(self):
         # type: () -> Optional[Sequence]
-        if len(self.get_notes()) > 0 or self.is_recording:
+        if len(self._get_note_buffer()) > 0 or self.is_recording:
             return None
 
         self._clip.view.grid_quantization = Live.Clip.GridQuantization.g_eighth
@@ -106,17 +136,11 @@ class MidiClip(Clip):
 
     def scale_velocities(self, go_next, scaling_factor=4):
         # type: (bool, int) -> None
-        notes = self.get_notes()
-        if len(notes) == 0:
+        buffer = self._get_note_buffer()
+        if len(buffer) == 0:
             return
-        average_velo = sum([note.velocity for note in notes]) / len(notes)
-        for note in notes:
-            velocity_diff = note.velocity - average_velo
-            if go_next:
-                note.velocity += velocity_diff / (scaling_factor - 1)
-            else:
-                note.velocity -= velocity_diff / scaling_factor
-        self.set_notes(notes)
+        buffer.scale_velocities(go_next, scaling_factor)
+        self._set_note_buffer(buffer)
 
     def crop(self):
         # type: () -> None
@@ -165,13 +189,9 @@ class MidiClip(Clip):
     def to_mono(self):
         # type: () -> None
         """If notes overlap : make end of each note match the start of the next one"""
-        notes = self.get_notes()
-        if len(notes) < 2:
+        buffer = self._get_note_buffer()
+        if len(buffer) < 2:
             return None
 
-        current_note = notes[0]
-        for next_note in notes[1:]:
-            current_note.end = max(current_note.end, next_note.start)
-            current_note = next_note
-
-        self.set_notes(notes)
+        buffer.to_mono()
+        self._set_note_buffer(buffer)
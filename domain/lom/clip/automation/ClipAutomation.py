@@ -1,5 +1,5 @@
 import Live
-from typing import Optional, List, cast
+from typing import Optional, List, cast, Tuple
 
 from protocol0.domain.lom.clip.ClipEnvelopeShowedEvent import ClipEnvelopeShowedEvent
 from protocol0.domain.lom.clip.ClipLoop import ClipLoop
@@ -18,8 +18,37 @@ class ClipAutomation(object):
         self._live_clip = live_clip
         self._loop = loop
         self.displayed_automated_parameter = None  # type: Optional[DeviceParameter]
+        # incremented on any envelope change, for the caches depending on this clip automation
+        self.version = 0
+        # the automated parameters and the device parameters they were computed from
+        self._automated_parameters = None  # type: Optional[List[DeviceParameter]]
+        self._device_parameters = ()  # type: Tuple[DeviceParameter, ...]
 
-    def get_automated_parameters(self, device_parameters):
+    def invalidate(self):
+        # type: () -> None
+        """To be called when the clip envelopes change"""
+        self._automated_parameters = None
+        self.version += 1
+
+    def get_automated_parameters(self, device_parameters, use_cache=True):
+        # type: (List[DeviceParameter], bool) -> List[DeviceParameter]
+        """use_cache=False queries Live, e.g. when envelopes were drawn on an automated clip"""
+        if not use_cache:
+            self.invalidate()
+        if not self._live_clip or not self._live_clip.has_envelopes:
+            return []
+
+        device_parameters_key = tuple(device_parameters)
+        if (
+            self._automated_parameters is None
+            or self._device_parameters != device_parameters_key
+        ):
+            self._automated_parameters = self._find_automated_parameters(device_parameters)
+            self._device_parameters = device_parameters_key
+
+        return list(self._automated_parameters)
+
+    def _find_automated_parameters(self, device_parameters):
         # type: (List[DeviceParameter]) -> List[DeviceParameter]
         automated_parameters = []
         for parameter in device_parameters:
@@ -41,9 +70,12 @@ class ClipAutomation(object):
         self._live_clip.view.select_envelope_parameter(parameter._device_parameter)
         DomainEventBus.emit(ClipEnvelopeShowedEvent())
         self.displayed_automated_parameter = parameter
+        # the shown envelopes can be edited in Live, which doesn't notify existing envelopes
+        self.invalidate()
 
     def scroll_envelopes(self, device_parameters, go_next=True):
         # type: (List[DeviceParameter], bool) -> None
+        self.invalidate()
         automated_parameters = self.get_automated_parameters(device_parameters)
         if len(automated_parameters) == 0:
             raise Protocol0Warning("No automated parameters")
@@ -83,12 +115,14 @@ class ClipAutomation(object):
         except RuntimeError:
             # envelope already exists
             pass
+        self.invalidate()
         return cast(ClipAutomationEnvelope, self.get_envelope(parameter))
 
     def clear_all_envelopes(self):
         # type: () -> None
         if self._live_clip:
-            return self._live_clip.clear_all_envelopes()
+            self._live_clip.clear_all_envelopes()
+            self.invalidate()
 
     @handle_error
     def show_envelope(self):
@@ -0,0 +1,46 @@
+from typing import Dict, List, Iterator, Iterable, TYPE_CHECKING
+
+from protocol0.domain.lom.clip_slot.ClipSlot import ClipSlot
+
+if TYPE_CHECKING:
+    from protocol0.domain.lom.track.simple_track.SimpleTrack import SimpleTrack
+
+
+class ClipSlotGrid(object):
+    """
+    Song level track x scene matrix of ClipSlots
+
+    Columns are the ClipSlot lists of the tracks, maintained by SimpleTrackClipSlots.build.
+    They are shared and not copied : callers should not mutate them
+    """
+
+    # live track id -> clip slots
+    _COLUMNS = {}  # type: Dict[int, List[ClipSlot]]
+
+    @classmethod
+    def set_column(cls, track_id, clip_slots):
+        # type: (int, List[ClipSlot]) -> None
+        cls._COLUMNS[track_id] = clip_slots
+
+    @classmethod
+    def remove_column(cls, track_id, clip_slots):
+        # type: (int, List[ClipSlot]) -> None
+        """The column could already be replaced by a new SimpleTrack on the same live track"""
+        if cls._COLUMNS.get(track_id, None) is clip_slots:
+            del cls._COLUMNS[track_id]
+
+    @classmethod
+    def column(cls, track):
+        # type: (SimpleTrack) -> List[ClipSlot]
+        return cls._COLUMNS[track.live_id]
+
+    @classmethod
+    def get(cls, track, scene_index):
+        # type: (SimpleTrack, int) -> ClipSlot
+        return cls._COLUMNS[track.live_id][scene_index]
+
+    @classmethod
+    def row(cls, tracks, scene_index):
+        # type: (Iterable[SimpleTrack], int) -> Iterator[ClipSlot]
+        columns = cls._COLUMNS
+        return (columns[track.live_id][scene_index] for track in tracks)
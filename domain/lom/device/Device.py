@@ -1,12 +1,10 @@
 import Live
 from _Framework.SubjectSlot import SlotManager, subject_slot
-from typing import List, Any, Type, Optional, Union
+from typing import List, Any, Type, Optional, Union, Dict, cast
 
 from protocol0.domain.lom.device.DeviceEnum import DeviceEnum
 from protocol0.domain.lom.device_parameter.DeviceParameter import DeviceParameter
 from protocol0.domain.lom.device_parameter.DeviceParameterEnum import DeviceParameterEnum
-from protocol0.domain.shared.errors.Protocol0Error import Protocol0Error
-from protocol0.domain.shared.utils.list import find_if
 
 
 class Device(SlotManager):
@@ -14,10 +12,12 @@ class Device(SlotManager):
         # type: (Live.Device.Device) -> None
         super(Device, self).__init__()
         self._device = device
+        self.live_id = device._live_ptr  # type: int
         self._view = self._device.view  # type: Live.Device.Device.View
-        self.parameters = []  # type: List[DeviceParameter]
+        # created on first access, plugins can expose hundreds of parameters
+        self._parameters = None  # type: Optional[List[DeviceParameter]]
+        self._parameters_by_name = {}  # type: Dict[str, DeviceParameter]
         self._parameters_listener.subject = self._device
-        self._parameters_listener()
         self.can_have_drum_pads = self._device.can_have_drum_pads  # type: bool
         self.can_have_chains = self._device.can_have_chains  # type: bool
 
@@ -56,24 +56,39 @@ class Device(SlotManager):
     @property
     def enum(self):
         # type: () -> Optional[DeviceEnum]
-        try:
-            return DeviceEnum.from_value(self.name)
-        except Protocol0Error:
-            return None
+        return DeviceEnum.from_name(self.name)
 
     @subject_slot("parameters")
     def _parameters_listener(self):
         # type: () -> None
-        self.parameters = [
-            DeviceParameter.create_from_name(self.name, parameter)
+        self._parameters = None
+
+    @property
+    def parameters(self):
+        # type: () -> List[DeviceParameter]
+        if self._parameters is None:
+            self._map_parameters()
+        return cast(List[DeviceParameter], self._parameters)
+
+    def _map_parameters(self):
+        # type: () -> None
+        device_name = self.name
+        self._parameters = [
+            DeviceParameter.create_from_name(device_name, parameter)
             for parameter in self._device.parameters
         ]
+        self._parameters_by_name = {}
+        # reversed : the first parameter wins on duplicate names
+        for parameter in reversed(self._parameters):
+            self._parameters_by_name[parameter.name] = parameter
 
     def get_parameter_by_name(self, device_parameter_name):
         # type: (Union[DeviceParameterEnum, str]) -> Optional[DeviceParameter]
         if isinstance(device_parameter_name, DeviceParameterEnum):
             device_parameter_name = device_parameter_name.parameter_name
-        return find_if(lambda p: p.name == device_parameter_name, self.parameters)
+        if self._parameters is None:
+            self._map_parameters()
+        return self._parameters_by_name.get(device_parameter_name)
 
     @property
     def name(self):
@@ -1,7 +1,8 @@
 import Live
 from _Framework.SubjectSlot import subject_slot, SlotManager
-from typing import List
+from typing import List, cast
 
+from protocol0.domain.shared.LiveObjectMapping import LiveObjectMapping
 from protocol0.shared.observer.Observable import Observable
 
 
@@ -14,6 +15,7 @@ class DeviceChain(SlotManager, Observable):
         from protocol0.domain.lom.device.Device import Device
 
         self.devices = []  # type: List[Device]
+        self._devices_mapping = LiveObjectMapping(Device.make, on_removed=lambda d: d.disconnect())
         self._devices_listener.subject = self._chain
         self._devices_listener()
 
@@ -35,7 +37,9 @@ class DeviceChain(SlotManager, Observable):
         # type: () -> None
         from protocol0.domain.lom.device.Device import Device
 
-        self.devices = [Device.make(device) for device in self._chain.devices]
+        # only the devices added to the chain are created
+        self._devices_mapping.build(self._chain.devices)
+        self.devices = cast(List[Device], self._devices_mapping.all)
         self.notify_observers()
 
     def disconnect(self):
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Dict, Tuple
 
 from protocol0.domain.lom.device_parameter.DeviceParameterEnum import DeviceParameterEnum
 from protocol0.domain.lom.device_parameter.DeviceParameterValue import DeviceParameterValue
@@ -110,85 +110,35 @@ class DeviceEnum(AbstractEnum):
     @property
     def browser_name(self):
         # type: () -> str
-        try:
-            return self.get_value_from_mapping(
-                {
-                    DeviceEnum.EXTERNAL_AUDIO_EFFECT: "External Audio Effect",
-                    DeviceEnum.EXTERNAL_INSTRUMENT: "External Instrument",
-                }
-            )
-        except Protocol0Error:
-            if self.is_device_preset:
-                return "%s.adv" % self.value
-            elif self.is_rack_preset:
-                return "%s.adg" % self.value
-            else:
-                return self.value
+        if self in _BROWSER_NAMES:
+            return _BROWSER_NAMES[self]
+        elif self.is_device_preset:
+            return "%s.adv" % self.value
+        elif self.is_rack_preset:
+            return "%s.adg" % self.value
+        else:
+            return self.value
 
     @property
     def class_name(self):
         # type: () -> str
-        try:
-            return self.get_value_from_mapping(
-                {
-                    DeviceEnum.AUDIO_EFFECT_RACK: "AudioEffectGroupDevice",
-                    DeviceEnum.AUTO_FILTER: "AutoFilter",
-                    DeviceEnum.EQ_EIGHT: "Eq8",
-                    DeviceEnum.EXTERNAL_AUDIO_EFFECT: "ProxyAudioEffectDevice",
-                    DeviceEnum.EXTERNAL_INSTRUMENT: "ProxyInstrumentDevice",
-                    DeviceEnum.INSTRUMENT_RACK: "InstrumentGroupDevice",
-                    DeviceEnum.PITCH: "MidiPitcher",
-                }
-            )
-        except Protocol0Error:
-            return self.value
+        return _CLASS_NAMES.get(self, self.value)
 
     @property
     def main_parameters_default(self):
-        # type: () -> List[DeviceParameterValue]
-        return self.get_value_from_mapping(
-            {
-                DeviceEnum.COMPRESSOR: [
-                    DeviceParameterValue(DeviceParameterEnum.COMPRESSOR_OUTPUT_GAIN, 0),
-                    DeviceParameterValue(
-                        DeviceParameterEnum.COMPRESSOR_THRESHOLD, Config.ZERO_VOLUME
-                    ),  # 0db
-                ],
-                DeviceEnum.EQ_EIGHT: [
-                    DeviceParameterValue(
-                        DeviceParameterEnum.EQ_EIGHT_FREQUENCY_1_A, 0.285494267941
-                    ),
-                    DeviceParameterValue(DeviceParameterEnum.EQ_EIGHT_GAIN_4_A, 0),
-                    DeviceParameterValue(DeviceParameterEnum.EQ_EIGHT_FREQUENCY_8_A, 1),
-                ],  # 90 Hz
-                DeviceEnum.LFO_TOOL: [
-                    DeviceParameterValue(DeviceParameterEnum.LFO_TOOL_LFO_DEPTH, 0),
-                ],
-                DeviceEnum.UTILITY: [
-                    DeviceParameterValue(DeviceParameterEnum.UTILITY_GAIN, 0),
-                    DeviceParameterValue(DeviceParameterEnum.UTILITY_MID_SIDE, 1),
-                ],
-            }
-        )
+        # type: () -> Tuple[DeviceParameterValue, ...]
+        return self.get_value_from_mapping(_MAIN_PARAMETERS_DEFAULT)
 
     @property
     def default_parameter(self):
         # type: () -> Optional[DeviceParameterEnum]
         """Represents the main parameter for a specific device. We want to make it easily accessible"""
-        try:
-            return self.get_value_from_mapping(
-                {
-                    DeviceEnum.AUTO_FILTER_HIGH_PASS: DeviceParameterEnum.AUTO_FILTER_HIGH_PASS_FREQUENCY,
-                    DeviceEnum.AUTO_FILTER_LOW_PASS: DeviceParameterEnum.AUTO_FILTER_LOW_PASS_FREQUENCY,
-                    DeviceEnum.AUTO_PAN: DeviceParameterEnum.AUTO_PAN_AMOUNT,
-                    DeviceEnum.LIMITER: DeviceParameterEnum.LIMITER_GAIN,
-                    DeviceEnum.LFO_TOOL: DeviceParameterEnum.LFO_TOOL_POINT_Y0,
-                    DeviceEnum.SATURATOR: DeviceParameterEnum.SATURATOR_DRIVE,
-                    DeviceEnum.UTILITY: DeviceParameterEnum.UTILITY_GAIN,
-                }
-            )
-        except Protocol0Error:
-            return None
+        return _DEFAULT_PARAMETERS.get(self)
+
+    @classmethod
+    def from_name(cls, name):
+        # type: (str) -> Optional[DeviceEnum]
+        return _DEVICE_ENUMS_BY_NAME.get(name)
 
     @classmethod
     def from_device_parameter(cls, device_parameter_enum):
@@ -246,57 +196,7 @@ class DeviceEnum(AbstractEnum):
         measured by loading multiple device instances (20) in an empty set and timing multiple times the set load
         very rough approximation of the performance impact of a device on the whole set
         """
-        try:
-            return self.get_value_from_mapping(
-                {
-                    DeviceEnum.ADDICTIVE_KEYS: 1263,
-                    DeviceEnum.API_2500: 95,
-                    DeviceEnum.AUDIO_EFFECT_RACK: 8,
-                    DeviceEnum.AUTO_FILTER: 7,
-                    DeviceEnum.BEAT_REPEAT: 7,
-                    DeviceEnum.COMPRESSOR: 11,
-                    DeviceEnum.DELAY: 10,
-                    DeviceEnum.EFFECTRIX: 133,
-                    DeviceEnum.ENIGMA: 0,
-                    DeviceEnum.EQ_EIGHT: 31,
-                    DeviceEnum.EQ_ROOM: 31,
-                    DeviceEnum.EXTERNAL_AUDIO_EFFECT: 5,
-                    DeviceEnum.EXTERNAL_INSTRUMENT: 20,
-                    DeviceEnum.FREE_CLIP: 40,
-                    DeviceEnum.KONTAKT: 1000,
-                    DeviceEnum.GATE: 7,
-                    DeviceEnum.GATEKEEPER: 130,
-                    DeviceEnum.GLUE_COMPRESSOR: 6,
-                    DeviceEnum.INSTRUMENT_RACK: 10,
-                    DeviceEnum.LFO_TOOL: 180,
-                    DeviceEnum.L1_LIMITER: 64,
-                    DeviceEnum.L1_ULTRAMAXIMIZER: 64,
-                    DeviceEnum.LIMITER: 5,
-                    DeviceEnum.PITCH: 2,
-                    DeviceEnum.PLAY: 214,
-                    DeviceEnum.PRO_Q_3: 53,
-                    DeviceEnum.REVERB: 9,
-                    DeviceEnum.REV2_EDITOR: 80,
-                    DeviceEnum.SATURATOR: 8,
-                    DeviceEnum.SATURN_2: 50,
-                    DeviceEnum.SERUM: 147,
-                    DeviceEnum.SIMPLER: 56,
-                    DeviceEnum.SOOTHE2: 206,
-                    DeviceEnum.SUPER_TAP_2: 45,
-                    DeviceEnum.SUPER_TAP_6: 45,
-                    DeviceEnum.SURFEREQ: 116,
-                    DeviceEnum.SSL_COMP: 81,
-                    DeviceEnum.SOUNDID_REFERENCE_PLUGIN: 0,
-                    DeviceEnum.TRACK_SPACER: 207,
-                    DeviceEnum.TRUE_VERB: 82,
-                    DeviceEnum.TUNER: 0,
-                    DeviceEnum.USAMO: 78,
-                    DeviceEnum.UTILITY: 4,
-                    DeviceEnum.VALHALLA_VINTAGE_VERB: 71,
-                }
-            )
-        except Protocol0Error:
-            return 0
+        return _LOAD_TIMES.get(self, 0)
 
     @property
     def is_instrument(self):
@@ -315,3 +215,99 @@ class DeviceEnum(AbstractEnum):
         # type: () -> List[str]
         """Plugins that I've used, but I don't currently have (formerly cracks)"""
         return ["Vocal Rider Stereo", "API-2500 Stereo", DeviceEnum.SATURN_2.value]
+
+
+# lookup tables, built once at import
+
+_DEVICE_ENUMS_BY_NAME = {
+    device_enum.value: device_enum for device_enum in DeviceEnum
+}  # type: Dict[str, DeviceEnum]
+
+_BROWSER_NAMES = {
+    DeviceEnum.EXTERNAL_AUDIO_EFFECT: "External Audio Effect",
+    DeviceEnum.EXTERNAL_INSTRUMENT: "External Instrument",
+}  # type: Dict[DeviceEnum, str]
+
+_CLASS_NAMES = {
+    DeviceEnum.AUDIO_EFFECT_RACK: "AudioEffectGroupDevice",
+    DeviceEnum.AUTO_FILTER: "AutoFilter",
+    DeviceEnum.EQ_EIGHT: "Eq8",
+    DeviceEnum.EXTERNAL_AUDIO_EFFECT: "ProxyAudioEffectDevice",
+    DeviceEnum.EXTERNAL_INSTRUMENT: "ProxyInstrumentDevice",
+    DeviceEnum.INSTRUMENT_RACK: "InstrumentGroupDevice",
+    DeviceEnum.PITCH: "MidiPitcher",
+}  # type: Dict[DeviceEnum, str]
+
+_MAIN_PARAMETERS_DEFAULT = {
+    DeviceEnum.COMPRESSOR: (
+        DeviceParameterValue(DeviceParameterEnum.COMPRESSOR_OUTPUT_GAIN, 0),
+        DeviceParameterValue(DeviceParameterEnum.COMPRESSOR_THRESHOLD, Config.ZERO_VOLUME),  # 0db
+    ),
+    DeviceEnum.EQ_EIGHT: (
+        DeviceParameterValue(DeviceParameterEnum.EQ_EIGHT_FREQUENCY_1_A, 0.285494267941),
+        DeviceParameterValue(DeviceParameterEnum.EQ_EIGHT_GAIN_4_A, 0),
+        DeviceParameterValue(DeviceParameterEnum.EQ_EIGHT_FREQUENCY_8_A, 1),
+    ),  # 90 Hz
+    DeviceEnum.LFO_TOOL: (DeviceParameterValue(DeviceParameterEnum.LFO_TOOL_LFO_DEPTH, 0),),
+    DeviceEnum.UTILITY: (
+        DeviceParameterValue(DeviceParameterEnum.UTILITY_GAIN, 0),
+        DeviceParameterValue(DeviceParameterEnum.UTILITY_MID_SIDE, 1),
+    ),
+}  # type: Dict[DeviceEnum, Tuple[DeviceParameterValue, ...]]
+
+_DEFAULT_PARAMETERS = {
+    DeviceEnum.AUTO_FILTER_HIGH_PASS: DeviceParameterEnum.AUTO_FILTER_HIGH_PASS_FREQUENCY,
+    DeviceEnum.AUTO_FILTER_LOW_PASS: DeviceParameterEnum.AUTO_FILTER_LOW_PASS_FREQUENCY,
+    DeviceEnum.AUTO_PAN: DeviceParameterEnum.AUTO_PAN_AMOUNT,
+    DeviceEnum.LIMITER: DeviceParameterEnum.LIMITER_GAIN,
+    DeviceEnum.LFO_TOOL: DeviceParameterEnum.LFO_TOOL_POINT_Y0,
+    DeviceEnum.SATURATOR: DeviceParameterEnum.SATURATOR_DRIVE,
+    DeviceEnum.UTILITY: DeviceParameterEnum.UTILITY_GAIN,
+}  # type: Dict[DeviceEnum, DeviceParameterEnum]
+
+_LOAD_TIMES = {
+    DeviceEnum.ADDICTIVE_KEYS: 1263,
+    DeviceEnum.API_2500: 95,
+    DeviceEnum.AUDIO_EFFECT_RACK: 8,
+    DeviceEnum.AUTO_FILTER: 7,
+    DeviceEnum.BEAT_REPEAT: 7,
+    DeviceEnum.COMPRESSOR: 11,
+    DeviceEnum.DELAY: 10,
+    DeviceEnum.EFFECTRIX: 133,
+    DeviceEnum.ENIGMA: 0,
+    DeviceEnum.EQ_EIGHT: 31,
+    DeviceEnum.EQ_ROOM: 31,
+    DeviceEnum.EXTERNAL_AUDIO_EFFECT: 5,
+    DeviceEnum.EXTERNAL_INSTRUMENT: 20,
+    DeviceEnum.FREE_CLIP: 40,
+    DeviceEnum.KONTAKT: 1000,
+    DeviceEnum.GATE: 7,
+    DeviceEnum.GATEKEEPER: 130,
+    DeviceEnum.GLUE_COMPRESSOR: 6,
+    DeviceEnum.INSTRUMENT_RACK: 10,
+    DeviceEnum.LFO_TOOL: 180,
+    DeviceEnum.L1_LIMITER: 64,
+    DeviceEnum.L1_ULTRAMAXIMIZER: 64,
+    DeviceEnum.LIMITER: 5,
+    DeviceEnum.PITCH: 2,
+    DeviceEnum.PLAY: 214,
+    DeviceEnum.PRO_Q_3: 53,
+    DeviceEnum.REVERB: 9,
+    DeviceEnum.REV2_EDITOR: 80,
+    DeviceEnum.SATURATOR: 8,
+    DeviceEnum.SATURN_2: 50,
+    DeviceEnum.SERUM: 147,
+    DeviceEnum.SIMPLER: 56,
+    DeviceEnum.SOOTHE2: 206,
+    DeviceEnum.SUPER_TAP_2: 45,
+    DeviceEnum.SUPER_TAP_6: 45,
+    DeviceEnum.SURFEREQ: 116,
+    DeviceEnum.SSL_COMP: 81,
+    DeviceEnum.SOUNDID_REFERENCE_PLUGIN: 0,
+    DeviceEnum.TRACK_SPACER: 207,
+    DeviceEnum.TRUE_VERB: 82,
+    DeviceEnum.TUNER: 0,
+    DeviceEnum.USAMO: 78,
+    DeviceEnum.UTILITY: 4,
+    DeviceEnum.VALHALLA_VINTAGE_VERB: 71,
+}  # type: Dict[DeviceEnum, int]
@@ -1,22 +1,36 @@
 import Live
+from _Framework.SubjectSlot import subject_slot
 from typing import List, Any, Optional, cast
 
 from protocol0.domain.lom.device.Device import Device
+from protocol0.shared.observer.Observable import Observable
 
 
-class PluginDevice(Device):
+class PluginDevice(Device, Observable):
     def __init__(self, *a, **k):
         # type: (Any, Any) -> None
         super(PluginDevice, self).__init__(*a, **k)
         self._device = cast(
             Live.PluginDevice.PluginDevice, self._device
         )  # type: Live.PluginDevice.PluginDevice
+        self._presets_listener.subject = self._device
+
+    @subject_slot("presets")
+    def _presets_listener(self):
+        # type: () -> None
+        self.notify_observers()
 
     @property
     def presets(self):
         # type: () -> List[str]
         return [str(preset) for preset in list(self._device.presets) if not str(preset) == "empty"]
 
+    @property
+    def preset_count(self):
+        # type: () -> int
+        """Cheaper than converting the presets"""
+        return len(self._device.presets)
+
     @property
     def selected_preset_index(self):
         # type: () -> int
@@ -33,6 +33,8 @@ class RackDevice(Device, Observable):
         for chain in self.chains:
             chain.register_observer(self)
 
+        self.notify_observers()
+
     @property
     def selected_chain(self):
         # type: () -> Optional[DeviceChain]
@@ -1,8 +1,9 @@
 from itertools import chain
 
 import Live
+from _Framework.CompoundElement import subject_slot_group
 from _Framework.SubjectSlot import subject_slot, SlotManager
-from typing import List, Optional, Iterator, cast
+from typing import List, Optional, Iterator, cast, Dict
 
 from protocol0.domain.lom.device.Device import Device
 from protocol0.domain.lom.device.DeviceEnum import DeviceEnum
@@ -10,7 +11,6 @@ from protocol0.domain.lom.device.MixerDevice import MixerDevice
 from protocol0.domain.lom.device.RackDevice import RackDevice
 from protocol0.domain.lom.device_parameter.DeviceParameter import DeviceParameter
 from protocol0.domain.shared.LiveObjectMapping import LiveObjectMapping
-from protocol0.domain.shared.errors.Protocol0Error import Protocol0Error
 from protocol0.domain.shared.errors.Protocol0Warning import Protocol0Warning
 from protocol0.domain.shared.utils.list import find_if
 from protocol0.shared.observer.Observable import Observable
@@ -23,8 +23,10 @@ class SimpleTrackDevices(SlotManager, Observable):
         self._track = live_track
         self._devices = []  # type: List[Device]
         self._all_devices = []  # type: List[Device]
+        # enum -> devices, dropped when the devices change or a device is renamed
+        self._devices_by_enum = None  # type: Optional[Dict[DeviceEnum, List[Device]]]
         self._devices_listener.subject = live_track
-        self._devices_mapping = LiveObjectMapping(Device.make)
+        self._devices_mapping = LiveObjectMapping(Device.make, on_removed=lambda d: d.disconnect())
         self.mixer_device = MixerDevice(live_track.mixer_device)
 
     def __repr__(self):
@@ -38,7 +40,9 @@ class SimpleTrackDevices(SlotManager, Observable):
     def update(self, observable):
         # type: (Observable) -> None
         if isinstance(observable, RackDevice):
-            self.build()
+            # a rack chain changed : the chain did rebuild its devices, top level devices are kept
+            self._map_all_devices()
+            self.notify_observers()
 
     def build(self):
         # type: () -> None
@@ -47,17 +51,26 @@ class SimpleTrackDevices(SlotManager, Observable):
     @subject_slot("devices")
     def _devices_listener(self):
         # type: () -> None
-        for device in self._devices:
-            device.disconnect()
-
         self._devices_mapping.build(self._track.devices)
         self._devices = cast(List[Device], self._devices_mapping.all)
+        self._map_all_devices()
+
+        self.notify_observers()
+
+    def _map_all_devices(self):
+        # type: () -> None
         self._all_devices = self._find_all_devices(self._devices)
+        self._devices_by_enum = None
+        self._device_name_listener.replace_subjects([d._device for d in self._all_devices])
         for device in self._all_devices:
             if isinstance(device, RackDevice):
                 device.register_observer(self)
 
-        self.notify_observers()
+    @subject_slot_group("name")
+    def _device_name_listener(self, _):
+        # type: (Live.Device.Device) -> None
+        # the enum depends on the device name
+        self._devices_by_enum = None
 
     @property
     def all(self):
@@ -83,21 +96,27 @@ class SimpleTrackDevices(SlotManager, Observable):
         else:
             return None
 
+    def _get_devices_by_enum(self):
+        # type: () -> Dict[DeviceEnum, List[Device]]
+        if self._devices_by_enum is None:
+            devices_by_enum = {}  # type: Dict[DeviceEnum, List[Device]]
+            for device in self._all_devices:
+                device_enum = DeviceEnum.from_name(device.name)
+                if device_enum is not None:
+                    devices_by_enum.setdefault(device_enum, []).append(device)
+
+            self._devices_by_enum = devices_by_enum
+
+        return self._devices_by_enum
+
     def get_one_from_enum(self, device_enum):
         # type: (DeviceEnum) -> Optional[Device]
-        return find_if(lambda d: d.enum == device_enum, self._all_devices)
+        devices = self._get_devices_by_enum().get(device_enum)
+        return devices[0] if devices else None
 
     def get_from_enum(self, device_enum):
         # type: (DeviceEnum) -> List[Device]
-        devices = []
-        for d in self._all_devices:
-            try:
-                if d.enum == device_enum:
-                    devices.append(d)
-            except Protocol0Error:
-                continue
-
-        return devices
+        return list(self._get_devices_by_enum().get(device_enum, []))
 
     def _find_all_devices(self, devices, only_visible=False):
         # type: (Optional[List[Device]], bool) -> List[Device]
@@ -13,14 +13,8 @@ class DeviceParameter(object):
         self._device_parameter = device_parameter  # type: Live.DeviceParameter.DeviceParameter
         self._is_mixer_parameter = is_mixer_parameter
         self.device_name = ""
-
-        try:
-            if enum is not None:
-                self._default_value = enum.default_value
-            else:
-                self._default_value = device_parameter.default_value
-        except (RuntimeError, AttributeError):
-            self._default_value = 0
+        self._enum = enum
+        self._default_value = None  # type: Optional[float]
 
     def __repr__(self, **k):
         # type: (Any) -> str
@@ -34,6 +28,21 @@ class DeviceParameter(object):
         param.device_name = device_name
         return param
 
+    @property
+    def default_value(self):
+        # type: () -> float
+        """Read on first use"""
+        if self._default_value is None:
+            try:
+                if self._enum is not None:
+                    self._default_value = self._enum.default_value
+                else:
+                    self._default_value = self._device_parameter.default_value
+            except (RuntimeError, AttributeError):
+                self._default_value = 0
+
+        return self._default_value
+
     @property
     def name(self):
         # type: () -> str
@@ -169,7 +178,7 @@ class DeviceParameter(object):
         else:
 
             try:
-                self.value = self._default_value
+                self.value = self.default_value
             except RuntimeError as e:
-                Logger.error((e, self, self.device_name, self.min, self.max, self._default_value))
+                Logger.error((e, self, self.device_name, self.min, self.max, self.default_value))
                 raise e
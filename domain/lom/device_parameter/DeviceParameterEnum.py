@@ -1,6 +1,5 @@
-from typing import List, Optional, Any, TYPE_CHECKING
+from typing import List, Optional, Any, TYPE_CHECKING, Dict
 
-from protocol0.domain.shared.errors.Protocol0Error import Protocol0Error
 from protocol0.shared.AbstractEnum import AbstractEnum
 
 if TYPE_CHECKING:
@@ -31,38 +30,12 @@ class DeviceParameterEnum(AbstractEnum):
     @property
     def parameter_name(self):
         # type: () -> str
-        return self.get_value_from_mapping(
-            {
-                DeviceParameterEnum.AUTO_FILTER_HIGH_PASS_FREQUENCY: "Frequency",
-                DeviceParameterEnum.AUTO_FILTER_LOW_PASS_FREQUENCY: "Frequency",
-                DeviceParameterEnum.AUTO_PAN_AMOUNT: "Amount",
-                DeviceParameterEnum.CHAIN_SELECTOR: "Chain Selector",
-                DeviceParameterEnum.COMPRESSOR_OUTPUT_GAIN: "Output Gain",
-                DeviceParameterEnum.COMPRESSOR_THRESHOLD: "Threshold",
-                DeviceParameterEnum.DEVICE_ON: "Device On",
-                DeviceParameterEnum.EQ_EIGHT_FREQUENCY_1_A: "1 Frequency A",
-                DeviceParameterEnum.EQ_EIGHT_GAIN_4_A: "4 Gain A",
-                DeviceParameterEnum.EQ_EIGHT_FREQUENCY_8_A: "8 Frequency A",
-                DeviceParameterEnum.LFO_TOOL_POINT_Y0: "Point Y0",
-                DeviceParameterEnum.LIMITER_GAIN: "Gain",
-                DeviceParameterEnum.SATURATOR_DRIVE: "Drive",
-                DeviceParameterEnum.SATURATOR_OUTPUT: "Output",
-                DeviceParameterEnum.UTILITY_GAIN: "Gain",
-                DeviceParameterEnum.UTILITY_SILENT_GAIN: "Gain",
-                DeviceParameterEnum.UTILITY_MID_SIDE: "Mid/Side Balance",
-            }
-        )
+        return self.get_value_from_mapping(_PARAMETER_NAMES)
 
     @property
     def label(self):
         # type: () -> str
-        return self.get_value_from_mapping(
-            {
-                DeviceParameterEnum.AUTO_FILTER_LOW_PASS_FREQUENCY: "Low Pass Frequency",
-                DeviceParameterEnum.UTILITY_GAIN: "Gain",
-                DeviceParameterEnum.AUTO_FILTER_HIGH_PASS_FREQUENCY: "High Pass Frequency",
-            }
-        )
+        return self.get_value_from_mapping(_LABELS)
 
     @property
     def device_enum(self):
@@ -87,20 +60,49 @@ class DeviceParameterEnum(AbstractEnum):
     @classmethod
     def from_name(cls, device_name, name):
         # type: (str, str) -> Optional[DeviceParameterEnum]
-        enum_name = "%s %s" % (device_name.upper(), name.upper())
-        try:
-            return DeviceParameterEnum.from_value(enum_name)
-        except Protocol0Error:
-            return None
+        return _PARAMETER_ENUMS_BY_NAME.get("%s %s" % (device_name.upper(), name.upper()))
 
     @property
     def default_value(self):
         # type: () -> Any
-        return self.get_value_from_mapping(
-            {
-                DeviceParameterEnum.AUTO_FILTER_HIGH_PASS_FREQUENCY: 20,
-                DeviceParameterEnum.AUTO_FILTER_LOW_PASS_FREQUENCY: 135,
-                DeviceParameterEnum.EFFECTRIX_GLOBALWET: 0,
-                DeviceParameterEnum.UTILITY_SILENT_GAIN: -1,
-            }
-        )
+        return self.get_value_from_mapping(_DEFAULT_VALUES)
+
+
+# lookup tables, built once at import
+
+_PARAMETER_ENUMS_BY_NAME = {
+    parameter_enum.value: parameter_enum for parameter_enum in DeviceParameterEnum
+}  # type: Dict[str, DeviceParameterEnum]
+
+_PARAMETER_NAMES = {
+    DeviceParameterEnum.AUTO_FILTER_HIGH_PASS_FREQUENCY: "Frequency",
+    DeviceParameterEnum.AUTO_FILTER_LOW_PASS_FREQUENCY: "Frequency",
+    DeviceParameterEnum.AUTO_PAN_AMOUNT: "Amount",
+    DeviceParameterEnum.CHAIN_SELECTOR: "Chain Selector",
+    DeviceParameterEnum.COMPRESSOR_OUTPUT_GAIN: "Output Gain",
+    DeviceParameterEnum.COMPRESSOR_THRESHOLD: "Threshold",
+    DeviceParameterEnum.DEVICE_ON: "Device On",
+    DeviceParameterEnum.EQ_EIGHT_FREQUENCY_1_A: "1 Frequency A",
+    DeviceParameterEnum.EQ_EIGHT_GAIN_4_A: "4 Gain A",
+    DeviceParameterEnum.EQ_EIGHT_FREQUENCY_8_A: "8 Frequency A",
+    DeviceParameterEnum.LFO_TOOL_POINT_Y0: "Point Y0",
+    DeviceParameterEnum.LIMITER_GAIN: "Gain",
+    DeviceParameterEnum.SATURATOR_DRIVE: "Drive",
+    DeviceParameterEnum.SATURATOR_OUTPUT: "Output",
+    DeviceParameterEnum.UTILITY_GAIN: "Gain",
+    DeviceParameterEnum.UTILITY_SILENT_GAIN: "Gain",
+    DeviceParameterEnum.UTILITY_MID_SIDE: "Mid/Side Balance",
+}  # type: Dict[DeviceParameterEnum, str]
+
+_LABELS = {
+    DeviceParameterEnum.AUTO_FILTER_LOW_PASS_FREQUENCY: "Low Pass Frequency",
+    DeviceParameterEnum.UTILITY_GAIN: "Gain",
+    DeviceParameterEnum.AUTO_FILTER_HIGH_PASS_FREQUENCY: "High Pass Frequency",
+}  # type: Dict[DeviceParameterEnum, str]
+
+_DEFAULT_VALUES = {
+    DeviceParameterEnum.AUTO_FILTER_HIGH_PASS_FREQUENCY: 20,
+    DeviceParameterEnum.AUTO_FILTER_LOW_PASS_FREQUENCY: 135,
+    DeviceParameterEnum.EFFECTRIX_GLOBALWET: 0,
+    DeviceParameterEnum.UTILITY_SILENT_GAIN: -1,
+}  # type: Dict[DeviceParameterEnum, Any]
@@ -0,0 +1,191 @@
+import json
+import os
+import time
+
+from typing import Dict, List, Tuple, Iterator, Any, Optional, Callable
+
+from protocol0.shared.logging.Logger import Logger
+
+
+class DirectoryIndex(object):
+    """
+    Persistent listing of a directory tree (e.g. the sample library), stored at its root.
+
+    A directory is listed again only when its mtime changed : a refresh stats each directory
+    but doesn't list unchanged ones. Sub directories of an indexed tree share its index.
+    """
+
+    FILENAME = "_preset_index.json"
+    _VERSION = 1
+    # a directory modified this close to its listing could have changed in the same mtime tick
+    _RACY_DELAY = 2
+    # py2 lists byte string names, which json only accepts as utf-8 (sample names can be cp1252)
+    # they are stored as latin-1 text, which maps each byte to a character
+    _BYTE_NAMES = str is bytes
+
+    _INDEXES = {}  # type: Dict[str, DirectoryIndex]
+
+    def __init__(self, root):
+        # type: (str) -> None
+        self._root = root
+        # relative path -> [mtime, listed at, directory names, file names]
+        self._entries = None  # type: Optional[Dict[str, List[Any]]]
+        self._changed = False
+
+    def __repr__(self):
+        # type: () -> str
+        return "DirectoryIndex(%s)" % self._root
+
+    @classmethod
+    def for_path(cls, path):
+        # type: (str) -> DirectoryIndex
+        """The outermost index containing path, or a new index rooted at path"""
+        candidates = [path]
+        parent = os.path.dirname(path)
+        while parent and parent != candidates[-1]:
+            candidates.append(parent)
+            parent = os.path.dirname(parent)
+
+        for candidate in reversed(candidates):
+            if candidate in cls._INDEXES:
+                return cls._INDEXES[candidate]
+            if os.path.isfile(os.path.join(candidate, cls.FILENAME)):
+                break
+        else:
+            candidate = path
+
+        if candidate not in cls._INDEXES:
+            cls._INDEXES[candidate] = DirectoryIndex(candidate)
+        return cls._INDEXES[candidate]
+
+    @classmethod
+    def reset(cls):
+        # type: () -> None
+        cls._INDEXES = {}
+
+    @property
+    def _index_path(self):
+        # type: () -> str
+        return os.path.join(self._root, self.FILENAME)
+
+    def walk(self, path=None):
+        # type: (Optional[str]) -> Iterator[Tuple[str, List[str], List[str]]]
+        """Same as a top down os.walk, refreshing the changed directories"""
+        path = path or self._root
+        entries = self._load()
+        prefix = self._relative_path(path)
+        visited = set()
+
+        stack = [path]
+        while stack:
+            current_path = stack.pop()
+            relative_path = self._relative_path(current_path)
+            visited.add(relative_path)
+            entry = self._get_entry(current_path, relative_path)
+            if entry is None:
+                continue
+
+            dir_names, file_names = list(entry[2]), list(entry[3])
+            yield current_path, dir_names, file_names
+            # like os.walk, dir_names can be pruned by the caller
+            stack.extend(os.path.join(current_path, name) for name in reversed(dir_names))
+
+        # forget the deleted directories
+        for relative_path in list(entries.keys()):
+            if relative_path not in visited and self._is_in(relative_path, prefix):
+                del entries[relative_path]
+                self._changed = True
+
+        self._save()
+
+    def _get_entry(self, path, relative_path):
+        # type: (str, str) -> Optional[List[Any]]
+        entries = self._load()
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            entries.pop(relative_path, None)
+            return None
+
+        entry = entries.get(relative_path)
+        if entry is not None and entry[0] == mtime and mtime < entry[1] - self._RACY_DELAY:
+            return entry
+
+        dir_names = []
+        file_names = []
+        try:
+            names = os.listdir(path)
+        except OSError:
+            return None
+        for name in names:
+            if os.path.isdir(os.path.join(path, name)):
+                dir_names.append(name)
+            elif name != self.FILENAME:
+                file_names.append(name)
+
+        entry = [mtime, time.time(), dir_names, file_names]
+        entries[relative_path] = entry
+        self._changed = True
+        return entry
+
+    def _relative_path(self, path):
+        # type: (str) -> str
+        return os.path.relpath(path, self._root)
+
+    def _is_in(self, relative_path, prefix):
+        # type: (str, str) -> bool
+        return (
+            prefix == os.curdir
+            or relative_path == prefix
+            or relative_path.startswith(prefix + os.sep)
+        )
+
+    def _load(self):
+        # type: () -> Dict[str, List[Any]]
+        if self._entries is not None:
+            return self._entries
+
+        entries = {}  # type: Dict[str, List[Any]]
+        try:
+            with open(self._index_path) as f:
+                data = json.load(f)
+            if data.get("version") == self._VERSION:
+                entries = data["entries"]
+                if self._BYTE_NAMES:
+                    entries = self._map_names(entries, lambda name: name.encode("latin-1"))
+        except (IOError, OSError, ValueError, KeyError, UnicodeError):
+            pass
+
+        self._entries = entries
+        return entries
+
+    def _save(self):
+        # type: () -> None
+        if not self._changed:
+            return
+        self._changed = False
+
+        entries = self._entries or {}
+        try:
+            if self._BYTE_NAMES:
+                entries = self._map_names(entries, lambda name: name.decode("latin-1"))
+            # serialized before opening the file, so that an error doesn't truncate it
+            data = json.dumps({"version": self._VERSION, "entries": entries})
+            with open(self._index_path, "w") as f:
+                f.write(data)
+        except (IOError, OSError, ValueError, UnicodeError) as e:
+            # the index is only an optimization
+            Logger.warning("Couldn't save %s: %s" % (self, e))
+
+    @classmethod
+    def _map_names(cls, entries, convert):
+        # type: (Dict[Any, List[Any]], Callable[[Any], Any]) -> Dict[Any, List[Any]]
+        return {
+            convert(path): [
+                mtime,
+                listed_at,
+                [convert(name) for name in dir_names],
+                [convert(name) for name in file_names],
+            ]
+            for path, (mtime, listed_at, dir_names, file_names) in entries.items()
+        }
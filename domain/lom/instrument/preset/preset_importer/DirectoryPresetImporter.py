@@ -1,8 +1,7 @@
-import os
-
-from typing import List, Optional
+from typing import List, Optional, Hashable
 
 from protocol0.domain.lom.instrument.preset.InstrumentPreset import InstrumentPreset
+from protocol0.domain.lom.instrument.preset.preset_importer.DirectoryIndex import DirectoryIndex
 from protocol0.domain.lom.instrument.preset.preset_importer.PresetImportInterface import (
     PresetImportInterface,
 )
@@ -17,12 +16,17 @@ class DirectoryPresetImporter(PresetImportInterface):
         else:
             self._extensions = [".wav", ".aif"]
 
+    def _get_cache_key(self):
+        # type: () -> Optional[Hashable]
+        # nested changes don't show in the directory mtime : refreshed with use_cache=False
+        return "directory", self._path, tuple(self._extensions)
+
     def _import_presets(self):
         # type: () -> List[InstrumentPreset]
         presets = []  # type: List[InstrumentPreset]
         has_categories = False
 
-        for root, dir_names, files in os.walk(self._path):
+        for root, dir_names, files in DirectoryIndex.for_path(self._path).walk(self._path):
             if len(dir_names):
                 has_categories = True
 
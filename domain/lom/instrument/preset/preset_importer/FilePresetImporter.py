@@ -1,4 +1,6 @@
-from typing import List
+import os
+
+from typing import List, Optional, Hashable
 
 from protocol0.domain.lom.instrument.preset.InstrumentPreset import InstrumentPreset
 from protocol0.domain.lom.instrument.preset.preset_importer.PresetImportInterface import (
@@ -11,6 +13,13 @@ class FilePresetImporter(PresetImportInterface):
         # type: (str) -> None
         self._path = path
 
+    def _get_cache_key(self):
+        # type: () -> Optional[Hashable]
+        try:
+            return "file", self._path, os.path.getmtime(self._path)
+        except OSError:
+            return None
+
     def _import_presets(self):
         # type: () -> List[InstrumentPreset]
         return [
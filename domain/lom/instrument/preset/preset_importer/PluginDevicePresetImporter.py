@@ -1,16 +1,34 @@
-from typing import List
+from typing import List, Optional, Hashable
 
 from protocol0.domain.lom.device.PluginDevice import PluginDevice
 from protocol0.domain.lom.instrument.preset.InstrumentPreset import InstrumentPreset
 from protocol0.domain.lom.instrument.preset.preset_importer.PresetImportInterface import (
     PresetImportInterface,
 )
+from protocol0.shared.observer.Observable import Observable
 
 
 class PluginDevicePresetImporter(PresetImportInterface):
     def __init__(self, device):
         # type: (PluginDevice) -> None
         self._device = device
+        device.register_observer(self)
+
+    def update(self, observable):
+        # type: (Observable) -> None
+        if isinstance(observable, PluginDevice):
+            self.invalidate_cache()
+
+    def _get_cache_key(self):
+        # type: () -> Optional[Hashable]
+        # Live can reuse the pointer of a deleted device
+        return (
+            "plugin",
+            self._device.live_id,
+            self._device.class_name,
+            self._device.name,
+            self._device.preset_count,
+        )
 
     def _import_presets(self):
         # type: () -> List[InstrumentPreset]
@@ -0,0 +1,66 @@
+from collections import OrderedDict
+
+from typing import Dict, List, Hashable
+
+from protocol0.domain.lom.instrument.preset.InstrumentPreset import InstrumentPreset
+
+
+class PresetCache(object):
+    """Imported presets, by importer cache key. Least recently used entries are evicted"""
+
+    MAX_SIZE = 64
+
+    # typing.OrderedDict is not in the py2 typing module
+    _PRESETS = OrderedDict()  # type: OrderedDict[Hashable, List[InstrumentPreset]]
+    _HITS = 0
+    _MISSES = 0
+    _EVICTIONS = 0
+
+    @classmethod
+    def get(cls, key):
+        # type: (Hashable) -> List[InstrumentPreset]
+        """Raises KeyError on miss"""
+        try:
+            presets = cls._PRESETS.pop(key)
+        except KeyError:
+            cls._MISSES += 1
+            raise
+
+        cls._HITS += 1
+        cls._PRESETS[key] = presets
+        return presets
+
+    @classmethod
+    def set(cls, key, presets):
+        # type: (Hashable, List[InstrumentPreset]) -> None
+        cls._PRESETS.pop(key, None)
+        cls._PRESETS[key] = presets
+        while len(cls._PRESETS) > cls.MAX_SIZE:
+            cls._PRESETS.popitem(last=False)
+            cls._EVICTIONS += 1
+
+    @classmethod
+    def invalidate(cls, key):
+        # type: (Hashable) -> None
+        cls._PRESETS.pop(key, None)
+
+    @classmethod
+    def clear(cls):
+        # type: () -> None
+        cls._PRESETS.clear()
+
+    @classmethod
+    def get_stats(cls):
+        # type: () -> Dict[str, int]
+        return {
+            "size": len(cls._PRESETS),
+            "hits": cls._HITS,
+            "misses": cls._MISSES,
+            "evictions": cls._EVICTIONS,
+        }
+
+    @classmethod
+    def reset(cls):
+        # type: () -> None
+        cls.clear()
+        cls._HITS = cls._MISSES = cls._EVICTIONS = 0
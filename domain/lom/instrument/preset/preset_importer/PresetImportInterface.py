@@ -1,21 +1,39 @@
-from typing import List, Dict
+from typing import List, Optional, Hashable
 
 from protocol0.domain.lom.instrument.preset.InstrumentPreset import InstrumentPreset
+from protocol0.domain.lom.instrument.preset.preset_importer.PresetCache import PresetCache
 
 
 class PresetImportInterface(object):
-    _PRESET_CACHE = {}  # type: Dict[str, List[InstrumentPreset]]
+    # the key of the last import, the device keys change with the presets
+    _cache_key = None  # type: Optional[Hashable]
 
     def import_presets(self, use_cache=True):
         # type: (bool) -> List[InstrumentPreset]
-        cache_key = getattr(self, "_path", None)
-        if use_cache and cache_key is not None and cache_key in self._PRESET_CACHE:
-            return self._PRESET_CACHE[cache_key]
-        else:
-            presets = self._import_presets()
-            if cache_key is not None:
-                self._PRESET_CACHE[cache_key] = presets
-            return presets
+        cache_key = self._get_cache_key()
+        self._cache_key = cache_key
+        if use_cache and cache_key is not None:
+            try:
+                return PresetCache.get(cache_key)
+            except KeyError:
+                pass
+
+        presets = self._import_presets()
+        if cache_key is not None:
+            PresetCache.set(cache_key, presets)
+        return presets
+
+    def invalidate_cache(self):
+        # type: () -> None
+        cache_key = self._cache_key if self._cache_key is not None else self._get_cache_key()
+        self._cache_key = None
+        if cache_key is not None:
+            PresetCache.invalidate(cache_key)
+
+    def _get_cache_key(self):
+        # type: () -> Optional[Hashable]
+        """Changes when the presets change, None when the presets cannot be cached"""
+        return None
 
     def _import_presets(self):
         # type: () -> List[InstrumentPreset]
@@ -1,16 +1,27 @@
-from typing import List
+from typing import List, Optional, Hashable
 
 from protocol0.domain.lom.device.RackDevice import RackDevice
 from protocol0.domain.lom.instrument.preset.InstrumentPreset import InstrumentPreset
 from protocol0.domain.lom.instrument.preset.preset_importer.PresetImportInterface import (
     PresetImportInterface,
 )
+from protocol0.shared.observer.Observable import Observable
 
 
 class RackDevicePresetImporter(PresetImportInterface):
     def __init__(self, device):
         # type: (RackDevice) -> None
         self._device = device
+        device.register_observer(self)
+
+    def update(self, observable):
+        # type: (Observable) -> None
+        if isinstance(observable, RackDevice):
+            self.invalidate_cache()
+
+    def _get_cache_key(self):
+        # type: () -> Optional[Hashable]
+        return "rack", self._device.live_id, tuple(chain.name for chain in self._device.chains)
 
     def _import_presets(self):
         # type: () -> List[InstrumentPreset]
@@ -1,21 +1,47 @@
-from typing import Any, Tuple
+from typing import Any, Tuple, Iterable, List
 
 from protocol0.domain.shared.errors.Protocol0Error import Protocol0Error
 from protocol0.domain.shared.utils.utils import clamp
 
+# the format of Live.Clip.Clip.get_notes and replace_selected_notes
+LiveNote = Tuple[int, float, float, int, bool]
+# a row of NoteBuffer : float velocity, int mute. Live notes are valid rows
+NoteRow = Tuple[int, float, float, float, int]
+
 
 class Note(object):
+    """Attributes are validated when set so that reads are plain attribute lookups"""
+
+    __slots__ = ("_pitch", "_start", "_duration", "_velocity", "_muted")
+
     MIN_DURATION = 1 / 128
 
     def __init__(self, pitch=127, start=0, duration=1, velocity=127, muted=False):
         # type: (int, float, float, int, bool) -> None
         super(Note, self).__init__()
-        self._pitch = int(pitch)
-        self._start = start
-        self._duration = duration
-        self._velocity = int(velocity)  # type: float
+        self._pitch = int(clamp(int(pitch), 0, 127))
+        self._start = 0 if start < 0 else start
+        self._duration = max(duration, Note.MIN_DURATION)
+        self._velocity = clamp(int(velocity), 0, 127)  # type: float
         self._muted = muted
 
+    @classmethod
+    def from_live_notes(cls, live_notes):
+        # type: (Iterable[NoteRow]) -> List[Note]
+        """Bulk conversion of notes coming from Live, already valid : skips the checks"""
+        notes = []
+        new_note = object.__new__
+        for pitch, start, duration, velocity, muted in live_notes:
+            note = new_note(cls)
+            note._pitch = pitch
+            note._start = start
+            note._duration = duration
+            note._velocity = velocity
+            note._muted = bool(muted)
+            notes.append(note)
+
+        return notes
+
     def __eq__(self, other):
         # type: (object) -> bool
         return (
@@ -36,10 +62,6 @@ class Note(object):
             self.muted,
         )
 
-    def to_data(self):
-        # type: () -> Tuple[int, float, float, int, bool]
-        return self.pitch, self.start, self.duration, int(self.velocity), self.muted
-
     def _is_value_equal(self, val1, val2, delta=0.00001):
         # type: (float, float, float) -> bool
         return abs(val1 - val2) < delta
@@ -47,7 +69,7 @@ class Note(object):
     @property
     def pitch(self):
         # type: () -> int
-        return int(clamp(self._pitch, 0, 127))
+        return self._pitch
 
     @pitch.setter
     def pitch(self, pitch):
@@ -57,7 +79,7 @@ class Note(object):
     @property
     def start(self):
         # type: () -> float
-        return 0 if self._start < 0 else self._start
+        return self._start
 
     @start.setter
     def start(self, start):
@@ -77,24 +99,18 @@ class Note(object):
     @property
     def duration(self):
         # type: () -> float
-        if self._duration <= Note.MIN_DURATION:
-            return Note.MIN_DURATION
         return self._duration
 
     @duration.setter
     def duration(self, duration):
         # type: (int) -> None
-        self._duration = max(0, duration)
-        if self._duration == 0:
+        if duration <= 0:
             raise Protocol0Error("A Note with a duration of 0 is not accepted")
+        self._duration = max(duration, Note.MIN_DURATION)
 
     @property
     def velocity(self):
         # type: () -> float  # using float to make scaling precise
-        if self._velocity < 0:
-            return 0
-        if self._velocity > 127:
-            return 127
         return self._velocity
 
     @velocity.setter
@@ -0,0 +1,110 @@
+from array import array
+from operator import itemgetter
+
+from typing import List, Iterable, Tuple
+
+from protocol0.domain.lom.note.Note import Note, LiveNote, NoteRow
+from protocol0.domain.shared.utils.utils import clamp
+
+
+class NoteBuffer(object):
+    """
+    Clip notes stored as parallel arrays (one per note attribute), sorted by start.
+    Transforms are done in a single pass over the arrays,
+    Note objects are only created on demand
+    """
+
+    __slots__ = ("pitches", "starts", "durations", "velocities", "mutes")
+
+    def __init__(self):
+        # type: () -> None
+        self.pitches = array("B")
+        self.starts = array("d")
+        self.durations = array("d")
+        # float velocities make scaling precise
+        self.velocities = array("d")
+        self.mutes = array("B")
+
+    def __len__(self):
+        # type: () -> int
+        return len(self.pitches)
+
+    def __repr__(self):
+        # type: () -> str
+        return "NoteBuffer(%s notes)" % len(self)
+
+    @classmethod
+    def from_live_notes(cls, live_notes):
+        # type: (Iterable[LiveNote]) -> NoteBuffer
+        """From the tuples returned by Live.Clip.Clip.get_notes"""
+        buffer = cls()
+        for pitch, start, duration, velocity, muted in sorted(live_notes, key=itemgetter(1)):
+            buffer.pitches.append(pitch)
+            buffer.starts.append(start)
+            buffer.durations.append(duration)
+            buffer.velocities.append(velocity)
+            buffer.mutes.append(muted)
+
+        return buffer
+
+    @classmethod
+    def from_notes(cls, notes):
+        # type: (Iterable[Note]) -> NoteBuffer
+        buffer = cls()
+        for note in sorted(notes, key=lambda n: n.start):
+            buffer.pitches.append(note.pitch)
+            buffer.starts.append(note.start)
+            buffer.durations.append(note.duration)
+            buffer.velocities.append(note.velocity)
+            buffer.mutes.append(note.muted)
+
+        return buffer
+
+    def to_notes(self):
+        # type: () -> List[Note]
+        return Note.from_live_notes(self.rows())
+
+    def to_live_notes(self):
+        # type: () -> Tuple[LiveNote, ...]
+        """To the tuples expected by Live.Clip.Clip.replace_selected_notes"""
+        return tuple(
+            (pitch, start, duration, int(velocity), bool(muted))
+            for pitch, start, duration, velocity, muted in self.rows()
+        )
+
+    def rows(self):
+        # type: () -> List[NoteRow]
+        return zip(self.pitches, self.starts, self.durations, self.velocities, self.mutes)
+
+    def hash(self):
+        # type: () -> int
+        return hash(self.to_live_notes())
+
+    def has_note_at(self, start):
+        # type: (float) -> bool
+        return start in self.starts
+
+    def scale_velocities(self, go_next, scaling_factor):
+        # type: (bool, int) -> None
+        """Spreads (go_next) or compresses the velocities around their average"""
+        if len(self) == 0:
+            return
+
+        velocities = self.velocities
+        average_velocity = sum(velocities) / len(velocities)
+        for index, velocity in enumerate(velocities):
+            velocity_diff = velocity - average_velocity
+            if go_next:
+                velocity += velocity_diff / (scaling_factor - 1)
+            else:
+                velocity -= velocity_diff / scaling_factor
+            velocities[index] = clamp(velocity, 0, 127)
+
+    def to_mono(self):
+        # type: () -> None
+        """If notes overlap : make end of each note match the start of the next one"""
+        starts = self.starts
+        durations = self.durations
+        for index in range(len(self) - 1):
+            start = starts[index]
+            durations[index] = max(start + durations[index], starts[index + 1]) - start
@@ -0,0 +1,77 @@
+from typing import Dict, Tuple, Optional
+
+from protocol0.domain.lom.note.NoteBuffer import NoteBuffer
+
+NoteKey = Tuple[int, int, int, int]
+
+
+class NoteVelocityCache(object):
+    """
+    Float velocities of the last notes set on a clip (Live rounds them to int).
+    Notes are keyed by their quantized (pitch, start, duration, muted)
+    so that fetched notes are matched in constant time.
+    Positions closer than GRID can be quantized to neighbouring buckets : these are checked too
+    """
+
+    __slots__ = ("_velocities",)
+
+    # positions closer than this are considered equal
+    GRID = 0.00001
+    # bounds the memory used by each clip, the remaining notes keep their int velocity
+    MAX_SIZE = 4096
+
+    def __init__(self):
+        # type: () -> None
+        # key -> start, duration, velocity
+        self._velocities = {}  # type: Dict[NoteKey, Tuple[float, float, float]]
+
+    def __len__(self):
+        # type: () -> int
+        return len(self._velocities)
+
+    @classmethod
+    def _key(cls, pitch, start, duration, muted):
+        # type: (int, float, float, int) -> NoteKey
+        return pitch, int(round(start / cls.GRID)), int(round(duration / cls.GRID)), int(muted)
+
+    def set(self, buffer):
+        # type: (NoteBuffer) -> None
+        velocities = {}  # type: Dict[NoteKey, Tuple[float, float, float]]
+        for pitch, start, duration, velocity, muted in buffer.rows():
+            if len(velocities) == self.MAX_SIZE:
+                break
+            # like a scan of the notes, the first matching note wins
+            velocities.setdefault(
+                self._key(pitch, start, duration, muted), (start, duration, velocity)
+            )
+
+        self._velocities = velocities
+
+    def _get(self, pitch, start, duration, muted):
+        # type: (int, float, float, int) -> Optional[float]
+        _, start_key, duration_key, muted_key = self._key(pitch, start, duration, muted)
+        for start_offset in (0, -1, 1):
+            for duration_offset in (0, -1, 1):
+                cached = self._velocities.get(
+                    (pitch, start_key + start_offset, duration_key + duration_offset, muted_key)
+                )
+                if (
+                    cached is not None
+                    and abs(cached[0] - start) < self.GRID
+                    and abs(cached[1] - duration) < self.GRID
+                ):
+                    return cached[2]
+
+        return None
+
+    def apply(self, buffer):
+        # type: (NoteBuffer) -> None
+        """Restores the cached float velocities on the fetched notes"""
+        if not self._velocities:
+            return
+
+        velocities = buffer.velocities
+        for index, (pitch, start, duration, _, muted) in enumerate(buffer.rows()):
+            velocity = self._get(pitch, start, duration, muted)
+            if velocity is not None:
+                velocities[index] = velocity
@@ -12,6 +12,7 @@ from protocol0.domain.lom.scene.SceneCropScroller import SceneCropScroller
 from protocol0.domain.lom.scene.SceneFiredEvent import SceneFiredEvent
 from protocol0.domain.lom.scene.SceneLength import SceneLength
 from protocol0.domain.lom.scene.SceneName import SceneName
+from protocol0.domain.lom.scene.ScenePlaybackGraph import ScenePlaybackGraph
 from protocol0.domain.lom.scene.ScenePlayingState import ScenePlayingState
 from protocol0.domain.lom.scene.ScenePositionScroller import ScenePositionScroller
 from protocol0.domain.lom.track.abstract_track.AbstractTrack import AbstractTrack
@@ -19,6 +20,7 @@ from protocol0.domain.lom.track.group_track.AbstractGroupTrack import AbstractGr
 from protocol0.domain.lom.track.group_track.external_synth_track.ExternalSynthTrack import (
     ExternalSynthTrack,
 )
+from protocol0.domain.lom.track.simple_track.SimpleTrack import SimpleTrack
 from protocol0.domain.shared.ApplicationViewFacade import ApplicationViewFacade
 from protocol0.domain.shared.ValueScroller import ValueScroller
 from protocol0.domain.shared.event.DomainEventBus import DomainEventBus
@@ -41,7 +43,7 @@ class Scene(SlotManager):
         self.live_id = self._scene._live_ptr  # type: int
 
         self.clips = SceneClips(self.index)
-        self._scene_length = SceneLength(self.clips, self.index)
+        self._scene_length = SceneLength(self.clips)
         self.playing_state = ScenePlayingState(self.clips, self._scene_length)
         self.scene_name = SceneName(live_scene, self._scene_length, self.playing_state)
         self.appearance = SceneAppearance(live_scene, self.scene_name)
@@ -75,10 +77,20 @@ class Scene(SlotManager):
         if isinstance(observable, SceneClips):
             self.appearance.refresh()
 
+    def reindex(self, index):
+        # type: (int) -> None
+        """The clip slots are reindexed by the tracks"""
+        self.index = index
+        self.clips.index = index
+
     def on_tracks_change(self):
         # type: () -> None
         self.clips.build()
 
+    def on_tracks_remapped(self, tracks, removed_tracks):
+        # type: (List[SimpleTrack], List[SimpleTrack]) -> None
+        self.clips.update_tracks(tracks, removed_tracks)
+
     def on_added(self):
         # type: () -> None
         self.clips.on_added_scene()
@@ -87,35 +99,17 @@ class Scene(SlotManager):
     @property
     def next_scene(self):
         # type: () -> Scene
-        if self.should_loop:
-            return self
-        else:
-            next_scene = SongFacade.scenes()[self.index + 1]
-            if next_scene.skipped:
-                return next_scene.next_scene
-            else:
-                return next_scene
+        return ScenePlaybackGraph.next_scene(self)
 
     @property
     def should_loop(self):
         # type: () -> bool
-        return (
-            self == SongFacade.looping_scene()
-            or self == SongFacade.scenes()[-1]
-            or SongFacade.scenes()[self.index + 1].bar_length == 0
-        )
+        return ScenePlaybackGraph.should_loop(self)
 
     @property
     def previous_scene(self):
         # type: () -> Scene
-        if self == SongFacade.scenes()[0]:
-            return self
-        else:
-            previous_scene = SongFacade.scenes()[self.index - 1]
-            if previous_scene.skipped:
-                return previous_scene.previous_scene
-            else:
-                return previous_scene
+        return ScenePlaybackGraph.previous_scene(self)
 
     @property
     def is_triggered(self):
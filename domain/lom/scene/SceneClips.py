@@ -6,6 +6,8 @@ from protocol0.domain.lom.clip.AudioTailClip import AudioTailClip
 from protocol0.domain.lom.clip.Clip import Clip
 from protocol0.domain.lom.clip.ClipColorEnum import ClipColorEnum
 from protocol0.domain.lom.clip_slot.ClipSlot import ClipSlot
+from protocol0.domain.lom.clip_slot.ClipSlotGrid import ClipSlotGrid
+from protocol0.domain.lom.scene.ScenePlaybackGraph import ScenePlaybackGraph
 from protocol0.domain.lom.track.simple_track.InstrumentBusTrack import InstrumentBusTrack
 from protocol0.domain.lom.track.simple_track.ResamplingTrack import ResamplingTrack
 from protocol0.domain.lom.track.simple_track.SimpleAudioExtTrack import SimpleAudioExtTrack
@@ -38,6 +40,8 @@ class SceneClips(Observable):
         self.index = index
         self._clip_tracks = []  # type: List[SceneClip]
         self._clips = []  # type: List[Clip]
+        # incremented on any clip change, before the (debounced) rebuild
+        self.version = 0
 
         self.build()
 
@@ -64,28 +68,58 @@ class SceneClips(Observable):
         # type: () -> List[SimpleTrack]
         return [scene_clip.track for scene_clip in self._clip_tracks]
 
-    @debounce(duration=50)
     def update(self, observable):
         # type: (Observable) -> None
         if isinstance(observable, ClipSlot) or isinstance(observable, Clip):
-            self.build()
-            self.notify_observers()
+            self.version += 1
+            ScenePlaybackGraph.invalidate()
+            self._rebuild()
+
+    @debounce(duration=50)
+    def _rebuild(self):
+        # type: () -> None
+        self.build()
+        self.notify_observers()
 
     def build(self):
         # type: () -> None
         self._clip_tracks = []
 
         for track in SongFacade.simple_tracks():
-            clip_slot = track.clip_slots[self.index]
-            clip_slot.register_observer(self)
-            clip = clip_slot.clip
-            if (
-                clip is not None
-                and clip_slot.has_clip
-                and type(track) not in (InstrumentBusTrack, ResamplingTrack)
-            ):
-                self._clip_tracks.append(SceneClip(track, clip))
+            self._add_track(track)
 
+        self._map_clips()
+
+    def update_tracks(self, tracks, removed_tracks):
+        # type: (List[SimpleTrack], List[SimpleTrack]) -> None
+        """Only remaps the clips of the given (added / moved) tracks"""
+        changed_tracks = set(tracks + removed_tracks)
+        self._clip_tracks = [
+            scene_clip for scene_clip in self._clip_tracks if scene_clip.track not in changed_tracks
+        ]
+
+        for track in tracks:
+            self._add_track(track)
+
+        self._clip_tracks.sort(key=lambda scene_clip: scene_clip.track.index)
+        self._map_clips()
+
+    def _add_track(self, track):
+        # type: (SimpleTrack) -> None
+        clip_slot = ClipSlotGrid.get(track, self.index)
+        clip_slot.register_observer(self)
+        clip = clip_slot.clip
+        if (
+            clip is not None
+            and clip_slot.has_clip
+            and type(track) not in (InstrumentBusTrack, ResamplingTrack)
+        ):
+            self._clip_tracks.append(SceneClip(track, clip))
+
+    def _map_clips(self):
+        # type: () -> None
+        self.version += 1
+        ScenePlaybackGraph.invalidate()
         self._clips = [
             scene_clip.clip for scene_clip in self._clip_tracks if scene_clip.is_main_clip
         ]
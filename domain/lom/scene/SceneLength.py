@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Tuple, Dict
 
 from protocol0.domain.lom.clip.Clip import Clip
 from protocol0.domain.lom.clip.DummyClip import DummyClip
@@ -8,19 +8,48 @@ from protocol0.shared.logging.Logger import Logger
 
 
 class SceneLength(object):
-    def __init__(self, clips, scene_index):
-        # type: (SceneClips, int) -> None
+    # cache counters, shared by all scenes
+    CACHE_HITS = 0
+    CACHE_MISSES = 0
+
+    def __init__(self, clips):
+        # type: (SceneClips) -> None
         self._clips = clips
-        self._scene_index = scene_index
+        # the length and longest clip are computed again when the clips change
+        self._cache_key = None  # type: Optional[Tuple[int, int]]
+        self._length = 0.0
+        self._longest_clip = None  # type: Optional[Clip]
 
     def __repr__(self):
         # type: () -> str
-        return "SceneLength(index=%s, length=%f)" % (self._scene_index, self.length)
+        return "SceneLength(index=%s, length=%f)" % (self._clips.index, self.length)
+
+    @classmethod
+    def get_cache_stats(cls):
+        # type: () -> Dict[str, int]
+        return {"hits": cls.CACHE_HITS, "misses": cls.CACHE_MISSES}
+
+    def _refresh(self):
+        # type: () -> None
+        cache_key = (self._clips.version, SongFacade.signature_numerator())
+        if cache_key == self._cache_key:
+            SceneLength.CACHE_HITS += 1
+            return
+
+        SceneLength.CACHE_MISSES += 1
+        self._cache_key = cache_key
+        self._longest_clip = self._get_longest_clip()
+        self._length = self._get_length()
 
     @property
     def length(self):
         # type: () -> float
-        clip_length = self.longest_clip.loop.full_loop_length if self.longest_clip else 0.0
+        self._refresh()
+        return self._length
+
+    def _get_length(self):
+        # type: () -> float
+        clip_length = self._longest_clip.loop.full_loop_length if self._longest_clip else 0.0
         numerator = SongFacade.signature_numerator()
 
         if clip_length % numerator != 0:
@@ -43,6 +72,11 @@ class SceneLength(object):
 
     @property
     def longest_clip(self):
+        # type: () -> Optional[Clip]
+        self._refresh()
+        return self._longest_clip
+
+    def _get_longest_clip(self):
         # type: () -> Optional[Clip]
         """
             We take any clip except
@@ -6,6 +6,7 @@ from _Framework.SubjectSlot import subject_slot, SlotManager
 from typing import Optional
 
 from protocol0.domain.lom.scene.SceneLength import SceneLength
+from protocol0.domain.lom.scene.ScenePlaybackGraph import ScenePlaybackGraph
 from protocol0.domain.lom.scene.ScenePlayingState import ScenePlayingState
 from protocol0.domain.shared.errors.Protocol0Error import Protocol0Error
 from protocol0.domain.shared.scheduler.Scheduler import Scheduler
@@ -32,6 +33,7 @@ class SceneName(SlotManager):
     @subject_slot("name")
     def _name_listener(self):
         # type: () -> None
+        ScenePlaybackGraph.invalidate()
         if time.time() >= self._last_updated_at + 0.1:
             Scheduler.defer(self.update)
 
@@ -0,0 +1,128 @@
+from typing import List, Optional, TYPE_CHECKING
+
+from protocol0.shared.SongFacade import SongFacade
+
+if TYPE_CHECKING:
+    from protocol0.domain.lom.scene.Scene import Scene
+
+
+class ScenePlaybackGraph(object):
+    """
+    Scene playback order (next, previous and last scene, song length).
+
+    Computed again only when the scenes, their names or lengths,
+    the looping scene or the signature change
+    """
+
+    _DIRTY = True
+    _SCENES = []  # type: List[Scene]
+    _LOOPING_SCENE = None  # type: Optional[Scene]
+    _SIGNATURE_NUMERATOR = 4
+
+    # scene index -> scene index
+    _NEXT_INDEXES = []  # type: List[int]
+    _PREVIOUS_INDEXES = []  # type: List[int]
+    # scene indexes played from the first scene up to the last one
+    _PLAYED_INDEXES = []  # type: List[int]
+    _BAR_LENGTH = 0
+    _LENGTH = 0.0
+
+    @classmethod
+    def invalidate(cls):
+        # type: () -> None
+        cls._DIRTY = True
+
+    @classmethod
+    def _refresh(cls):
+        # type: () -> None
+        if (
+            cls._DIRTY
+            or cls._LOOPING_SCENE is not SongFacade.looping_scene()
+            or cls._SIGNATURE_NUMERATOR != SongFacade.signature_numerator()
+        ):
+            cls._build()
+
+    @classmethod
+    def _build(cls):
+        # type: () -> None
+        cls._DIRTY = False
+        cls._SCENES = scenes = list(SongFacade.scenes())
+        cls._LOOPING_SCENE = looping_scene = SongFacade.looping_scene()
+        cls._SIGNATURE_NUMERATOR = SongFacade.signature_numerator()
+
+        scene_count = len(scenes)
+        skipped = [scene.skipped for scene in scenes]
+        bar_lengths = [scene.bar_length for scene in scenes]
+
+        next_indexes = [0] * scene_count
+        for index in reversed(range(scene_count)):
+            if (
+                scenes[index] is looping_scene
+                or index == scene_count - 1
+                or bar_lengths[index + 1] == 0
+            ):
+                next_indexes[index] = index
+            elif skipped[index + 1]:
+                next_indexes[index] = next_indexes[index + 1]
+            else:
+                next_indexes[index] = index + 1
+
+        previous_indexes = [0] * scene_count
+        for index in range(1, scene_count):
+            if skipped[index - 1]:
+                previous_indexes[index] = previous_indexes[index - 1]
+            else:
+                previous_indexes[index] = index - 1
+
+        played_indexes = [0] if scene_count else []
+        while played_indexes and next_indexes[played_indexes[-1]] != played_indexes[-1]:
+            played_indexes.append(next_indexes[played_indexes[-1]])
+
+        cls._NEXT_INDEXES = next_indexes
+        cls._PREVIOUS_INDEXES = previous_indexes
+        cls._PLAYED_INDEXES = played_indexes
+        cls._BAR_LENGTH = sum(bar_lengths[index] for index in played_indexes)
+        cls._LENGTH = sum(scenes[index].length for index in played_indexes)
+
+    @classmethod
+    def should_loop(cls, scene):
+        # type: (Scene) -> bool
+        cls._refresh()
+        return cls._NEXT_INDEXES[scene.index] == scene.index
+
+    @classmethod
+    def next_scene(cls, scene):
+        # type: (Scene) -> Scene
+        cls._refresh()
+        return cls._SCENES[cls._NEXT_INDEXES[scene.index]]
+
+    @classmethod
+    def previous_scene(cls, scene):
+        # type: (Scene) -> Scene
+        cls._refresh()
+        return cls._SCENES[cls._PREVIOUS_INDEXES[scene.index]]
+
+    @classmethod
+    def last_scene(cls):
+        # type: () -> Scene
+        cls._refresh()
+        return cls._SCENES[cls._PLAYED_INDEXES[-1]]
+
+    @classmethod
+    def played_scene_count(cls):
+        # type: () -> int
+        cls._refresh()
+        return len(cls._PLAYED_INDEXES)
+
+    @classmethod
+    def bar_length(cls):
+        # type: () -> int
+        """bar length of the song, from the first scene up to the last one"""
+        cls._refresh()
+        return cls._BAR_LENGTH
+
+    @classmethod
+    def length(cls):
+        # type: () -> float
+        cls._refresh()
+        return cls._LENGTH
@@ -3,12 +3,13 @@ from functools import partial
 from itertools import chain
 
 import Live
-from typing import List, Iterator, Dict
+from typing import List, Iterator, Dict, Optional
 
 from _Framework.SubjectSlot import subject_slot, SlotManager
 
 from protocol0.domain.lom.scene.PlayingSceneFacade import PlayingSceneFacade
 from protocol0.domain.lom.scene.Scene import Scene
+from protocol0.domain.lom.scene.ScenePlaybackGraph import ScenePlaybackGraph
 from protocol0.domain.lom.scene.ScenesMappedEvent import ScenesMappedEvent
 from protocol0.domain.lom.song.components.SceneCrudComponent import SceneCrudComponent
 from protocol0.domain.lom.track.TrackAddedEvent import TrackAddedEvent
@@ -25,6 +26,9 @@ from protocol0.shared.sequence.Sequence import Sequence
 
 
 class SceneService(SlotManager):
+    # validates each incremental remap against a full remap
+    _DEBUG = False
+
     def __init__(self, live_song, scene_crud_component):
         # type: (Live.Song.Song, SceneCrudComponent) -> None
         super(SceneService, self).__init__()
@@ -49,19 +53,32 @@ class SceneService(SlotManager):
     @property
     def last_scene(self):
         # type: () -> Scene
-        current_scene = self.scenes[0]
-        while current_scene.next_scene and current_scene.next_scene != current_scene:
-            current_scene = current_scene.next_scene
-
-        return current_scene
+        return ScenePlaybackGraph.last_scene()
 
     @subject_slot("scenes")
     @handle_error
     def scenes_listener(self):
         # type: () -> None
+        self._map_scenes(incremental=True)
+
+    def map_scenes(self):
+        # type: () -> None
+        """Full remap of the scenes"""
+        self._map_scenes(incremental=False)
+
+    def _map_scenes(self, incremental):
+        # type: (bool) -> None
         previous_live_scenes_ids = self._live_scene_id_to_scene.keys()
 
-        self._generate_scenes()
+        if incremental and len(previous_live_scenes_ids) != 0:
+            self._remap_scenes()
+            if self._DEBUG:
+                self._validate_scenes()
+        else:
+            self._generate_scenes()
+
+        ScenePlaybackGraph.invalidate()
+
         for scene in SongFacade.scenes():
             if len(previous_live_scenes_ids) and scene.live_id not in previous_live_scenes_ids:
                 Scheduler.defer(scene.on_added)
@@ -88,13 +105,7 @@ class SceneService(SlotManager):
             SongFacade.playing_scene()._scene if SongFacade.playing_scene() else None
         )
         self._clean_deleted_scenes()
-
-        # mapping cs should be done before generating the scenes
-        tracks = chain(
-            SongFacade.simple_tracks(), SongFacade.abstract_tracks()
-        )  # type: Iterator[AbstractTrack]
-        for track in collections.OrderedDict.fromkeys(tracks):
-            track.on_scenes_change()
+        self._map_tracks_clip_slots()
 
         live_scenes = self._live_song.scenes
 
@@ -109,6 +120,71 @@ class SceneService(SlotManager):
             playing_scene = find_if(lambda s: s._scene == playing_live_scene, SongFacade.scenes())
             PlayingSceneFacade.set(playing_scene)
 
+    def _remap_scenes(self):
+        # type: () -> None
+        """
+        Scenes are kept by live scene id : only deleted scenes are disconnected,
+        only added scenes are created and moved scenes are reindexed
+        """
+        live_scenes = list(self._live_song.scenes)
+        previous_indexes = {
+            scene_id: index for index, scene_id in enumerate(self._live_scene_id_to_scene.keys())
+        }
+        self._map_tracks_clip_slots(
+            [previous_indexes.get(live_scene._live_ptr) for live_scene in live_scenes]
+        )
+
+        live_scene_ids = set(live_scene._live_ptr for live_scene in live_scenes)
+
+        for scene_id in list(self._live_scene_id_to_scene.keys()):
+            if scene_id not in live_scene_ids:
+                scene = self._live_scene_id_to_scene.pop(scene_id)
+                scene.disconnect()
+                if scene == SongFacade.playing_scene():
+                    PlayingSceneFacade.set(None)
+
+        scenes = collections.OrderedDict()  # type: Dict[int, Scene]
+        for index, live_scene in enumerate(live_scenes):
+            existing_scene = self._live_scene_id_to_scene.get(live_scene._live_ptr, None)
+            if existing_scene is None:
+                scene = Scene(live_scene, index)
+            else:
+                scene = existing_scene
+                if scene.index != index:
+                    scene.reindex(index)
+
+            scenes[scene.live_id] = scene
+
+        self._live_scene_id_to_scene = scenes
+
+    def _validate_scenes(self):
+        # type: () -> None
+        """Compares the scenes with the ones a full remap would generate"""
+        assert len(self.scenes) == len(self._live_song.scenes), "Scene count mismatch"
+
+        for index, (live_scene, scene) in enumerate(zip(self._live_song.scenes, self.scenes)):
+            expected_scene = Scene(live_scene, index)
+            expected_scene.disconnect()
+
+            if (
+                scene.live_id != expected_scene.live_id
+                or scene.index != expected_scene.index
+                or scene.clips.all != expected_scene.clips.all
+            ):
+                Logger.error(
+                    "Incremental scene mapping mismatch: %s, expected %s"
+                    % (scene, expected_scene)
+                )
+
+    def _map_tracks_clip_slots(self, scene_indexes=None):
+        # type: (Optional[List[Optional[int]]]) -> None
+        """mapping cs should be done before generating the scenes"""
+        tracks = chain(
+            SongFacade.simple_tracks(), SongFacade.abstract_tracks()
+        )  # type: Iterator[AbstractTrack]
+        for track in collections.OrderedDict.fromkeys(tracks):
+            track.on_scenes_change(scene_indexes)
+
     def _clean_deleted_scenes(self):
         # type: () -> None
         """cleaning all scenes always"""
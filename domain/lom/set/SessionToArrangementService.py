@@ -3,8 +3,8 @@ from functools import partial
 from protocol0.application.CommandBus import CommandBus
 from protocol0.application.command.ResetPlaybackCommand import ResetPlaybackCommand
 from protocol0.domain.audit.SetFixerService import SetFixerService
-from protocol0.domain.audit.stats.SceneStats import SceneStats
 from protocol0.domain.lom.scene.SceneLastBarPassedEvent import SceneLastBarPassedEvent
+from protocol0.domain.lom.scene.ScenePlaybackGraph import ScenePlaybackGraph
 from protocol0.domain.lom.song.SongStoppedEvent import SongStoppedEvent
 from protocol0.domain.lom.song.components.PlaybackComponent import PlaybackComponent
 from protocol0.domain.lom.song.components.RecordingComponent import RecordingComponent
@@ -145,7 +145,7 @@ class SessionToArrangementService(object):
 
     def _validate_recording_duration(self):
         # type: () -> None
-        expected_bar_length = SceneStats().bar_length
+        expected_bar_length = ScenePlaybackGraph.bar_length()
 
         if expected_bar_length != self._recorded_bar_length:
             Backend.client().show_error(
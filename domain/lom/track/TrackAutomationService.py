@@ -85,6 +85,11 @@ class TrackAutomationService(object):
         """Scroll the automated parameters of the dummy clips"""
         current_track = SongFacade.current_track()
         index = SongFacade.selected_scene().index
+        # Live doesn't notify envelopes added to a clip that already has envelopes
+        for track in [current_track.base_track] + current_track.get_all_simple_sub_tracks():
+            if len(track.clip_slots) > index and track.clip_slots[index].clip is not None:
+                track.clip_slots[index].clip.automation.invalidate()
+
         automated_parameters = current_track.get_automated_parameters(index)
         if len(automated_parameters.items()) == 0:
             raise Protocol0Warning("No automated parameters")
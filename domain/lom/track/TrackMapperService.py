@@ -3,7 +3,7 @@ from functools import partial
 
 import Live
 from _Framework.SubjectSlot import subject_slot, SlotManager
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Set, Iterable
 
 from protocol0.domain.lom.track.TrackAddedEvent import TrackAddedEvent
 from protocol0.domain.lom.track.TrackFactory import TrackFactory
@@ -48,6 +48,8 @@ class TrackMapperService(SlotManager):
         self._vocals_track = None  # type: Optional[VocalsTrack]
         self._reference_track = None  # type: Optional[ReferenceTrack]
         self._master_track = None  # type: Optional[SimpleTrack]
+        # SimpleTracks replaced by another during the current mapping
+        self._replaced_tracks = []  # type: List[SimpleTrack]
 
         self.tracks_listener.subject = self._live_song
         DomainEventBus.subscribe(SimpleTrackCreatedEvent, self._on_simple_track_created_event)
@@ -56,16 +58,37 @@ class TrackMapperService(SlotManager):
     @handle_error
     def tracks_listener(self):
         # type: () -> None
-        self._clean_tracks()
+        self._map_tracks(incremental=True)
 
-        previous_simple_track_count = len(list(SongFacade.all_simple_tracks()))
-        has_added_tracks = 0 < previous_simple_track_count < len(list(SongFacade.live_tracks()))
+    def map_tracks(self):
+        # type: () -> None
+        """Full remap of the tracks, whatever changed"""
+        self._map_tracks(incremental=False)
+
+    def _map_tracks(self, incremental):
+        # type: (bool) -> None
+        live_track_ids = set(track._live_ptr for track in SongFacade.live_tracks())
+        removed_track_ids = [
+            track_id
+            for track_id in self._live_track_id_to_simple_track
+            if track_id not in live_track_ids
+        ]
+
+        previous_simple_track_count = len(self._live_track_id_to_simple_track) - len(
+            removed_track_ids
+        )
+        has_added_tracks = 0 < previous_simple_track_count < len(live_track_ids)
+        self._replaced_tracks = []
 
-        self._generate_simple_tracks()
-        self._generate_abstract_group_tracks()
+        if incremental and previous_simple_track_count != 0:
+            self._remap_tracks(removed_track_ids)
+        else:
+            self._remove_tracks(removed_track_ids)
+            self._generate_simple_tracks()
+            self._generate_abstract_group_tracks()
 
-        for scene in SongFacade.scenes():
-            scene.on_tracks_change()
+            for scene in SongFacade.scenes():
+                scene.on_tracks_change()
 
         Logger.info("mapped tracks")
 
@@ -79,22 +102,111 @@ class TrackMapperService(SlotManager):
 
         self._get_special_tracks()
 
-    def _clean_tracks(self):
-        # type: () -> None
-        existing_track_ids = [track._live_ptr for track in list(SongFacade.live_tracks())]
-        deleted_ids = []
+    def _remove_tracks(self, track_ids):
+        # type: (List[int]) -> None
+        for track_id in track_ids:
+            self._live_track_id_to_simple_track.pop(track_id).disconnect()
+
+    def _remap_tracks(self, removed_track_ids):
+        # type: (List[int]) -> None
+        """
+        Diff based remapping : only the top level tracks (and their nested tracks)
+        containing an added, removed or moved track are relinked,
+        and only their clips are remapped in scenes
+        """
+        live_tracks = list(self._live_song.tracks)
+        root_ids = self._get_root_track_ids(live_tracks)
+        affected_root_ids = set()  # type: Set[int]
+
+        removed_tracks = [
+            self._live_track_id_to_simple_track[track_id] for track_id in removed_track_ids
+        ]
+        for track in removed_tracks:
+            affected_root_ids.add(self._get_mapped_root_track_id(track))
+
+        moved_track_ids = self._get_moved_track_ids(live_tracks)
+        for live_track in live_tracks:
+            track_id = live_track._live_ptr
+            simple_track = self._live_track_id_to_simple_track.get(track_id, None)
+            if simple_track is None:
+                affected_root_ids.add(root_ids[track_id])
+                continue
 
-        for track_id, simple_track in self._live_track_id_to_simple_track.items():
-            if track_id not in existing_track_ids:
-                simple_track.disconnect()
-                deleted_ids.append(track_id)
+            group_track_id = live_track.group_track._live_ptr if live_track.group_track else None
+            previous_group_track_id = (
+                simple_track.group_track.live_id if simple_track.group_track else None
+            )
+            if track_id in moved_track_ids or group_track_id != previous_group_track_id:
+                affected_root_ids.add(self._get_mapped_root_track_id(simple_track))
+                affected_root_ids.add(root_ids[track_id])
 
-        for track_id in deleted_ids:
-            del self._live_track_id_to_simple_track[track_id]
+        track_ids = set(
+            track_id for track_id, root_id in root_ids.items() if root_id in affected_root_ids
+        )
 
-    def _generate_simple_tracks(self):
-        # type: () -> None
-        """instantiate SimpleTracks (including return / master, that are marked as inactive)"""
+        self._remove_tracks(removed_track_ids)
+        self._generate_simple_tracks(track_ids)
+        self._generate_abstract_group_tracks(track_ids)
+
+        if len(track_ids) == 0 and len(removed_tracks) == 0:
+            return
+
+        tracks = [track for track in SongFacade.simple_tracks() if track.live_id in track_ids]
+        removed_tracks += self._replaced_tracks
+        for scene in SongFacade.scenes():
+            scene.on_tracks_remapped(tracks, removed_tracks)
+
+    def _get_root_track_ids(self, live_tracks):
+        # type: (List[Live.Track.Track]) -> Dict[int, int]
+        """live track id -> id of its top level group track (or itself)"""
+        root_ids = {}  # type: Dict[int, int]
+        # group tracks always come before their sub tracks
+        for track in live_tracks:
+            if track.group_track is None:
+                root_ids[track._live_ptr] = track._live_ptr
+            else:
+                root_ids[track._live_ptr] = root_ids[track.group_track._live_ptr]
+
+        return root_ids
+
+    def _get_mapped_root_track_id(self, track):
+        # type: (SimpleTrack) -> int
+        """Same as above, from the current mapping"""
+        while track.group_track is not None:
+            track = track.group_track
+
+        return track.live_id
+
+    def _get_moved_track_ids(self, live_tracks):
+        # type: (List[Live.Track.Track]) -> Set[int]
+        """Kept tracks whose previous kept track changed"""
+        current_ids = [
+            track._live_ptr
+            for track in live_tracks
+            if track._live_ptr in self._live_track_id_to_simple_track
+        ]
+        current_id_set = set(current_ids)
+        previous_ids = [
+            track_id
+            for track_id in self._live_track_id_to_simple_track
+            if track_id in current_id_set
+        ]
+        if current_ids == previous_ids:
+            return set()
+
+        previous_track_ids = dict(zip(previous_ids[1:], previous_ids))
+        return set(
+            track_id
+            for previous_track_id, track_id in zip([None] + current_ids, current_ids)
+            if previous_track_ids.get(track_id, None) != previous_track_id
+        )
+
+    def _generate_simple_tracks(self, track_ids=None):
+        # type: (Optional[Set[int]]) -> None
+        """
+        instantiate SimpleTracks (including return / master, that are marked as inactive)
+        only the tracks in track_ids are relinked (all of them when None)
+        """
         self._prev_instrument_bus_track = self._instrument_bus_track
 
         # instantiate set tracks
@@ -110,9 +222,16 @@ class TrackMapperService(SlotManager):
 
         self._sort_simple_tracks()
 
-        for track in SongFacade.simple_tracks():
+        for track in self._filter_tracks(SongFacade.simple_tracks(), track_ids):
             track.on_tracks_change()
 
+    def _filter_tracks(self, tracks, track_ids):
+        # type: (Iterable[SimpleTrack], Optional[Set[int]]) -> Iterable[SimpleTrack]
+        if track_ids is None:
+            return tracks
+        else:
+            return (track for track in tracks if track.live_id in track_ids)
+
     def _get_special_tracks(self):
         # type: () -> None
         simple_tracks = list(SongFacade.simple_tracks())
@@ -174,6 +293,7 @@ class TrackMapperService(SlotManager):
         previous_simple_track = SongFacade.optional_simple_track_from_live_track(event.track._track)
         if previous_simple_track and previous_simple_track != event.track:
             self._replace_simple_track(previous_simple_track, event.track)
+            self._replaced_tracks.append(previous_simple_track)
 
         self._live_track_id_to_simple_track[event.track.live_id] = event.track
 
@@ -200,10 +320,10 @@ class TrackMapperService(SlotManager):
             sorted_dict[track._live_ptr] = SongFacade.simple_track_from_live_track(track)
         self._live_track_id_to_simple_track = sorted_dict
 
-    def _generate_abstract_group_tracks(self):
-        # type: () -> None
+    def _generate_abstract_group_tracks(self, track_ids=None):
+        # type: (Optional[Set[int]]) -> None
         # 2nd pass : instantiate AbstractGroupTracks
-        for track in SongFacade.simple_tracks():
+        for track in self._filter_tracks(SongFacade.simple_tracks(), track_ids):
             if not track.is_foldable:
                 continue
 
@@ -92,8 +92,9 @@ class AbstractTrack(SlotManager):
         # type: () -> None
         pass
 
-    def on_scenes_change(self):
-        # type: () -> None
+    def on_scenes_change(self, scene_indexes=None):
+        # type: (Optional[List[Optional[int]]]) -> None
+        """scene_indexes : the previous index of each scene, None for a full remap"""
         pass
 
     @property
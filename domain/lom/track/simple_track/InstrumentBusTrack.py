@@ -1,4 +1,4 @@
-from typing import Any, Optional
+from typing import Any, Optional, List
 
 from protocol0.domain.lom.clip_slot.AudioClipSlot import AudioClipSlot
 from protocol0.domain.lom.instrument.preset.SampleSelectedEvent import SampleSelectedEvent
@@ -35,11 +35,11 @@ class InstrumentBusTrack(SimpleAudioTrack):
         if len(self.clips):
             self.clips[0].muted = True
 
-    def on_scenes_change(self):
-        # type: () -> None
+    def on_scenes_change(self, scene_indexes=None):
+        # type: (Optional[List[Optional[int]]]) -> None
         """Don't copy the template dummy clip on duplicate scene"""
         has_template_dummy_clip = self.template_dummy_clip_slot is not None
-        super(InstrumentBusTrack, self).on_scenes_change()
+        super(InstrumentBusTrack, self).on_scenes_change(scene_indexes)
 
         if has_template_dummy_clip and self.template_dummy_clip_slot is None:
             self._load_dummy_clip()
@@ -1,6 +1,6 @@
 from functools import partial
 
-from typing import List, Any, cast, Optional
+from typing import List, Any, cast, Optional, Set
 
 from protocol0.domain.lom.clip.DummyClip import DummyClip
 from protocol0.domain.lom.clip_slot.DummyClipSlot import DummyClipSlot
@@ -42,7 +42,12 @@ class SimpleDummyTrack(SimpleAudioTrack):
         if isinstance(observable, SimpleTrackClipSlots):
             for clip in self.clips:
                 clip.has_automation = (
-                    len(clip.automation.get_automated_parameters(self.devices.parameters)) != 0
+                    len(
+                        clip.automation.get_automated_parameters(
+                            self.devices.parameters, use_cache=False
+                        )
+                    )
+                    != 0
                 )
 
     @classmethod
@@ -83,7 +88,9 @@ class SimpleDummyTrack(SimpleAudioTrack):
         This will set automation values to equal the clip start
         It is used to prevent automation glitches when a track starts playing after silence
         """
-        clip_parameters = dummy_clip.automation.get_automated_parameters(self.devices.parameters)
+        clip_parameters = dummy_clip.automation.get_automated_parameters(
+            self.devices.parameters, use_cache=False
+        )
 
         for parameter in clip_parameters:
             envelope = dummy_clip.automation.get_envelope(parameter)
@@ -94,14 +101,16 @@ class SimpleDummyTrack(SimpleAudioTrack):
     def get_stopping_automated_parameters(self, scene_index, next_scene_index):
         # type: (int, Optional[int]) -> List[DeviceParameter]
         dummy_clip = self.clip_slots[scene_index].clip
-        parameters = dummy_clip.automation.get_automated_parameters(self.devices.parameters)
+        parameters = dummy_clip.automation.get_automated_parameters(
+            self.devices.parameters, use_cache=False
+        )
 
         next_parameters = []  # type: List[DeviceParameter]
         if next_scene_index is not None:
             next_dummy_clip = self.clip_slots[next_scene_index].clip
             if next_dummy_clip is not None:
                 next_parameters = next_dummy_clip.automation.get_automated_parameters(
-                    self.devices.parameters
+                    self.devices.parameters, use_cache=False
                 )
 
         return list(set(parameters) - set(next_parameters))
@@ -126,9 +135,13 @@ class SimpleDummyTrack(SimpleAudioTrack):
     def reset_all_automated_parameters(self):
         # type: () -> None
         """Will reset all automated parameters in the track by checking all dummy clips"""
-        parameters = {}
+        parameters = set()  # type: Set[DeviceParameter]
         for dummy_clip in self.clips:
-            parameters.update(self.get_automated_parameters(dummy_clip.index))
+            parameters.update(
+                dummy_clip.automation.get_automated_parameters(
+                    self.devices.parameters, use_cache=False
+                )
+            )
 
         for parameter in parameters:
             parameter.reset()
@@ -1,6 +1,7 @@
+import collections
 from functools import partial
 
-from typing import List, cast, Any
+from typing import List, cast, Any, Optional, Dict, Tuple
 
 from protocol0.domain.lom.clip.MidiClip import MidiClip
 from protocol0.domain.lom.clip_slot.MidiClipSlot import MidiClipSlot
@@ -8,9 +9,11 @@ from protocol0.domain.lom.track.abstract_track.AbstractTrack import AbstractTrac
 from protocol0.domain.lom.track.simple_track.SimpleAudioTrack import SimpleAudioTrack
 from protocol0.domain.lom.track.simple_track.SimpleMidiMatchingTrack import SimpleMidiMatchingTrack
 from protocol0.domain.lom.track.simple_track.SimpleTrack import SimpleTrack
+from protocol0.domain.lom.track.simple_track.SimpleTrackClipSlots import SimpleTrackClipSlots
 from protocol0.domain.shared.backend.Backend import Backend
 from protocol0.domain.shared.errors.Protocol0Warning import Protocol0Warning
 from protocol0.shared.SongFacade import SongFacade
+from protocol0.shared.observer.Observable import Observable
 from protocol0.shared.sequence.Sequence import Sequence
 
 
@@ -22,6 +25,10 @@ class SimpleMidiTrack(SimpleTrack):
         super(SimpleMidiTrack, self).__init__(*a, **k)
         self.matching_track = SimpleMidiMatchingTrack(self)
         self.arm_state.register_observer(self.matching_track)
+        # clip hash -> clip slots and the clip hashes, rebuilt when one of the track clips changes
+        self._clip_slots_by_hash = {}  # type: Dict[int, List[MidiClipSlot]]
+        self._clip_hashes = []  # type: List[int]
+        self._clip_hashes_key = None  # type: Optional[Tuple]
 
     @property
     def clip_slots(self):
@@ -33,14 +40,50 @@ class SimpleMidiTrack(SimpleTrack):
         # type: () -> List[MidiClip]
         return super(SimpleMidiTrack, self).clips  # noqa
 
+    def update(self, observable):
+        # type: (Observable) -> None
+        if isinstance(observable, SimpleTrackClipSlots):
+            self._clip_hashes_key = None
+        super(SimpleMidiTrack, self).update(observable)
+
+    def on_scenes_change(self, scene_indexes=None):
+        # type: (Optional[List[Optional[int]]]) -> None
+        super(SimpleMidiTrack, self).on_scenes_change(scene_indexes)
+        self._clip_hashes_key = None
+
+    def _map_clip_hashes(self):
+        # type: () -> None
+        """Only the clips whose notes changed are hashed again"""
+        clip_slots = [cs for cs in self.clip_slots if cs.has_clip and cs.clip]
+        key = tuple((cs.clip, cs.clip.notes_version) for cs in clip_slots)
+        if key == self._clip_hashes_key:
+            return
+
+        index = collections.defaultdict(list)  # type: Dict[int, List[MidiClipSlot]]
+        clip_hashes = []
+        for clip_slot in clip_slots:
+            clip_hash = clip_slot.clip.hash
+            index[clip_hash].append(clip_slot)
+            clip_hashes.append(clip_hash)
+
+        self._clip_slots_by_hash = index
+        self._clip_hashes = clip_hashes
+        self._clip_hashes_key = key
+
+    def get_clip_slots_by_hash(self, clip_hash):
+        # type: (int) -> List[MidiClipSlot]
+        """clip slots having a clip with the same notes"""
+        self._map_clip_hashes()
+        return self._clip_slots_by_hash.get(clip_hash, [])
+
     def has_same_clips(self, track):
         # type: (AbstractTrack) -> bool
         if not isinstance(track, SimpleMidiTrack):
             return False
 
-        return len(self.clips) == len(track.clips) and all(
-            clip.matches(other_clip) for clip, other_clip in zip(self.clips, track.clips)
-        )
+        self._map_clip_hashes()
+        track._map_clip_hashes()
+        return self._clip_hashes == track._clip_hashes
 
     def duplicate_selected_clip(self):
         # type: () -> Sequence
@@ -50,7 +93,7 @@ class SimpleMidiTrack(SimpleTrack):
             raise Protocol0Warning("No selected clip")
 
         matching_clip_slots = [
-            c for c in self.clip_slots if c.clip and c.clip.matches(clip) and c.clip is not clip
+            c for c in self.get_clip_slots_by_hash(clip.hash) if c.clip is not clip
         ]
 
         Backend.client().show_info("Copying to %s clips" % len(matching_clip_slots))
@@ -2,7 +2,7 @@ from functools import partial
 
 import Live
 from _Framework.SubjectSlot import subject_slot
-from typing import cast, List, Optional, Dict
+from typing import cast, List, Optional, Dict, Tuple
 
 from protocol0.domain.lom.clip.Clip import Clip
 from protocol0.domain.lom.clip.ClipTail import ClipTail
@@ -54,6 +54,8 @@ class SimpleTrack(AbstractTrack):
 
         self._instrument = None  # type: Optional[InstrumentInterface]
         self._view = live_track.view
+        # scene index -> (clip, clip automation version, devices), automated parameters
+        self._automated_parameters_cache = {}  # type: Dict[int, Tuple[Tuple, Dict]]
 
         self._clip_slots = SimpleTrackClipSlots(live_track, self.CLIP_SLOT_CLASS)
         self._clip_slots.build()
@@ -78,9 +80,13 @@ class SimpleTrack(AbstractTrack):
         if self.is_foldable:
             self.sub_tracks[:] = []
 
-    def on_scenes_change(self):
-        # type: () -> None
-        self._clip_slots.build()
+    def on_scenes_change(self, scene_indexes=None):
+        # type: (Optional[List[Optional[int]]]) -> None
+        if scene_indexes is None:
+            self._clip_slots.build()
+        else:
+            self._clip_slots.remap(scene_indexes)
+        self._automated_parameters_cache.clear()
 
     def _link_to_group_track(self):
         # type: () -> None
@@ -104,6 +110,9 @@ class SimpleTrack(AbstractTrack):
 
     def update(self, observable):
         # type: (Observable) -> None
+        if isinstance(observable, (SimpleTrackClipSlots, SimpleTrackDevices)):
+            self._automated_parameters_cache.clear()
+
         if isinstance(observable, SimpleTrackDevices):
             # Refreshing is only really useful from simpler devices that change when a new sample is loaded
             if self.IS_ACTIVE and not self.is_foldable:
@@ -207,10 +216,18 @@ class SimpleTrack(AbstractTrack):
         if clip is None:
             return {}
 
-        return {
-            param: self
-            for param in clip.automation.get_automated_parameters(self.devices.parameters)
-        }
+        # the device parameters are only created on a cache miss
+        cache_key = (clip, clip.automation.version, tuple(self.devices.all))
+        cached = self._automated_parameters_cache.get(scene_index)
+        if cached is None or cached[0] != cache_key:
+            parameters = self.devices.parameters
+            automated_parameters = {
+                param: self for param in clip.automation.get_automated_parameters(parameters)
+            }
+            cached = (cache_key, automated_parameters)
+            self._automated_parameters_cache[scene_index] = cached
+
+        return dict(cached[1])
 
     def disconnect(self):
         # type: () -> None
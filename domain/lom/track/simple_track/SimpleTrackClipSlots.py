@@ -6,6 +6,7 @@ from typing import List, Type, Optional, Iterator
 from protocol0.domain.lom.clip.Clip import Clip
 from protocol0.domain.lom.clip.ClipConfig import ClipConfig
 from protocol0.domain.lom.clip_slot.ClipSlot import ClipSlot
+from protocol0.domain.lom.clip_slot.ClipSlotGrid import ClipSlotGrid
 from protocol0.domain.lom.instrument.InstrumentInterface import InstrumentInterface
 from protocol0.domain.lom.track.simple_track.SimpleTrackFirstClipAddedEvent import (
     SimpleTrackFirstClipAddedEvent,
@@ -88,12 +89,55 @@ class SimpleTrackClipSlots(SlotManager, Observable):
                 clip_slot.register_observer(self)
                 new_clip_slots.append(clip_slot)
         self._clip_slots[:] = new_clip_slots  # type: List[ClipSlot]
+        ClipSlotGrid.set_column(self._live_track._live_ptr, self._clip_slots)
 
         for cs in self._clip_slots:
             Scheduler.defer(cs.appearance.refresh)
 
         self._has_clip_listener.replace_subjects(self._live_track.clip_slots)
 
+    def remap(self, scene_indexes):
+        # type: (List[Optional[int]]) -> None
+        """
+        Incremental build, scene_indexes is the previous index of each scene (None if added)
+        Only moved clip slots are reindexed, added ones created and deleted ones disconnected
+        """
+        live_clip_slots = list(self._live_track.clip_slots)
+        previous_clip_slots = list(self._clip_slots)
+
+        # e.g. a track mapped after the scenes change : its clip slots are already up to date
+        if len(scene_indexes) != len(live_clip_slots) or any(
+            previous_index is not None
+            and (
+                previous_index >= len(previous_clip_slots)
+                or previous_clip_slots[previous_index]._clip_slot != live_clip_slot
+            )
+            for previous_index, live_clip_slot in zip(scene_indexes, live_clip_slots)
+        ):
+            self.build()
+            return
+
+        new_clip_slots = []  # type: List[ClipSlot]
+        for index, previous_index in enumerate(scene_indexes):
+            if previous_index is None:
+                clip_slot = self._clip_slot_class(live_clip_slots[index], index, self._clip_config)
+                clip_slot.register_observer(self)
+                Scheduler.defer(clip_slot.appearance.refresh)
+            else:
+                clip_slot = previous_clip_slots[previous_index]
+                if previous_index != index:
+                    clip_slot.index = index
+            new_clip_slots.append(clip_slot)
+
+        kept_indexes = set(scene_indexes)
+        for previous_index, clip_slot in enumerate(previous_clip_slots):
+            if previous_index not in kept_indexes:
+                clip_slot.disconnect()
+
+        self._clip_slots[:] = new_clip_slots
+        if len(new_clip_slots) != len(previous_clip_slots) or None in kept_indexes:
+            self._has_clip_listener.replace_subjects(live_clip_slots)
+
     def update(self, observable):
         # type: (Observable) -> None
         if isinstance(observable, ClipSlot):
@@ -113,5 +157,6 @@ class SimpleTrackClipSlots(SlotManager, Observable):
     def disconnect(self):
         # type: () -> None
         super(SimpleTrackClipSlots, self).disconnect()
+        ClipSlotGrid.remove_column(self._live_track._live_ptr, self._clip_slots)
         for clip_slot in self.clip_slots:
             clip_slot.disconnect()
@@ -15,7 +15,10 @@ class DummyClipValidator(AggregateValidator):
                 PropertyValueValidator(clip.loop, "looping", True),
                 CallbackValidator(
                     clip,
-                    lambda c: len(c.automation.get_automated_parameters(devices.parameters)) > 0,
+                    lambda c: len(
+                        c.automation.get_automated_parameters(devices.parameters, use_cache=False)
+                    )
+                    > 0,
                     lambda c: c.delete(),
                     "%s has no automation" % clip,
                 ),
@@ -1,17 +1,23 @@
-import collections
-
-from typing import Dict, Any, Callable, List
+from typing import Dict, Any, Callable, List, Optional
 
 from protocol0.domain.shared.LiveObject import LiveObject
 from protocol0.shared.types import T
 
 
 class LiveObjectMapping(object):
-    def __init__(self, factory):
-        # type: (Callable[..., T]) -> None
-        self._live_id_to_object = collections.OrderedDict()  # type: Dict[int, Any]
+    """
+    Maps live objects to their wrapper, by live pointer.
+    Wrappers of unchanged live objects are kept on rebuild,
+    on_added / on_removed are called with the created / dropped wrappers
+    """
+
+    def __init__(self, factory, on_added=None, on_removed=None):
+        # type: (Callable[..., T], Optional[Callable], Optional[Callable]) -> None
+        self._live_id_to_object = {}  # type: Dict[int, Any]
         self._objects = []  # type: List[Any]
         self._factory = factory
+        self._on_added = on_added
+        self._on_removed = on_removed
         self._removed_objects = []  # type: List[Any]
         self._added_objects = []  # type: List[Any]
 
@@ -36,23 +42,33 @@ class LiveObjectMapping(object):
 
     def build(self, live_objects):
         # type: (List[LiveObject]) -> None
-        live_id_to_object = collections.OrderedDict()  # type: Dict[int, Any]
+        previous_live_id_to_object = self._live_id_to_object
+        live_id_to_object = {}  # type: Dict[int, Any]
+        objects = []  # type: List[Any]
+        added_objects = []  # type: List[Any]
+
         for live_object in live_objects:
-            live_id_to_object[live_object._live_ptr] = self._create_object(live_object)
+            live_id = live_object._live_ptr
+            if live_id in live_id_to_object:
+                continue
 
-        self._added_objects = list(
-            set(live_id_to_object.values()) - set(self._live_id_to_object.values())
-        )
-        self._removed_objects = list(
-            set(self._live_id_to_object.values()) - set(live_id_to_object.values())
-        )
+            obj = previous_live_id_to_object.pop(live_id, None)
+            if obj is None:
+                obj = self._factory(live_object)
+                added_objects.append(obj)
 
+            live_id_to_object[live_id] = obj
+            objects.append(obj)
+
+        # what is left of the previous mapping has been removed
+        self._removed_objects = list(previous_live_id_to_object.values())
+        self._added_objects = added_objects
         self._live_id_to_object = live_id_to_object
-        self._objects = self._live_id_to_object.values()
-
-    def _create_object(self, live_object):
-        # type: (LiveObject) -> T
-        if live_object._live_ptr in self._live_id_to_object:
-            return self._live_id_to_object[live_object._live_ptr]
-        else:
-            return self._factory(live_object)
+        self._objects = objects
+
+        if self._on_removed is not None:
+            for obj in self._removed_objects:
+                self._on_removed(obj)
+        if self._on_added is not None:
+            for obj in self._added_objects:
+                self._on_added(obj)
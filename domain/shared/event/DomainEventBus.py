@@ -1,7 +1,8 @@
+import collections
 import inspect
 from functools import partial
 
-from typing import Dict, List, Type, Callable
+from typing import Dict, Type, Callable, Hashable, Tuple, Set
 
 from protocol0.domain.lom.scene.PlayingSceneChangedEvent import PlayingSceneChangedEvent
 from protocol0.domain.lom.scene.SceneLastBarPassedEvent import SceneLastBarPassedEvent
@@ -15,7 +16,12 @@ from protocol0.domain.shared.scheduler.Last32thPassedEvent import Last32thPassed
 from protocol0.domain.shared.scheduler.Last8thPassedEvent import Last8thPassedEvent
 from protocol0.domain.shared.scheduler.LastBeatPassedEvent import LastBeatPassedEvent
 from protocol0.domain.shared.scheduler.Scheduler import Scheduler
-from protocol0.domain.shared.utils.func import is_func_equal, get_callable_repr, get_class_from_func
+from protocol0.domain.shared.utils.func import (
+    is_func_equal,
+    get_callable_repr,
+    get_class_from_func,
+    get_callable_key,
+)
 from protocol0.infra.interface.session.SessionUpdatedEvent import SessionUpdatedEvent
 from protocol0.infra.midi.MidiBytesReceivedEvent import MidiBytesReceivedEvent
 from protocol0.shared.logging.Logger import Logger
@@ -23,6 +29,13 @@ from protocol0.shared.types import T
 
 
 class DomainEventBus(object):
+    """
+    Subscribers are indexed per event type by their callable key (see get_callable_key)
+    so that subscribing and un subscribing are O(1).
+    Emitting iterates an immutable snapshot of the subscribers of the event type and its bases
+    which is only rebuilt after the subscriptions changed
+    """
+
     _DEBUG = False
     _DEBUGGED_EVENTS = ()
     # these periodic events are not logged even in debug mode
@@ -39,7 +52,10 @@ class DomainEventBus(object):
         SessionUpdatedEvent,
         MidiBytesReceivedEvent,
     )
-    _registry = {}  # type: Dict[Type, List[Callable]]
+    _registry = {}  # type: Dict[Type, collections.OrderedDict[Hashable, Callable]]
+    _dispatch_table = {}  # type: Dict[Type, Tuple[Callable, ...]]
+    # event type -> cached event types whose snapshot contains its subscribers
+    _dispatch_dependents = {}  # type: Dict[Type, Set[Type]]
 
     @classmethod
     def once(cls, domain_event, subscriber):
@@ -56,28 +72,68 @@ class DomainEventBus(object):
     @classmethod
     def subscribe(cls, domain_event, subscriber, unique_method=False):
         # type: (Type, Callable, bool) -> None
-        if domain_event not in cls._registry:
-            cls._registry[domain_event] = []
+        subscribers = cls._registry.get(domain_event)
+        if subscribers is None:
+            subscribers = cls._registry[domain_event] = collections.OrderedDict()
+
+        key = get_callable_key(subscriber)
+        duplicate = subscribers.get(key)
+        if duplicate is None and unique_method:
+            for sub in subscribers.values():
+                if is_func_equal(sub, subscriber, unique_method):
+                    duplicate = sub
+                    break
 
-        for sub in cls._registry[domain_event]:
-            if is_func_equal(sub, subscriber, unique_method):
-                Backend.client().show_warning(
-                    "duplicate subscriber : %s for event %s" % (sub, domain_event)
+        if duplicate is not None:
+            Backend.client().show_warning(
+                "duplicate subscriber : %s for event %s" % (duplicate, domain_event)
+            )
+            if inspect.ismethod(duplicate):
+                Logger.warning(
+                    "method class: %s <-> %s"
+                    % (get_class_from_func(duplicate), get_class_from_func(subscriber))
                 )
-                if inspect.ismethod(sub):
-                    Logger.warning(
-                        "method class: %s <-> %s"
-                        % (get_class_from_func(sub), get_class_from_func(subscriber))
-                    )
-                return
+            return
 
-        cls._registry[domain_event].append(subscriber)
+        subscribers[key] = subscriber
+        cls._invalidate_dispatch_table(domain_event)
 
     @classmethod
     def un_subscribe(cls, domain_event, subscriber):
         # type: (Type, Callable) -> None
-        if domain_event in cls._registry and subscriber in cls._registry[domain_event]:
-            cls._registry[domain_event].remove(subscriber)
+        subscribers = cls._registry.get(domain_event)
+        if subscribers is None:
+            return
+        if subscribers.pop(get_callable_key(subscriber), None) is not None:
+            cls._invalidate_dispatch_table(domain_event)
+
+    @classmethod
+    def _invalidate_dispatch_table(cls, domain_event):
+        # type: (Type) -> None
+        for event_type in cls._dispatch_dependents.pop(domain_event, ()):
+            cls._dispatch_table.pop(event_type, None)
+
+    @classmethod
+    def _get_subscribers(cls, event_type):
+        # type: (Type) -> Tuple[Callable, ...]
+        """subscribers to the event type and its base classes, in mro order"""
+        subscribers = cls._dispatch_table.get(event_type)
+        if subscribers is None:
+            bases = inspect.getmro(event_type)
+            subscribers = tuple(
+                sub for base in bases for sub in cls._registry.get(base, {}).values()
+            )
+            cls._dispatch_table[event_type] = subscribers
+            for base in bases:
+                cls._dispatch_dependents.setdefault(base, set()).add(event_type)
+
+        return subscribers
+
+    @classmethod
+    def has_subscribers(cls, event_type):
+        # type: (Type) -> bool
+        """allows emitters to skip computing events nobody listens to"""
+        return len(cls._get_subscribers(event_type)) != 0
 
     @classmethod
     @handle_error
@@ -86,15 +142,12 @@ class DomainEventBus(object):
         if cls._DEBUG and type(domain_event) not in cls._SILENT_EVENTS:
             Logger.info("Event emitted: %s" % domain_event.__class__.__name__)
 
-        if type(domain_event) in cls._registry:
-            # protect the list from unsubscribe in subscribers
-            subscribers = cls._registry[type(domain_event)][:]
-            if type(domain_event) in cls._DEBUGGED_EVENTS:
-                Logger.info(
-                    "Found subscribers: %s" % [get_callable_repr(sub) for sub in subscribers]
-                )
-            for subscriber in subscribers:
-                subscriber(domain_event)
+        # the snapshot is immutable : subscribers can un subscribe during the loop
+        subscribers = cls._get_subscribers(type(domain_event))
+        if subscribers and type(domain_event) in cls._DEBUGGED_EVENTS:
+            Logger.info("Found subscribers: %s" % [get_callable_repr(sub) for sub in subscribers])
+        for subscriber in subscribers:
+            subscriber(domain_event)
 
     @classmethod
     def defer_emit(cls, domain_event):
@@ -107,3 +160,5 @@ class DomainEventBus(object):
         # type: () -> None
         """Resets the bus (removing all events and listeners)"""
         cls._registry = {}
+        cls._dispatch_table = {}
+        cls._dispatch_dependents = {}
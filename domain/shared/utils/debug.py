@@ -1,4 +1,6 @@
 import inspect
+import os
+import types
 from collections import namedtuple
 
 from typing import Optional, Any
@@ -25,3 +27,25 @@ def get_frame_info(frame_count=1):
 
     FrameInfo = namedtuple("FrameInfo", ["filename", "class_name", "line", "method_name"])
     return FrameInfo(filename=filename, class_name=class_name, line=line, method_name=method_name)
+
+
+def get_frame_code(frame_count=1):
+    # type: (int) -> Optional[types.CodeType]
+    """
+    Cheap alternative to get_frame_info : no source lookup is done.
+    The code object can be formatted later on with get_code_repr
+    """
+    call_frame = inspect.currentframe()
+    for _ in range(frame_count):
+        next_frame = call_frame.f_back
+        if not next_frame:
+            return None
+        call_frame = next_frame
+
+    return call_frame.f_code
+
+
+def get_code_repr(code):
+    # type: (types.CodeType) -> str
+    class_name = os.path.splitext(os.path.basename(code.co_filename))[0]
+    return "%s.%s" % (class_name, code.co_name)
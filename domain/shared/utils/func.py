@@ -3,7 +3,7 @@ import types
 from functools import partial
 
 from qualname import qualname
-from typing import Any, Callable, Optional, Type
+from typing import Any, Callable, Optional, Type, Hashable
 
 from protocol0.domain.shared.errors.Protocol0Error import Protocol0Error
 
@@ -101,3 +101,20 @@ def is_func_equal(func1, func2, compare_methods=False):
         return c1 == c2 and func1.__name__ == func2.__name__
     else:
         return False
+
+
+def get_callable_key(func):
+    # type: (Any) -> Hashable
+    """
+    Hashable identity of a callable, consistent with is_func_equal (without compare_methods)
+    Bound methods are keyed on (instance id, function) so that unhashable instances work
+    (in py2, bound builtin methods like list.append hash their instance)
+    """
+    if isinstance(func, partial):
+        return partial, get_callable_key(func.func)
+    elif inspect.ismethod(func):
+        return id(func.__self__), func.__func__
+    elif inspect.isbuiltin(func) and func.__self__ is not None:
+        return id(func.__self__), func.__name__
+    else:
+        return func
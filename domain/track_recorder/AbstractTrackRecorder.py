@@ -2,6 +2,7 @@ from typing import Optional, List
 
 from protocol0.domain.lom.clip.ClipCreatedOrDeletedEvent import ClipCreatedOrDeletedEvent
 from protocol0.domain.lom.clip_slot.ClipSlot import ClipSlot
+from protocol0.domain.lom.clip_slot.ClipSlotGrid import ClipSlotGrid
 from protocol0.domain.lom.scene.Scene import Scene
 from protocol0.domain.lom.song.SongStartedEvent import SongStartedEvent
 from protocol0.domain.lom.song.SongStoppedEvent import SongStoppedEvent
@@ -55,7 +56,7 @@ class AbstractTrackRecorder(object):
     @property
     def _recording_clip_slots(self):
         # type: () -> List[ClipSlot]
-        return [track.clip_slots[self.recording_scene_index] for track in self._recording_tracks]
+        return list(ClipSlotGrid.row(self._recording_tracks, self.recording_scene_index))
 
     @property
     def _recording_tracks(self):
@@ -135,7 +136,7 @@ class AbstractTrackRecorder(object):
             return None
 
         seq = Sequence()
-        main_clip_slot = self._main_recording_track.clip_slots[self.recording_scene_index]
+        main_clip_slot = ClipSlotGrid.get(self._main_recording_track, self.recording_scene_index)
         if not main_clip_slot.clip:
             seq.wait_for_event(ClipCreatedOrDeletedEvent, main_clip_slot._clip_slot)
         seq.add(lambda: self._main_recording_track.select_clip_slot(main_clip_slot))
@@ -1,6 +1,9 @@
+import heapq
+from itertools import count
+
 import Live
 from _Framework.SubjectSlot import subject_slot, SlotManager
-from typing import Callable, List
+from typing import Callable, List, Tuple
 
 from protocol0.domain.lom.scene.SceneLastBarPassedEvent import SceneLastBarPassedEvent
 from protocol0.domain.shared.event.DomainEventBus import DomainEventBus
@@ -19,7 +22,11 @@ from protocol0.shared.SongFacade import SongFacade
 
 class BeatScheduler(SlotManager, BeatSchedulerInterface):
     """BeatScheduler schedules action lists to be triggered after a specified
-    number of bars."""
+    number of bars.
+
+    Events are kept in a min heap keyed on their integer song tick deadline,
+    computed once when scheduled, so that a tick only pops the due events
+    """
 
     def __init__(self, song):
         # type: (Live.Song.Song) -> None
@@ -27,60 +34,103 @@ class BeatScheduler(SlotManager, BeatSchedulerInterface):
         self._song = song
         # noinspection PyArgumentList
         self._last_beats_song_time = BeatTime.from_song_beat_time(
-            song.get_current_beats_song_time()
+            song.get_current_beats_song_time(), song.signature_numerator
         )
-        self._scheduled_events = []  # type: List[BeatSchedulerEvent]
+        # (execution tick count, insertion order, event)
+        self._scheduled_events = []  # type: List[Tuple[int, int, BeatSchedulerEvent]]
+        self._insertion_counter = count()
         self._is_playing_listener.subject = song
 
     @subject_slot("is_playing")
     def _is_playing_listener(self):
         # type: () -> None
         if not self._song.is_playing:
-            self._execute_events()  # execute song stopped events
+            self._execute_song_stopped_events()
             self.reset()
 
     def _on_tick(self):
         # type: () -> None
-        self._dispatch_timing_events()
-        self._execute_events()
+        song_beat_time = SongFacade.current_beats_song_time()
+        signature_numerator = self._song.signature_numerator
+        if self._last_beats_song_time.matches_song_beat_time(song_beat_time, signature_numerator):
+            return  # nothing can have changed since the last tick
+
+        current_beats_song_time = BeatTime.from_song_beat_time(song_beat_time, signature_numerator)
+        self._dispatch_timing_events(current_beats_song_time)
+        self._execute_events(current_beats_song_time.tick_count)
+
+    def _execute_events(self, current_tick_count):
+        # type: (int) -> None
+        while self._scheduled_events and self._scheduled_events[0][0] <= current_tick_count:
+            event = heapq.heappop(self._scheduled_events)[2]
+            event.execute()
 
-    def _execute_events(self):
+    def _execute_song_stopped_events(self):
         # type: () -> None
-        for event in self._scheduled_events:
-            if event.should_execute:
+        events = [event for (_, _, event) in sorted(self._scheduled_events)]
+        del self._scheduled_events[:]
+        for event in events:
+            if event.execute_on_song_stop:
                 event.execute()
-                self._scheduled_events.remove(event)
 
-    def _dispatch_timing_events(self):
-        # type: () -> None
-        current_beats_song_time = BeatTime.from_song_beat_time(SongFacade.current_beats_song_time())
+    def _dispatch_timing_events(self, current_beats_song_time):
+        # type: (BeatTime) -> None
+        """Only the events having subscribers are computed and emitted"""
+        last_beats_song_time = self._last_beats_song_time
+        has_subscribers = DomainEventBus.has_subscribers
 
         events = []  # type: List[object]
         if (
-            current_beats_song_time.bars != self._last_beats_song_time.bars
-            and not self._last_beats_song_time.is_start
+            current_beats_song_time.bars != last_beats_song_time.bars
+            and not last_beats_song_time.is_start
         ):
-            events.append(BarChangedEvent())
-            playing_scene = SongFacade.playing_scene()
-            if playing_scene is not None and playing_scene.playing_state.in_last_bar:
-                events.append(SceneLastBarPassedEvent(playing_scene._scene))
+            if has_subscribers(BarChangedEvent):
+                events.append(BarChangedEvent())
+            if has_subscribers(SceneLastBarPassedEvent):
+                playing_scene = SongFacade.playing_scene()
+                if playing_scene is not None and playing_scene.playing_state.in_last_bar:
+                    events.append(SceneLastBarPassedEvent(playing_scene._scene))
 
-        if current_beats_song_time.beats == 3 and not self._last_beats_song_time.beats == 3:
+        if (
+            current_beats_song_time.beats == 3
+            and not last_beats_song_time.beats == 3
+            and has_subscribers(ThirdBeatPassedEvent)
+        ):
             events.append(ThirdBeatPassedEvent())
 
-        if current_beats_song_time.in_last_beat and not self._last_beats_song_time.in_last_beat:
+        if (
+            current_beats_song_time.in_last_beat
+            and not last_beats_song_time.in_last_beat
+            and has_subscribers(LastBeatPassedEvent)
+        ):
             events.append(LastBeatPassedEvent())
 
-        if current_beats_song_time.in_last_8th and not self._last_beats_song_time.in_last_8th:
+        if (
+            current_beats_song_time.in_last_8th
+            and not last_beats_song_time.in_last_8th
+            and has_subscribers(Last8thPassedEvent)
+        ):
             events.append(Last8thPassedEvent())
 
-        if current_beats_song_time.in_last_16th and not self._last_beats_song_time.in_last_16th:
+        if (
+            current_beats_song_time.in_last_16th
+            and not last_beats_song_time.in_last_16th
+            and has_subscribers(Last16thPassedEvent)
+        ):
             events.append(Last16thPassedEvent())
 
-        if current_beats_song_time.in_last_32th and not self._last_beats_song_time.in_last_32th:
+        if (
+            current_beats_song_time.in_last_32th
+            and not last_beats_song_time.in_last_32th
+            and has_subscribers(Last32thPassedEvent)
+        ):
             events.append(Last32thPassedEvent())
 
-        if current_beats_song_time.in_bar_ending and not self._last_beats_song_time.in_bar_ending:
+        if (
+            current_beats_song_time.in_bar_ending
+            and not last_beats_song_time.in_bar_ending
+            and has_subscribers(BarEndingEvent)
+        ):
             events.append(BarEndingEvent())
 
         self._last_beats_song_time = current_beats_song_time
@@ -100,13 +150,19 @@ class BeatScheduler(SlotManager, BeatSchedulerInterface):
         Tip: never rely on wait_beats but use it in conjunction with listeners and Live quantization on launch
         It's the only way to have precise scheduling
         """
+        if beats_offset == 0:
+            callback()
+            return
+
         event = BeatSchedulerEvent(
-            callback, BeatTime.make_from_beat_offset(beats_offset), execute_on_song_stop
+            callback,
+            BeatTime.make_from_beat_offset(beats_offset).tick_count,
+            execute_on_song_stop,
+        )
+        heapq.heappush(
+            self._scheduled_events,
+            (event.execution_tick_count, next(self._insertion_counter), event),
         )
-        if beats_offset == 0:
-            event.execute()
-        else:
-            self._scheduled_events.append(event)
 
     def disconnect(self):
         # type: () -> None
@@ -116,4 +172,4 @@ class BeatScheduler(SlotManager, BeatSchedulerInterface):
     def reset(self):
         # type: () -> None
         self._scheduled_events[:] = []
-        self._last_beats_song_time = BeatTime(1, 1, 1, 1)
+        self._last_beats_song_time = BeatTime(1, 1, 1, 1, self._song.signature_numerator)
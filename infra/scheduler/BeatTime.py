@@ -4,73 +4,147 @@ import Live
 
 from protocol0.shared.SongFacade import SongFacade
 
+_IN_LAST_BEAT = 1
+_IN_LAST_8TH = 2
+_IN_LAST_16TH = 4
+_IN_LAST_32TH = 8
+_IN_BAR_ENDING = 16
+_IS_START = 32
+
 
 class BeatTime(object):
-    def __init__(self, bars, beats, sixteenths, ticks):
-        # type: (int, int, int, int) -> None
-        self.bars = bars
-        self.beats = beats
+    """
+    Immutable song time value : the values are read only properties.
+    The absolute tick count and the position flags are computed once at construction
+    so that comparisons and flag reads don't call Live or allocate.
+    """
+
+    __slots__ = (
+        "_bars",
+        "_beats",
+        "_sixteenths",
+        "_ticks",
+        "_signature_numerator",
+        "_tick_count",
+        "_flags",
+    )
+
+    def __init__(self, bars, beats, sixteenths, ticks, signature_numerator):
+        # type: (int, int, int, int, int) -> None
+        self._bars = bars
+        self._beats = beats
         self._sixteenths = sixteenths
         self._ticks = ticks  # 1 to 60
+        self._signature_numerator = signature_numerator
+
+        sixteenths_coeff = 60
+        beat_coeff = 4 * sixteenths_coeff
+        bar_coeff = beat_coeff * signature_numerator
+        self._tick_count = (
+            ticks + sixteenths * sixteenths_coeff + beats * beat_coeff + bars * bar_coeff
+        )
+
+        flags = 0
+        if beats == signature_numerator:
+            flags |= _IN_LAST_BEAT
+            if sixteenths >= 3:
+                flags |= _IN_LAST_8TH
+            if sixteenths == 4:
+                flags |= _IN_LAST_16TH
+                if ticks >= 30:
+                    flags |= _IN_LAST_32TH
+                    if ticks >= 45:
+                        flags |= _IN_BAR_ENDING
+        if bars == 1 and beats == 1 and sixteenths == 1 and ticks == 1:
+            flags |= _IS_START
+        self._flags = flags
 
     def __repr__(self):
         # type: () -> str
         return "bars: %s, beats: %s, sixteenths: %s, ticks: %s" % (
-            self.bars,
-            self.beats,
+            self._bars,
+            self._beats,
             self._sixteenths,
             self._ticks,
         )
 
     def __eq__(self, other):
         # type: (object) -> bool
-        return isinstance(other, BeatTime) and self._to_tick_count == other._to_tick_count
+        return isinstance(other, BeatTime) and self._tick_count == other._tick_count
+
+    def __ne__(self, other):
+        # type: (object) -> bool
+        return not self == other
+
+    def __hash__(self):
+        # type: () -> int
+        return self._tick_count
 
     def __ge__(self, other):
         # type: (BeatTime) -> bool
-        return self._to_tick_count >= other._to_tick_count
+        return self._tick_count >= other._tick_count
 
     def __gt__(self, other):
         # type: (BeatTime) -> bool
-        return self._to_tick_count > other._to_tick_count
+        return self._tick_count > other._tick_count
 
     @property
-    def _to_tick_count(self):
+    def bars(self):
         # type: () -> int
-        sixteenths_coeff = 60
-        beat_coeff = 4 * sixteenths_coeff
-        bar_coeff = beat_coeff * SongFacade.signature_numerator()
-        return (
-            self._ticks
-            + self._sixteenths * sixteenths_coeff
-            + self.beats * beat_coeff
-            + self.bars * bar_coeff
-        )
+        return self._bars
+
+    @property
+    def beats(self):
+        # type: () -> int
+        return self._beats
+
+    @property
+    def tick_count(self):
+        # type: () -> int
+        """absolute song tick count"""
+        return self._tick_count
 
     @property
     def is_start(self):
         # type: () -> bool
-        return self == BeatTime(1, 1, 1, 1)
+        return bool(self._flags & _IS_START)
+
+    def matches_song_beat_time(self, beat_time, signature_numerator):
+        # type: (Live.Song.BeatTime, int) -> bool
+        return (
+            self._ticks == beat_time.ticks
+            and self._sixteenths == beat_time.sub_division
+            and self._beats == beat_time.beats
+            and self._bars == beat_time.bars
+            and self._signature_numerator == signature_numerator
+        )
 
     @classmethod
-    def from_song_beat_time(cls, beat_time):
-        # type: (Live.Song.BeatTime) -> BeatTime
-        return cls(beat_time.bars, beat_time.beats, beat_time.sub_division, beat_time.ticks)
+    def from_song_beat_time(cls, beat_time, signature_numerator):
+        # type: (Live.Song.BeatTime, int) -> BeatTime
+        return cls(
+            beat_time.bars,
+            beat_time.beats,
+            beat_time.sub_division,
+            beat_time.ticks,
+            signature_numerator,
+        )
 
     @classmethod
     def make_from_beat_offset(cls, beat_total_offset):
         # type: (float) -> BeatTime
+        signature_numerator = SongFacade.signature_numerator()
         if float(beat_total_offset).is_integer():
-            bars_offset = int(beat_total_offset / SongFacade.signature_numerator())
-            beats_offset = int(beat_total_offset % SongFacade.signature_numerator())
+            bars_offset = int(beat_total_offset / signature_numerator)
+            beats_offset = int(beat_total_offset % signature_numerator)
             sixteenths_offset = 0
             ticks_offset = 0
         else:
             beats_floor_offset = floor(beat_total_offset)
             beats_reminder = beat_total_offset - beats_floor_offset
-            bars_offset = int(beats_floor_offset / SongFacade.signature_numerator())
-            beats_offset = int(beats_floor_offset % SongFacade.signature_numerator())
-            sixteenth_float_value = float(1) / SongFacade.signature_numerator()
+            bars_offset = int(beats_floor_offset / signature_numerator)
+            beats_offset = int(beats_floor_offset % signature_numerator)
+            sixteenth_float_value = float(1) / signature_numerator
             tick_float_value = float(1) / 60
 
             sixteenths_float_reminder = beats_reminder % sixteenth_float_value
@@ -85,30 +159,31 @@ class BeatTime(object):
             beats=song_beat_time.beats + beats_offset,
             sixteenths=song_beat_time.sub_division + sixteenths_offset,
             ticks=song_beat_time.ticks + ticks_offset,
+            signature_numerator=signature_numerator,
         )
 
     @property
     def in_last_beat(self):
         # type: () -> bool
-        return self.beats == SongFacade.signature_numerator()
+        return bool(self._flags & _IN_LAST_BEAT)
 
     @property
     def in_last_8th(self):
         # type: () -> bool
-        return self.in_last_beat and self._sixteenths >= 3
+        return bool(self._flags & _IN_LAST_8TH)
 
     @property
     def in_last_16th(self):
         # type: () -> bool
-        return self.in_last_beat and self._sixteenths == 4
+        return bool(self._flags & _IN_LAST_16TH)
 
     @property
     def in_last_32th(self):
         # type: () -> bool
-        return self.in_last_16th and self._ticks >= 30
+        return bool(self._flags & _IN_LAST_32TH)
 
     @property
     def in_bar_ending(self):
         # type: () -> bool
         """Defined as during the last 64th"""
-        return self.in_last_32th and self._ticks >= 45
+        return bool(self._flags & _IN_BAR_ENDING)
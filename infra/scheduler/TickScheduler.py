@@ -1,32 +1,45 @@
+import heapq
+from itertools import count
+
 import Live
-from typing import List, Callable, Optional
+from typing import List, Callable, Optional, Dict, Hashable, Set, Tuple
 
 from protocol0.domain.shared.errors.error_handler import handle_error
 from protocol0.domain.shared.scheduler.TickSchedulerEventInterface import (
     TickSchedulerEventInterface,
 )
 from protocol0.domain.shared.scheduler.TickSchedulerInterface import TickSchedulerInterface
-from protocol0.domain.shared.utils.func import is_func_equal
+from protocol0.domain.shared.utils.func import get_callable_key
 from protocol0.infra.scheduler.BeatScheduler import BeatScheduler
 from protocol0.infra.scheduler.TickSchedulerEvent import TickSchedulerEvent
 from protocol0.shared.logging.Logger import Logger
 
 
 class TickScheduler(TickSchedulerInterface):
+    """
+    Events are stored in a min heap keyed on their absolute due tick
+    so that a tick only touches the events that are due.
+    Cancelled events are dropped lazily when they reach the top of the heap.
+    """
+
     def __init__(self, beat_scheduler, song):
         # type: (BeatScheduler, Live.Song.Song) -> None
         self._beat_scheduler = beat_scheduler
         self._song = song
         self._live_timer = None  # type: Optional[Live.Base.Timer]
-        # noinspection PyArgumentList
-        self._scheduled_events = []  # type: List[TickSchedulerEvent]
+        self._tick_count = 0
+        # (due tick, insertion order, event) : the insertion order keeps execution FIFO
+        self._heap = []  # type: List[Tuple[int, int, TickSchedulerEvent]]
+        self._insertion_counter = count()
+        # used by unique scheduling
+        self._events_by_callback = {}  # type: Dict[Hashable, Set[TickSchedulerEvent]]
 
         self.start()
 
     def stop(self):
         # type: () -> None
         if self._live_timer:
-            del self._scheduled_events[:]
+            self._clear()
             # noinspection PyArgumentList
             self._live_timer.stop()
 
@@ -37,6 +50,11 @@ class TickScheduler(TickSchedulerInterface):
         # noinspection PyArgumentList
         self._live_timer.start()
 
+    def _clear(self):
+        # type: () -> None
+        del self._heap[:]
+        self._events_by_callback.clear()
+
     @handle_error
     def _on_tick(self):
         # type: () -> None
@@ -49,30 +67,44 @@ class TickScheduler(TickSchedulerInterface):
 
         if is_song_playing:
             self._beat_scheduler._on_tick()
-        for scheduled_event in self._scheduled_events[:]:
-            if scheduled_event.should_execute:
-                scheduled_event.execute()
-                try:
-                    self._scheduled_events.remove(scheduled_event)
-                except ValueError:
-                    pass
-            else:
-                scheduled_event.decrement_timeout()
+
+        self._tick_count += 1
+        # events scheduled by executed callbacks are due at the earliest on the next tick
+        while self._heap and self._heap[0][0] <= self._tick_count:
+            event = heapq.heappop(self._heap)[2]
+            self._un_index(event)
+            event.execute()
 
     def schedule(self, tick_count, callback, unique=False):
         # type: (int, Callable, bool) -> TickSchedulerEventInterface
         assert callable(callback)
         assert tick_count > 0
 
+        key = get_callable_key(callback)
         if unique:
-            for event in self._scheduled_events:
-                if is_func_equal(event.callback, callback):
+            for event in self._events_by_callback.pop(key, ()):
+                if not event.cancelled:
                     Logger.warning(
                         "Cancelling duplicate callback : %s -> %s" % (event.callback, callback)
                     )
                     event.cancel()
-                    self._scheduled_events.remove(event)
 
-        scheduled_event = TickSchedulerEvent(callback=callback, tick_count=tick_count)
-        self._scheduled_events.append(scheduled_event)
+        # the event is executed on the tick following its tick_count decrements
+        scheduled_event = TickSchedulerEvent(
+            callback=callback, due_tick=self._tick_count + tick_count + 1
+        )
+        heapq.heappush(
+            self._heap,
+            (scheduled_event.due_tick, next(self._insertion_counter), scheduled_event),
+        )
+        self._events_by_callback.setdefault(key, set()).add(scheduled_event)
         return scheduled_event
+
+    def _un_index(self, event):
+        # type: (TickSchedulerEvent) -> None
+        key = get_callable_key(event.callback)
+        events = self._events_by_callback.get(key)
+        if events is not None:
+            events.discard(event)
+            if not events:
+                del self._events_by_callback[key]
@@ -7,10 +7,10 @@ from protocol0.domain.shared.utils.func import get_callable_repr
 
 
 class TickSchedulerEvent(TickSchedulerEventInterface):
-    def __init__(self, callback, tick_count):
+    def __init__(self, callback, due_tick):
         # type: (Callable, int) -> None
         self.callback = callback
-        self._ticks_left = tick_count
+        self.due_tick = due_tick  # absolute tick count of the TickScheduler
         self._cancelled = False
 
     def __repr__(self):
@@ -18,14 +18,9 @@ class TickSchedulerEvent(TickSchedulerEventInterface):
         return get_callable_repr(self.callback)
 
     @property
-    def should_execute(self):
+    def cancelled(self):
         # type: () -> bool
-        return self._ticks_left == 0
-
-    def decrement_timeout(self):
-        # type: () -> None
-        assert self._ticks_left > 0
-        self._ticks_left -= 1
+        return self._cancelled
 
     def execute(self):
         # type: () -> None
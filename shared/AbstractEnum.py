@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import TypeVar, cast, Any, Dict
+from typing import TypeVar, cast, Any, Mapping
 
 from protocol0.domain.shared.errors.Protocol0Error import Protocol0Error
 
@@ -14,14 +14,14 @@ class AbstractEnum(Enum):
     @classmethod
     def from_value(cls, value):
         # type: (Any) -> T
-        for _, enum in cls.__members__.items():
-            if value == enum.value:
-                return cast(T, enum)
-
-        raise Protocol0Error("Couldn't find matching enum for value %s" % value)
+        try:
+            # value lookup table of the enum
+            return cast(T, cls(value))
+        except ValueError:
+            raise Protocol0Error("Couldn't find matching enum for value %s" % value)
 
     def get_value_from_mapping(self, mapping):
-        # type: (Dict[AbstractEnum, Any]) -> Any
+        # type: (Mapping[Any, Any]) -> Any
         if self not in mapping:
             raise Protocol0Error("Couldn't find enum %s in mapping" % self)
         return mapping[self]
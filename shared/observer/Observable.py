@@ -4,6 +4,8 @@ from protocol0.shared.observer.Observer import Observer
 
 
 class Observable(object):
+    __slots__ = ("_observers",)
+
     def __init__(self):
         # type: () -> None
         self._observers = []  # type: List[Observer]
@@ -3,7 +3,6 @@ from collections import deque
 from _Framework.SubjectSlot import SlotManager
 from typing import List, Callable
 
-from protocol0.domain.shared.utils.func import get_callable_repr
 from protocol0.shared.observer.Observable import Observable
 from protocol0.shared.sequence.SequenceState import SequenceState
 from protocol0.shared.sequence.SequenceStep import SequenceStep
@@ -16,9 +15,9 @@ class ParallelSequence(SlotManager, Observable):
     def __init__(self, funcs):
         # type: (List[Callable]) -> None
         super(ParallelSequence, self).__init__()
-        self._steps = deque([SequenceStep(func, get_callable_repr(func), True) for func in funcs])
+        self._steps = deque([SequenceStep(func, None, True) for func in funcs])
         self._steps_terminated_count = 0
-        self.state = SequenceState()
+        self.state = SequenceState.UN_STARTED
         self.res = None
 
     def __repr__(self):
@@ -35,7 +34,7 @@ class ParallelSequence(SlotManager, Observable):
 
     def start(self):
         # type: () -> ParallelSequence
-        self.state.change_to(SequenceStateEnum.STARTED)
+        self.state = self.state.change_to(SequenceStateEnum.STARTED)
 
         if len(self._steps) == 0:
             self._check_for_parallel_step_completion()
@@ -49,6 +48,6 @@ class ParallelSequence(SlotManager, Observable):
     def _check_for_parallel_step_completion(self):
         # type: () -> None
         if self._steps_terminated_count == len(self._steps):
-            self.state.change_to(SequenceStateEnum.TERMINATED)
+            self.state = self.state.change_to(SequenceStateEnum.TERMINATED)
             self.notify_observers()
             self.disconnect()
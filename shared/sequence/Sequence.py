@@ -1,7 +1,10 @@
+import collections
+import weakref
+import time
 from collections import deque
 from functools import partial
 
-from typing import Deque, Iterable, Union, Any, Optional, List, Type, Callable, cast
+from typing import Deque, Iterable, Union, Any, Optional, List, Type, Callable, cast, Dict
 
 from protocol0.domain.lom.song.SongStartedEvent import SongStartedEvent
 from protocol0.domain.lom.song.SongStoppedEvent import SongStoppedEvent
@@ -11,12 +14,13 @@ from protocol0.domain.shared.backend.NotificationColorEnum import NotificationCo
 from protocol0.domain.shared.event.DomainEventBus import DomainEventBus
 from protocol0.domain.shared.event.HasEmitter import HasEmitter
 from protocol0.domain.shared.scheduler.Scheduler import Scheduler
-from protocol0.domain.shared.utils.debug import get_frame_info
-from protocol0.domain.shared.utils.func import nop, get_callable_repr
+from protocol0.domain.shared.utils.debug import get_frame_code, get_code_repr
+from protocol0.domain.shared.utils.func import nop
 from protocol0.shared.SongFacade import SongFacade
 from protocol0.shared.logging.Logger import Logger
 from protocol0.shared.observer.Observable import Observable
 from protocol0.shared.sequence.ParallelSequence import ParallelSequence
+from protocol0.shared.sequence.SequenceProfiler import SequenceProfiler
 from protocol0.shared.sequence.SequenceState import SequenceState
 from protocol0.shared.sequence.SequenceStep import SequenceStep
 from protocol0.shared.sequence.SequenceTransition import SequenceStateEnum
@@ -30,7 +34,21 @@ class Sequence(Observable):
     Encapsulates and composes all asynchronous tasks done in the script.
     """
 
-    RUNNING_SEQUENCES = []  # type: List[Sequence]
+    __slots__ = (
+        "_steps",
+        "_current_step",
+        "state",
+        "res",
+        "_name",
+        "_caller_code",
+        "_is_registered",
+        "_waiting_for",
+        "_wait_started_at",
+        "__weakref__",
+    )
+
+    # sequence id -> weak reference, in registration order
+    RUNNING_SEQUENCES = collections.OrderedDict()  # type: Dict[int, weakref.ReferenceType]
     _DEBUG = False
     _STEP_TIMEOUT = 50  # seconds
 
@@ -40,20 +58,32 @@ class Sequence(Observable):
 
         self._steps = deque()  # type: Deque[SequenceStep]
         self._current_step = None  # type: Optional[SequenceStep]
-        self.state = SequenceState()
+        self.state = SequenceState.UN_STARTED
         self.res = None  # type: Optional[Any]
-        frame_info = get_frame_info(2)
-        if name:
-            self.name = name
-        elif frame_info:
-            self.name = "[seq %s.%s]" % (frame_info.class_name, frame_info.method_name)
-        else:
-            self.name = "Unknown"
+        self._name = name
+        # the name is only formatted when needed (no stack inspection)
+        self._caller_code = None if name else get_frame_code(2)
+        # a sequence is only registered as running once it waits for something
+        self._is_registered = False
+        # what the sequence is waiting on (event, ticks, beats, backend response ..)
+        self._waiting_for = None  # type: Optional[str]
+        # only set when profiling
+        self._wait_started_at = None  # type: Optional[float]
 
     def __repr__(self, **k):
         # type: (Any) -> str
         return self.name
 
+    @property
+    def name(self):
+        # type: () -> str
+        if not self._name:
+            if self._caller_code is not None:
+                self._name = "[seq %s]" % get_code_repr(self._caller_code)
+            else:
+                self._name = "Unknown"
+        return self._name
+
     def add(self, func=nop, name=None, notify_terminated=True):
         # type: (Union[Iterable, Callable, object], str, bool) -> Sequence
         """callback can be a callable or a list of callable (will execute in parallel)"""
@@ -65,39 +95,113 @@ class Sequence(Observable):
 
         func = cast(Callable, func)
 
-        step_name = "%s : step %s" % (self.name, name or get_callable_repr(func))
-
-        step = SequenceStep(func, step_name, notify_terminated)
+        step = SequenceStep(func, name, notify_terminated, self)
         self._steps.append(step)
 
         return self
 
     def done(self):
         # type: () -> Sequence
-        self.state.change_to(SequenceStateEnum.STARTED)
-        self.RUNNING_SEQUENCES.append(self)
+        self.state = self.state.change_to(SequenceStateEnum.STARTED)
         self._execute_next_step()
         return self
 
     def _execute_next_step(self):
         # type: () -> None
-        if not self.state.started:
-            return
-        if len(self._steps):
-            self._current_step = self._steps.popleft()
+        """
+        Synchronous steps are chained inline, without the observer round trip.
+        We only observe a step (and register the sequence as running)
+        when it did not terminate synchronously
+        """
+        while self.state.started:
+            if self._wait_started_at is not None:
+                self._record_wait()
+
+            if len(self._steps) == 0:
+                self._terminate()
+                return
+
+            step = self._current_step = self._steps.popleft()
             if self._DEBUG:
-                Logger.debug("%s : Executing %s" % (self, self._current_step))
-            self._current_step.register_observer(self)
-            self._current_step.start()
-        else:
-            self._terminate()
+                Logger.debug("%s : Executing %s" % (self, step))
+            self._waiting_for = None
+            if SequenceProfiler.ENABLED:
+                started_at = time.time()
+                step.start()
+                SequenceProfiler.record_execution(str(step), time.time() - started_at)
+            else:
+                step.start()
+
+            if self._current_step is not step:
+                return  # the step moved the sequence forward (or stopped it) itself
+            elif step.state.terminated and step._notify_terminated:
+                if self._DEBUG:
+                    Logger.info("step terminated : %s" % step)
+                continue
+            elif step.state.errored:
+                self._error()
+            elif step.state.cancelled:
+                self._cancel()
+            else:
+                # the step is waiting on a sequence, or a callback will resume the sequence
+                self._register()
+                if step.state.started:
+                    self._waiting_for = "sequence"
+                    step.register_observer(self)
+                elif self._waiting_for is None:
+                    self._waiting_for = "callback"
+                if SequenceProfiler.ENABLED:
+                    self._wait_started_at = time.time()
+            return
+
+    def _record_wait(self):
+        # type: () -> None
+        SequenceProfiler.record_wait(
+            str(self._current_step),
+            self._waiting_for or "callback",
+            time.time() - cast(float, self._wait_started_at),
+        )
+        self._wait_started_at = None
+
+    def _register(self):
+        # type: () -> None
+        if self._is_registered:
+            return
+
+        self._is_registered = True
+        seq_id = id(self)
+        running_sequences = Sequence.RUNNING_SEQUENCES
+
+        def on_collected(ref):
+            # type: (weakref.ReferenceType) -> None
+            if running_sequences.get(seq_id) is ref:
+                del running_sequences[seq_id]
+
+        running_sequences[seq_id] = weakref.ref(self, on_collected)
+
+    @classmethod
+    def running_sequences(cls):
+        # type: () -> List[Sequence]
+        sequences = (ref() for ref in list(Sequence.RUNNING_SEQUENCES.values()))
+        return [seq for seq in sequences if seq is not None]
+
+    @classmethod
+    def get_running_sequences_stats(cls):
+        # type: () -> Dict[str, Any]
+        """Useful to find sequence leaks"""
+        sequences = cls.running_sequences()
+        return {
+            "count": len(sequences),
+            "by_name": dict(collections.Counter(seq.name for seq in sequences)),
+            "by_waiting_for": dict(collections.Counter(seq._waiting_for for seq in sequences)),
+        }
 
     @classmethod
     def reset(cls):
         # type: () -> None
-        for seq in reversed(Sequence.RUNNING_SEQUENCES):
+        for seq in reversed(cls.running_sequences()):
             seq._cancel()
-        Sequence.RUNNING_SEQUENCES = []
+        Sequence.RUNNING_SEQUENCES = collections.OrderedDict()
 
     def update(self, observable):
         # type: (Observable) -> None
@@ -115,7 +219,7 @@ class Sequence(Observable):
 
     def _error(self):
         # type: () -> None
-        self.state.change_to(SequenceStateEnum.ERRORED)
+        self.state = self.state.change_to(SequenceStateEnum.ERRORED)
         self.disconnect()
         if self._DEBUG:
             Logger.warning("Sequence errored : %s" % self)
@@ -123,7 +227,7 @@ class Sequence(Observable):
     def _cancel(self):
         # type: () -> None
         if self.state.started:
-            self.state.change_to(SequenceStateEnum.CANCELLED)
+            self.state = self.state.change_to(SequenceStateEnum.CANCELLED)
             Logger.warning("%s has been cancelled" % self)
             if self._current_step:
                 self._current_step.cancel()
@@ -131,7 +235,7 @@ class Sequence(Observable):
 
     def _terminate(self):
         # type: () -> None
-        self.state.change_to(SequenceStateEnum.TERMINATED)
+        self.state = self.state.change_to(SequenceStateEnum.TERMINATED)
 
         self.res = self._current_step.res if self._current_step else None
         self.notify_observers()
@@ -143,21 +247,28 @@ class Sequence(Observable):
         # type: (str) -> Sequence
         return self.add(lambda: Logger.warning(message))
 
+    def _add_wait_step(self, func, waiting_for):
+        # type: (Callable, str) -> Sequence
+        """the sequence is resumed by a callback calling _execute_next_step"""
+
+        def execute():
+            # type: () -> None
+            self._waiting_for = waiting_for
+            func()
+
+        return self.add(execute, notify_terminated=False)
+
     def defer(self):
         # type: () -> Sequence
-        return self.add(partial(Scheduler.defer, self._execute_next_step), notify_terminated=False)
+        return self._add_wait_step(partial(Scheduler.defer, self._execute_next_step), "ticks")
 
     def wait(self, ticks):
         # type: (int) -> Sequence
-        return self.add(
-            partial(Scheduler.wait, ticks, self._execute_next_step), notify_terminated=False
-        )
+        return self._add_wait_step(partial(Scheduler.wait, ticks, self._execute_next_step), "ticks")
 
     def wait_ms(self, ms):
         # type: (int) -> Sequence
-        return self.add(
-            partial(Scheduler.wait_ms, ms, self._execute_next_step), notify_terminated=False
-        )
+        return self._add_wait_step(partial(Scheduler.wait_ms, ms, self._execute_next_step), "ticks")
 
     def wait_bars(self, bars, wait_for_song_start=False, continue_on_song_stop=False):
         # type: (float, bool, bool) -> Sequence
@@ -185,7 +296,7 @@ class Sequence(Observable):
             if continue_on_song_stop:
                 DomainEventBus.subscribe(SongStoppedEvent, lambda _: self._execute_next_step())
 
-        return self.add(execute, notify_terminated=False)
+        return self._add_wait_step(execute, "beats")
 
     def wait_for_event(self, event_class, expected_emitter=None, continue_on_song_stop=False):
         # type: (Type[object], object, bool) -> Sequence
@@ -228,12 +339,12 @@ class Sequence(Observable):
             if self.state.started:
                 self._execute_next_step()
 
-        return self._add_timeout_step(subscribe, "wait_for_event %s" % event_class)
+        return self._add_timeout_step(subscribe, "event %s" % event_class.__name__)
 
     def wait_for_backend_event(self, event_type):
         # type: (str) -> None
         """event types are hardcoded in the script and backend"""
-        self.add(nop, notify_terminated=False)
+        self._add_wait_step(nop, "backend %s" % event_type)
 
         def on_event(backend_event):
             # type: (BackendEvent) -> None
@@ -260,6 +371,7 @@ class Sequence(Observable):
 
         def execute():
             # type: () -> None
+            self._waiting_for = legend
             Scheduler.wait_ms(seconds * 1000, cancel)
             func()
 
@@ -305,7 +417,6 @@ class Sequence(Observable):
     def disconnect(self):
         # type: () -> None
         self._current_step = None
-        try:
-            self.RUNNING_SEQUENCES.remove(self)
-        except ValueError:
-            pass
+        if self._is_registered:
+            self._is_registered = False
+            Sequence.RUNNING_SEQUENCES.pop(id(self), None)
@@ -0,0 +1,112 @@
+from collections import deque, defaultdict
+
+from typing import Dict, Deque, Any, List
+
+
+class _StepProfile(object):
+    def __init__(self):
+        # type: () -> None
+        self.execution_count = 0
+        self.execution_durations = deque(
+            maxlen=SequenceProfiler.WINDOW_SIZE
+        )  # type: Deque[float]
+        self.wait_durations = defaultdict(
+            lambda: deque(maxlen=SequenceProfiler.WINDOW_SIZE)
+        )  # type: Dict[str, Deque[float]]
+
+    def to_dict(self):
+        # type: () -> Dict[str, Any]
+        return {
+            "executions": self.execution_count,
+            "execution": _summarize(self.execution_durations),
+            "wait": dict(
+                (waiting_for, _summarize(durations))
+                for waiting_for, durations in self.wait_durations.items()
+            ),
+        }
+
+
+def _summarize(durations):
+    # type: (Deque[float]) -> Dict[str, Any]
+    """durations are in seconds, the summary is in ms"""
+    durations_ms = [d * 1000 for d in durations]
+    histogram = [0] * (len(SequenceProfiler.HISTOGRAM_BUCKETS_MS) + 1)
+    for duration in durations_ms:
+        histogram[_bucket_index(duration)] += 1
+
+    labels = ["<%sms" % b for b in SequenceProfiler.HISTOGRAM_BUCKETS_MS] + [
+        ">=%sms" % SequenceProfiler.HISTOGRAM_BUCKETS_MS[-1]
+    ]
+
+    return {
+        "count": len(durations_ms),
+        "total_ms": round(sum(durations_ms), 3),
+        "max_ms": round(max(durations_ms), 3) if durations_ms else 0,
+        "histogram": dict((label, count) for label, count in zip(labels, histogram) if count),
+    }
+
+
+def _bucket_index(duration_ms):
+    # type: (float) -> int
+    for index, bucket in enumerate(SequenceProfiler.HISTOGRAM_BUCKETS_MS):
+        if duration_ms < bucket:
+            return index
+    return len(SequenceProfiler.HISTOGRAM_BUCKETS_MS)
+
+
+class SequenceProfiler(object):
+    """
+    Opt-in profiling of sequence steps, keyed by step name.
+    Records the synchronous execution time of each step
+    and the time spent waiting (ticks, beats, events, backend ..) before the next step.
+    Durations are kept in a rolling window per step.
+    """
+
+    ENABLED = False
+    WINDOW_SIZE = 100
+    HISTOGRAM_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+    _PROFILES = {}  # type: Dict[str, _StepProfile]
+
+    @classmethod
+    def _get_profile(cls, step_name):
+        # type: (str) -> _StepProfile
+        if step_name not in cls._PROFILES:
+            cls._PROFILES[step_name] = _StepProfile()
+        return cls._PROFILES[step_name]
+
+    @classmethod
+    def record_execution(cls, step_name, duration):
+        # type: (str, float) -> None
+        profile = cls._get_profile(step_name)
+        profile.execution_count += 1
+        profile.execution_durations.append(duration)
+
+    @classmethod
+    def record_wait(cls, step_name, waiting_for, duration):
+        # type: (str, str, float) -> None
+        cls._get_profile(step_name).wait_durations[waiting_for].append(duration)
+
+    @classmethod
+    def slowest_steps(cls, count=10):
+        # type: (int) -> List[str]
+        """step names sorted by total (execution + wait) time in the window"""
+
+        def total_duration(profile):
+            # type: (_StepProfile) -> float
+            return sum(profile.execution_durations) + sum(
+                sum(durations) for durations in profile.wait_durations.values()
+            )
+
+        names = sorted(cls._PROFILES, key=lambda n: total_duration(cls._PROFILES[n]), reverse=True)
+        return names[:count]
+
+    @classmethod
+    def to_dict(cls):
+        # type: () -> Dict[str, Any]
+        return dict((name, profile.to_dict()) for name, profile in cls._PROFILES.items())
+
+    @classmethod
+    def reset(cls):
+        # type: () -> None
+        cls._PROFILES = {}
@@ -1,47 +1,51 @@
+from typing import Dict
+
 from protocol0.domain.shared.errors.Protocol0Error import Protocol0Error
-from protocol0.shared.sequence.SequenceTransition import SequenceTransition, SequenceStateEnum
+from protocol0.shared.sequence.SequenceTransition import SequenceStateEnum, SEQUENCE_TRANSITIONS
 
 
 class SequenceState(object):
-    def __init__(self):
-        # type: () -> None
-        terminated_state = SequenceTransition(SequenceStateEnum.TERMINATED, [])
-        cancelled_state = SequenceTransition(SequenceStateEnum.CANCELLED, [])
-        errored_state = SequenceTransition(SequenceStateEnum.ERRORED, [])
-        started_state = SequenceTransition(
-            SequenceStateEnum.STARTED, [terminated_state, cancelled_state, errored_state]
-        )
-        un_started_state = SequenceTransition(SequenceStateEnum.UN_STARTED, [started_state])
-
-        self.state = un_started_state
-        self.res = None
+    """
+    Flyweight : there is one immutable instance per SequenceStateEnum,
+    shared by every Sequence, ParallelSequence and SequenceStep.
+    Owners hold a reference to the current state and replace it on transition
+    """
 
-    def change_to(self, enum):
+    __slots__ = ("enum", "started", "terminated", "cancelled", "errored", "_transitions")
+
+    UN_STARTED = None  # type: SequenceState
+
+    def __init__(self, enum):
         # type: (SequenceStateEnum) -> None
-        new_state = self.state.get_transition(enum)
+        self.enum = enum
+        self.started = enum == SequenceStateEnum.STARTED
+        self.terminated = enum == SequenceStateEnum.TERMINATED
+        self.cancelled = enum == SequenceStateEnum.CANCELLED
+        self.errored = enum == SequenceStateEnum.ERRORED
+        self._transitions = {}  # type: Dict[SequenceStateEnum, SequenceState]
+
+    def __repr__(self):
+        # type: () -> str
+        return self.enum.name
+
+    def change_to(self, enum):
+        # type: (SequenceStateEnum) -> SequenceState
+        """returns the new state"""
+        new_state = self._transitions.get(enum)
         if new_state is None:
-            raise Protocol0Error(
-                "Cannot change state from %s to %s : %s" % (self.state.enum, enum, self)
-            )
-
-        self.state = new_state
-
-    @property
-    def started(self):
-        # type: () -> bool
-        return self.state.enum == SequenceStateEnum.STARTED
-
-    @property
-    def errored(self):
-        # type: () -> bool
-        return self.state.enum == SequenceStateEnum.ERRORED
-
-    @property
-    def cancelled(self):
-        # type: () -> bool
-        return self.state.enum == SequenceStateEnum.CANCELLED
-
-    @property
-    def terminated(self):
-        # type: () -> bool
-        return self.state.enum == SequenceStateEnum.TERMINATED
+            raise Protocol0Error("Cannot change state from %s to %s" % (self.enum, enum))
+
+        return new_state
+
+
+def _build_states():
+    # type: () -> None
+    states = dict((enum, SequenceState(enum)) for enum in SequenceStateEnum)
+    for state in states.values():
+        for enum in SEQUENCE_TRANSITIONS[state.enum]:
+            state._transitions[enum] = states[enum]
+
+    SequenceState.UN_STARTED = states[SequenceStateEnum.UN_STARTED]
+
+
+_build_states()
@@ -1,6 +1,7 @@
 from typing import Any, Callable, Optional
 
 from protocol0.domain.shared.errors.error_handler import handle_error
+from protocol0.domain.shared.utils.func import get_callable_repr
 from protocol0.shared.observer.Observable import Observable
 from protocol0.shared.sequence.HasSequenceState import HasSequenceState
 from protocol0.shared.sequence.SequenceState import SequenceState
@@ -8,18 +9,26 @@ from protocol0.shared.sequence.SequenceTransition import SequenceStateEnum
 
 
 class SequenceStep(Observable):
-    def __init__(self, func, name, notify_terminated):
-        # type: (Callable, str, bool) -> None
+    __slots__ = ("_name", "_sequence", "_callable", "state", "_notify_terminated", "res")
+
+    def __init__(self, func, name, notify_terminated, sequence=None):
+        # type: (Callable, Optional[str], bool, Optional[object]) -> None
+        """the name is computed lazily from the callable and the parent sequence"""
         super(SequenceStep, self).__init__()
         self._name = name
+        self._sequence = sequence
         self._callable = func
-        self.state = SequenceState()
+        self.state = SequenceState.UN_STARTED
         self._notify_terminated = notify_terminated
         self.res = None  # type: Optional[Any]
 
     def __repr__(self, **k):
         # type: (Any) -> str
-        return self._name
+        name = self._name or get_callable_repr(self._callable)
+        if self._sequence is not None:
+            return "%s : step %s" % (self._sequence, name)
+        else:
+            return name
 
     def update(self, observable):
         # type: (Observable) -> None
@@ -31,7 +40,7 @@ class SequenceStep(Observable):
     @handle_error
     def start(self):
         # type: () -> None
-        self.state.change_to(SequenceStateEnum.STARTED)
+        self.state = self.state.change_to(SequenceStateEnum.STARTED)
         # noinspection PyBroadException
         try:
             self._execute()
@@ -58,13 +67,13 @@ class SequenceStep(Observable):
     def _error(self):
         # type: () -> None
         if self.state.started:
-            self.state.change_to(SequenceStateEnum.ERRORED)
+            self.state = self.state.change_to(SequenceStateEnum.ERRORED)
             self.notify_observers()
 
     def cancel(self):
         # type: () -> None
         if self.state.started:
-            self.state.change_to(SequenceStateEnum.CANCELLED)
+            self.state = self.state.change_to(SequenceStateEnum.CANCELLED)
             self.notify_observers()
 
     def _terminate(self, res):
@@ -72,6 +81,6 @@ class SequenceStep(Observable):
         if self.state.cancelled or self.state.errored:
             return
         self.res = res
-        self.state.change_to(SequenceStateEnum.TERMINATED)
+        self.state = self.state.change_to(SequenceStateEnum.TERMINATED)
         if self._notify_terminated:
             self.notify_observers()
@@ -1,6 +1,5 @@
-from typing import Optional, List
+from typing import Dict, Tuple
 
-from protocol0.domain.shared.utils.list import find_if
 from protocol0.shared.AbstractEnum import AbstractEnum
 
 
@@ -12,16 +11,15 @@ class SequenceStateEnum(AbstractEnum):
     ERRORED = "ERRORED"
 
 
-class SequenceTransition(object):
-    def __init__(self, enum, allowed_transitions):
-        # type: (SequenceStateEnum, List[SequenceTransition]) -> None
-        self.enum = enum
-        self._allowed_transitions = allowed_transitions
-
-    def __repr__(self):
-        # type: () -> str
-        return self.enum.name
-
-    def get_transition(self, new_state_enum):
-        # type: (SequenceStateEnum) -> Optional["SequenceTransition"]
-        return find_if(lambda s: s.enum == new_state_enum, self._allowed_transitions)
+# the state machine is the same for every Sequence, ParallelSequence and SequenceStep
+SEQUENCE_TRANSITIONS = {
+    SequenceStateEnum.UN_STARTED: (SequenceStateEnum.STARTED,),
+    SequenceStateEnum.STARTED: (
+        SequenceStateEnum.TERMINATED,
+        SequenceStateEnum.CANCELLED,
+        SequenceStateEnum.ERRORED,
+    ),
+    SequenceStateEnum.TERMINATED: (),
+    SequenceStateEnum.CANCELLED: (),
+    SequenceStateEnum.ERRORED: (),
+}  # type: Dict[SequenceStateEnum, Tuple[SequenceStateEnum, ...]]
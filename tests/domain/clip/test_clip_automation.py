@@ -0,0 +1,75 @@
+from typing import cast, List, Any
+
+from protocol0.domain.lom.device_parameter.DeviceParameter import DeviceParameter
+from protocol0.shared.SongFacade import SongFacade
+from protocol0.tests.domain.fixtures.clip import AbletonClip
+from protocol0.tests.domain.fixtures.device_parameter import AbletonDeviceParameter
+from protocol0.tests.domain.fixtures.p0 import make_protocol0
+from protocol0.tests.domain.fixtures.simple_track import TrackType, add_track
+
+
+def test_automated_parameters_cache():
+    make_protocol0()
+    live_track = add_track(track_type=TrackType.MIDI)
+    live_track.mixer_device.sends.append(AbletonDeviceParameter("Automated"))
+    live_track.clip_slots[0].add_clip()
+    SongFacade._INSTANCE._track_mapper_service.tracks_listener()
+
+    track = list(SongFacade.simple_tracks())[-1]
+    track.clip_slots[0].has_clip_listener()
+    clip = track.clip_slots[0].clip
+    live_clip = cast(AbletonClip, clip._clip)
+
+    envelope_calls = []  # type: List[Any]
+
+    def automation_envelope(live_parameter):
+        # type: (AbletonDeviceParameter) -> bool
+        envelope_calls.append(live_parameter)
+        return live_parameter.name == "Automated"
+
+    live_clip.automation_envelope = automation_envelope  # type: ignore[attr-defined]
+    # no envelopes : Live is not queried
+    assert track.get_automated_parameters(0) == {}
+    assert len(envelope_calls) == 0
+
+    live_clip.has_envelopes = True
+    clip._has_envelopes_listener()
+    automated_parameters = track.get_automated_parameters(0)
+    assert [p.name for p in automated_parameters] == ["Automated"]
+    assert automated_parameters[list(automated_parameters)[0]] == track
+    call_count = len(envelope_calls)
+    assert call_count != 0
+
+    # cached at clip and track level
+    assert track.get_automated_parameters(0) == automated_parameters
+    assert [p.name for p in clip.automation.get_automated_parameters(track.devices.parameters)] == [
+        "Automated"
+    ]
+    assert len(envelope_calls) == call_count
+
+    # parameters change
+    parameters = track.devices.parameters + [DeviceParameter(AbletonDeviceParameter("Other"))]
+    clip.automation.get_automated_parameters(parameters)
+    assert len(envelope_calls) > call_count
+
+    # envelope change
+    call_count = len(envelope_calls)
+    clip.automation.clear_all_envelopes()
+    assert track.get_automated_parameters(0) == automated_parameters
+    assert len(envelope_calls) > call_count
+
+    # envelope changes Live does not notify : refreshed by invalidating the clip
+    live_track.mixer_device.sends[-1].name = "Other"
+    assert track.get_automated_parameters(0) == automated_parameters
+    clip.automation.invalidate()
+    assert track.get_automated_parameters(0) == {}
+
+    # envelopes drawn on an automated clip : refreshed on play and for uncached queries
+    live_track.mixer_device.sends[-1].name = "Automated"
+    assert track.get_automated_parameters(0) == {}
+    clip._playing_status_listener()
+    assert [p.name for p in track.get_automated_parameters(0)] == ["Automated"]
+    live_track.mixer_device.sends[-1].name = "Other"
+    parameters = track.devices.parameters
+    assert len(clip.automation.get_automated_parameters(parameters)) == 1
+    assert clip.automation.get_automated_parameters(parameters, use_cache=False) == []
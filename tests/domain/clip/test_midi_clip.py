@@ -0,0 +1,74 @@
+from typing import cast, List
+
+from protocol0.domain.lom.clip.ClipConfig import ClipConfig
+from protocol0.domain.lom.clip.MidiClip import MidiClip
+from protocol0.domain.lom.track.simple_track.SimpleMidiTrack import SimpleMidiTrack
+from protocol0.shared.SongFacade import SongFacade
+from protocol0.tests.domain.fixtures.clip import AbletonClip
+from protocol0.tests.domain.fixtures.clip_slot import AbletonClipSlot
+from protocol0.tests.domain.fixtures.p0 import make_protocol0
+from protocol0.tests.domain.fixtures.simple_track import TrackType, add_track
+
+
+def _set_notes(live_clip, notes):
+    # type: (AbletonClip, tuple) -> None
+    live_clip.get_notes = lambda *a, **k: notes  # type: ignore[assignment]
+
+
+def test_midi_clip_hash():
+    make_protocol0()
+    live_clip_slot = AbletonClipSlot()
+    live_clip_slot.add_clip()
+    live_clip = cast(AbletonClip, live_clip_slot.clip)
+    _set_notes(live_clip, ((60, 0, 1, 100, False),))
+    clip = MidiClip(live_clip, 0, ClipConfig(0))
+
+    clip_hash = clip.hash
+    _set_notes(live_clip, ((62, 0, 1, 100, False),))
+    # cached until the notes listener fires
+    assert clip.hash == clip_hash
+    clip._notes_listener()
+    assert clip.hash != clip_hash
+
+
+def test_clip_slots_by_hash():
+    make_protocol0()
+    live_track = add_track(track_type=TrackType.MIDI)
+    live_track.clip_slots.append(AbletonClipSlot())
+    for live_clip_slot in live_track.clip_slots:
+        live_clip_slot.add_clip()
+        _set_notes(live_clip_slot.clip, ((60, 0, 1, 100, False),))
+    SongFacade._INSTANCE._track_mapper_service.tracks_listener()
+
+    track = cast(SimpleMidiTrack, list(SongFacade.simple_tracks())[-1])
+    for clip_slot in track.clip_slots:
+        clip_slot.has_clip_listener()
+    clip_1, clip_2 = [clip_slot.clip for clip_slot in track.clip_slots]
+    assert len(track.get_clip_slots_by_hash(clip_1.hash)) == 2
+
+    _set_notes(clip_2._clip, ((62, 0, 1, 100, False),))
+    clip_2._notes_listener()
+    assert track.get_clip_slots_by_hash(clip_1.hash) == [track.clip_slots[0]]
+    assert track.get_clip_slots_by_hash(clip_2.hash) == [track.clip_slots[1]]
+
+
+def test_has_same_clips():
+    make_protocol0()
+    for _ in range(2):
+        live_track = add_track(track_type=TrackType.MIDI)
+        live_track.clip_slots[0].add_clip()
+        _set_notes(live_track.clip_slots[0].clip, ((60, 0, 1, 100, False),))
+    SongFacade._INSTANCE._track_mapper_service.tracks_listener()
+
+    track_1, track_2 = cast(List[SimpleMidiTrack], list(SongFacade.simple_tracks())[-2:])
+    for track in (track_1, track_2):
+        track.clip_slots[0].has_clip_listener()
+    assert track_1.has_same_clips(track_2)
+
+    # the index of a track only depends on its own clips
+    clip_hashes_key = track_1._clip_hashes_key
+    clip_2 = track_2.clip_slots[0].clip
+    _set_notes(clip_2._clip, ((62, 0, 1, 100, False),))
+    clip_2._notes_listener()
+    assert not track_1.has_same_clips(track_2)
+    assert track_1._clip_hashes_key is clip_hashes_key
@@ -0,0 +1,25 @@
+from typing import cast
+
+import Live
+
+from protocol0.domain.lom.device.Device import Device
+from protocol0.domain.lom.device_parameter.DeviceParameterEnum import DeviceParameterEnum
+from protocol0.tests.domain.fixtures.device import AbletonDevice
+from protocol0.tests.domain.fixtures.device_parameter import AbletonDeviceParameter
+
+
+def test_device_parameters():
+    live_device = AbletonDevice("Test")
+    device = Device(cast(Live.Device.Device, live_device))
+    # created on first access
+    assert device._parameters is None
+
+    assert device.get_parameter_by_name(DeviceParameterEnum.DEVICE_ON) == device.parameters[0]
+    assert device.get_parameter_by_name("Gain") is None
+
+    live_device.parameters.append(AbletonDeviceParameter("Gain"))
+    assert device.get_parameter_by_name("Gain") is None
+    device._parameters_listener()
+    assert device._parameters is None
+    assert device.get_parameter_by_name("Gain") == device.parameters[1]
+    assert device.parameters[1].default_value == 0
@@ -0,0 +1,32 @@
+import pytest
+
+from protocol0.domain.lom.device.DeviceEnum import DeviceEnum
+from protocol0.domain.lom.device_parameter.DeviceParameterEnum import DeviceParameterEnum
+from protocol0.domain.shared.errors.Protocol0Error import Protocol0Error
+
+
+def test_device_enum_lookups():
+    assert DeviceEnum.from_name("Utility") == DeviceEnum.UTILITY
+    assert DeviceEnum.from_name("Unknown") is None
+    assert DeviceEnum.from_value("Utility") == DeviceEnum.UTILITY
+    with pytest.raises(Protocol0Error):
+        DeviceEnum.from_value("Unknown")
+
+    assert DeviceEnum.UTILITY.default_parameter == DeviceParameterEnum.UTILITY_GAIN
+    assert DeviceEnum.REVERB.default_parameter is None
+    assert DeviceEnum.EQ_EIGHT.class_name == "Eq8"
+    assert DeviceEnum.REVERB.class_name == "Reverb"
+    assert DeviceEnum.EXTERNAL_INSTRUMENT.browser_name == "External Instrument"
+    assert DeviceEnum.EQ_ROOM.browser_name == "EQ Room.adv"
+    assert DeviceEnum.TUNER.load_time == 0
+    assert len(DeviceEnum.UTILITY.main_parameters_default) == 2
+    with pytest.raises(Protocol0Error):
+        DeviceEnum.REVERB.main_parameters_default
+
+
+def test_device_parameter_enum_lookups():
+    parameter_enum = DeviceParameterEnum.from_name("Utility", "Gain")
+    assert parameter_enum == DeviceParameterEnum.UTILITY_GAIN
+    assert parameter_enum.parameter_name == "Gain"
+    assert DeviceParameterEnum.from_name("Utility", "Unknown") is None
+    assert DeviceParameterEnum.UTILITY_SILENT_GAIN.default_value == -1
@@ -0,0 +1,30 @@
+from typing import cast
+
+import Live
+
+from protocol0.domain.lom.device.Device import Device
+from protocol0.domain.lom.device.DeviceEnum import DeviceEnum
+from protocol0.domain.lom.device.SimpleTrackDevices import SimpleTrackDevices
+from protocol0.tests.domain.fixtures.device import AbletonDevice
+from protocol0.tests.domain.fixtures.simple_track import AbletonTrack
+
+
+def test_devices_by_enum():
+    devices = SimpleTrackDevices(cast(Live.Track.Track, AbletonTrack()))
+    live_device = AbletonDevice(DeviceEnum.UTILITY.value)
+    device = Device(cast(Live.Device.Device, live_device))
+    devices._devices = [device]
+    devices._map_all_devices()
+
+    assert devices.get_one_from_enum(DeviceEnum.UTILITY) == device
+    assert devices.get_from_enum(DeviceEnum.REVERB) == []
+    # the index is kept between lookups
+    devices_by_enum = devices._devices_by_enum
+    assert devices.get_one_from_enum(DeviceEnum.UTILITY) == device
+    assert devices._devices_by_enum is devices_by_enum
+
+    # and dropped when a device is renamed
+    live_device.name = DeviceEnum.REVERB.value
+    devices._device_name_listener(live_device)
+    assert devices.get_one_from_enum(DeviceEnum.UTILITY) is None
+    assert devices.get_from_enum(DeviceEnum.REVERB) == [device]
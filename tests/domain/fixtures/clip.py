@@ -14,6 +14,8 @@ class AbletonClip(Subject):
         "name",
         "warping",
         "muted",
+        "notes",
+        "has_envelopes",
     )
 
     def __init__(self):
@@ -29,6 +31,7 @@ class AbletonClip(Subject):
         self.playing_position = 0
         self.start_marker = 0
         self.is_audio_clip = False
+        self.has_envelopes = False
 
     # noinspection PyUnusedLocal
     def get_notes(self, *a, **k):
@@ -39,3 +42,6 @@ class AbletonClip(Subject):
 
     def replace_selected_notes(self, _):
         pass
+
+    def clear_all_envelopes(self):
+        pass
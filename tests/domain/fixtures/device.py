@@ -5,7 +5,7 @@ from protocol0.tests.domain.fixtures.device_parameter import AbletonDeviceParame
 
 
 class AbletonDevice(Subject):
-    __subject_events__ = ("parameters",)
+    __subject_events__ = ("parameters", "name")
 
     def __init__(self, name):
         # type: (str) -> None
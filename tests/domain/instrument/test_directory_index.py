@@ -0,0 +1,104 @@
+import os
+import shutil
+import sys
+import tempfile
+
+from protocol0.domain.lom.instrument.preset.preset_importer.DirectoryIndex import DirectoryIndex
+
+
+def _touch(*path):
+    # type: (str) -> None
+    with open(os.path.join(*path), "w"):
+        pass
+
+
+def _walk(index, path=None):
+    # type: (DirectoryIndex, str) -> list
+    return sorted((root, sorted(dirs), sorted(files)) for root, dirs, files in index.walk(path))
+
+
+def _os_walk(root):
+    # type: (str) -> list
+    return sorted(
+        (r, sorted(d), sorted(name for name in f if name != DirectoryIndex.FILENAME))
+        for r, d, f in os.walk(root)
+    )
+
+
+def _make_old(root):
+    # type: (str) -> None
+    """So that the directories are not considered as being modified while listed"""
+    for current_path, _, _ in os.walk(root):
+        os.utime(current_path, (0, 0))
+
+
+def test_directory_index():
+    DirectoryIndex.reset()
+    root = tempfile.mkdtemp()
+    try:
+        os.makedirs(os.path.join(root, "kick", "808"))
+        os.makedirs(os.path.join(root, "snare"))
+        _touch(root, "kick", "kick.wav")
+        _touch(root, "kick", "808", "808.wav")
+        _touch(root, "snare", "snare.wav")
+        _make_old(root)
+
+        index = DirectoryIndex.for_path(root)
+        expected = _os_walk(root)
+        assert _walk(index) == expected
+        assert os.path.isfile(os.path.join(root, DirectoryIndex.FILENAME))
+        # creating the index file modified the root directory
+        os.utime(root, (0, 0))
+
+        # persisted and shared by the sub directories
+        DirectoryIndex.reset()
+        index = DirectoryIndex.for_path(os.path.join(root, "kick"))
+        assert index is DirectoryIndex.for_path(root)
+        listdir = os.listdir
+        listed = []
+        os.listdir = lambda path: listed.append(path) or listdir(path)  # type: ignore
+        try:
+            assert _walk(index, os.path.join(root, "kick")) == expected[1:3]
+            assert listed == []
+
+            # only the changed directory is listed
+            _touch(root, "snare", "snare_2.wav")
+            os.utime(os.path.join(root, "snare"), (1, 1))
+            shutil.rmtree(os.path.join(root, "kick", "808"))
+            os.utime(os.path.join(root, "kick"), (1, 1))
+            walked = _walk(index)
+        finally:
+            os.listdir = listdir
+
+        assert sorted(listed) == [os.path.join(root, "kick"), os.path.join(root, "snare")]
+        assert walked == _os_walk(root)
+    finally:
+        shutil.rmtree(root)
+        DirectoryIndex.reset()
+
+
+def test_directory_index_non_ascii_names():
+    DirectoryIndex.reset()
+    root = tempfile.mkdtemp()
+    try:
+        # cp1252 names are not valid utf-8
+        name = b"caf\xe9.wav"
+        if not isinstance(root, bytes):
+            name = name.decode(sys.getfilesystemencoding(), "surrogateescape")
+        os.makedirs(os.path.join(root, "kick"))
+        _touch(root, "kick", name)
+        _touch(root, "kick", "kick.wav")
+        _make_old(root)
+
+        expected = _os_walk(root)
+        assert _walk(DirectoryIndex.for_path(root)) == expected
+        assert os.path.isfile(os.path.join(root, DirectoryIndex.FILENAME))
+
+        # the names are loaded with their original type
+        DirectoryIndex.reset()
+        index = DirectoryIndex.for_path(root)
+        assert _walk(index) == expected
+        assert all(type(n) is type(name) for _, _, files in index.walk() for n in files)
+    finally:
+        shutil.rmtree(root)
+        DirectoryIndex.reset()
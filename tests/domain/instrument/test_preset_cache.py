@@ -0,0 +1,95 @@
+import os
+import tempfile
+
+import pytest
+
+from protocol0.domain.lom.device.PluginDevice import PluginDevice
+from protocol0.domain.lom.instrument.preset.InstrumentPreset import InstrumentPreset
+from protocol0.domain.lom.instrument.preset.preset_importer.FilePresetImporter import (
+    FilePresetImporter,
+)
+from protocol0.domain.lom.instrument.preset.preset_importer.PresetCache import PresetCache
+from protocol0.domain.lom.instrument.preset.preset_importer.PluginDevicePresetImporter import (
+    PluginDevicePresetImporter,
+)
+from protocol0.tests.domain.fixtures.device import AbletonDevice
+
+
+def test_file_preset_importer_cache():
+    PresetCache.reset()
+    fd, path = tempfile.mkstemp()
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write("preset 1\npreset 2\n")
+        os.utime(path, (1, 1))
+
+        importer = FilePresetImporter(path)
+        presets = importer.import_presets()
+        assert len(presets) == 2
+        assert FilePresetImporter(path).import_presets() is presets
+        assert PresetCache.get_stats() == {"size": 1, "hits": 1, "misses": 1, "evictions": 0}
+
+        # the key depends on the file mtime
+        with open(path, "a") as f:
+            f.write("preset 3\n")
+        os.utime(path, (2, 2))
+        assert len(importer.import_presets()) == 3
+
+        importer.invalidate_cache()
+        assert importer.import_presets() is not importer.import_presets(use_cache=False)
+    finally:
+        os.remove(path)
+        PresetCache.reset()
+
+
+class AbletonPluginDevice(AbletonDevice):
+    __subject_events__ = ("parameters", "name", "presets")
+
+    def __init__(self, name):
+        # type: (str) -> None
+        super(AbletonPluginDevice, self).__init__(name)
+        self.class_name = "PluginDevice"
+        self.presets = ["preset 1", "preset 2"]
+
+
+def test_plugin_device_preset_importer_cache():
+    PresetCache.reset()
+    live_device = AbletonPluginDevice("Serum")
+    try:
+        device = PluginDevice(live_device)
+        importer = PluginDevicePresetImporter(device)
+        assert [p.name for p in importer.import_presets()] == ["preset 1", "preset 2"]
+
+        # renamed presets keep the key : invalidated by the presets listener
+        live_device.presets = ["preset 3", "preset 4"]
+        assert [p.name for p in importer.import_presets()] == ["preset 1", "preset 2"]
+        device._presets_listener()
+        assert [p.name for p in importer.import_presets()] == ["preset 3", "preset 4"]
+
+        # another plugin at the same pointer
+        live_device.name = "Diva"
+        live_device.presets = ["preset 5", "preset 6"]
+        assert [p.name for p in importer.import_presets()] == ["preset 5", "preset 6"]
+    finally:
+        PresetCache.reset()
+
+
+def test_preset_cache_eviction():
+    PresetCache.reset()
+    max_size = PresetCache.MAX_SIZE
+    PresetCache.MAX_SIZE = 2
+    try:
+        preset = InstrumentPreset(index=0, name="preset")
+        PresetCache.set("a", [preset])
+        PresetCache.set("b", [preset])
+        PresetCache.get("a")
+        PresetCache.set("c", [preset])
+
+        assert PresetCache.get("a") == [preset]
+        assert PresetCache.get("c") == [preset]
+        with pytest.raises(KeyError):
+            PresetCache.get("b")
+        assert PresetCache.get_stats()["evictions"] == 1
+    finally:
+        PresetCache.MAX_SIZE = max_size
+        PresetCache.reset()
@@ -0,0 +1,33 @@
+import pytest
+
+from protocol0.domain.lom.note.Note import Note, NoteRow
+from protocol0.domain.shared.errors.Protocol0Error import Protocol0Error
+
+
+def _to_tuple(note):
+    # type: (Note) -> NoteRow
+    return note.pitch, note.start, note.duration, note.velocity, note.muted
+
+
+def test_note_validation():
+    note = Note(pitch=200, start=-1, duration=2, velocity=140)
+    assert _to_tuple(note) == (127, 0, 2, 127, False)
+    note.velocity = -10
+    note.start = 1
+    note.end = 4
+    assert _to_tuple(note) == (127, 1, 3, 0, False)
+    with pytest.raises(Protocol0Error):
+        note.duration = 0
+    with pytest.raises(AttributeError):
+        note.color = 1  # type: ignore[attr-defined]
+
+
+def test_note_live_conversion():
+    live_notes = ((60, 0.0, 1.0, 100, False), (62, 1.0, 0.5, 90, 1))
+    notes = Note.from_live_notes(live_notes)
+    assert notes == [Note(60, 0, 1, 100, False), Note(62, 1, 0.5, 90, True)]
+    assert notes[1].velocity == 90
+    assert [_to_tuple(note) for note in notes] == [
+        (60, 0.0, 1.0, 100, False),
+        (62, 1.0, 0.5, 90, True),
+    ]
@@ -0,0 +1,32 @@
+from protocol0.domain.lom.note.Note import Note
+from protocol0.domain.lom.note.NoteBuffer import NoteBuffer
+
+
+def test_note_buffer_conversion():
+    live_notes = ((62, 1.0, 0.5, 100, False), (60, 0.0, 1.0, 90, True))
+    buffer = NoteBuffer.from_live_notes(live_notes)
+    assert len(buffer) == 2
+    # sorted by start
+    assert buffer.to_live_notes() == (live_notes[1], live_notes[0])
+    assert buffer.has_note_at(0)
+    assert not buffer.has_note_at(0.5)
+
+    notes = buffer.to_notes()
+    assert notes == [Note(60, 0, 1, 90, True), Note(62, 1, 0.5, 100, False)]
+    assert NoteBuffer.from_notes(notes).hash() == buffer.hash()
+    assert NoteBuffer.from_live_notes(live_notes[:1]).hash() != buffer.hash()
+
+
+def test_note_buffer_transforms():
+    buffer = NoteBuffer.from_live_notes(
+        ((60, 0.0, 2.0, 100, False), (60, 1.0, 0.5, 60, False), (60, 3.0, 1.0, 20, False))
+    )
+    buffer.scale_velocities(go_next=False, scaling_factor=2)
+    assert list(buffer.velocities) == [80, 60, 40]
+    buffer.scale_velocities(go_next=True, scaling_factor=2)
+    assert list(buffer.velocities) == [100, 60, 20]
+    buffer.scale_velocities(go_next=True, scaling_factor=2)
+    assert list(buffer.velocities) == [127, 60, 0]
+
+    buffer.to_mono()
+    assert list(buffer.durations) == [2.0, 2.0, 1.0]
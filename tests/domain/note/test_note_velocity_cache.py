@@ -0,0 +1,73 @@
+import time
+
+import pytest
+
+from protocol0.domain.lom.note.Note import Note
+from protocol0.domain.lom.note.NoteBuffer import NoteBuffer
+from protocol0.domain.lom.note.NoteVelocityCache import NoteVelocityCache
+
+
+def test_note_velocity_cache():
+    notes = [(60 + i % 12, i * 0.25, 0.25, 100.5, False) for i in range(1000)]
+    cache = NoteVelocityCache()
+    cache.set(NoteBuffer.from_live_notes(notes))
+    assert len(cache) == 1000
+
+    # as fetched from Live : int velocities and float drift
+    live_notes = [(p, start + 0.000001, duration, 100, m) for p, start, duration, _, m in notes]
+    buffer = NoteBuffer.from_live_notes(live_notes + [(60, 0, 0.25, 90, True)])
+    cache.apply(buffer)
+    assert list(buffer.velocities) == [90] + [100.5] * 1000
+
+
+def test_note_velocity_cache_max_size():
+    cache = NoteVelocityCache()
+    notes = [(60, float(i), 1.0, 100.5, False) for i in range(NoteVelocityCache.MAX_SIZE + 10)]
+    cache.set(NoteBuffer.from_live_notes(notes))
+    assert len(cache) == NoteVelocityCache.MAX_SIZE
+
+    buffer = NoteBuffer.from_live_notes([(60, 0.0, 1.0, 100, False), (60, 4100.0, 1.0, 100, False)])
+    cache.apply(buffer)
+    assert list(buffer.velocities) == [100.5, 100]
+
+
+def test_note_velocity_cache_neighbouring_buckets():
+    cache = NoteVelocityCache()
+    cache.set(NoteBuffer.from_live_notes([(60, 0.0000049, 1.0000049, 100.5, False)]))
+
+    # closer than the grid but quantized to the next bucket
+    buffer = NoteBuffer.from_live_notes([(60, 0.0000051, 1.0000051, 100, False)])
+    cache.apply(buffer)
+    assert list(buffer.velocities) == [100.5]
+
+    # in a neighbouring bucket but further than the grid
+    buffer = NoteBuffer.from_live_notes([(60, 0.000016, 1.0000049, 100, False)])
+    cache.apply(buffer)
+    assert list(buffer.velocities) == [100]
+
+
+@pytest.mark.slow
+def test_note_velocity_cache_benchmark():
+    """Compares the cache to a scan of the cached notes (run with -m slow)"""
+    for note_count in (1000, 10000):
+        notes = [(60 + i % 12, i * 0.25, 0.25, 100.5, False) for i in range(note_count)]
+        live_notes = [(p, start + 0.000001, duration, 100, m) for p, start, duration, _, m in notes]
+
+        cached_notes = [Note(*note) for note in notes]
+        start_time = time.time()
+        for note in Note.from_live_notes(live_notes):
+            next((cached_note for cached_note in cached_notes if cached_note == note), note)
+        scan_duration = time.time() - start_time
+
+        cache = NoteVelocityCache()
+        cache.set(NoteBuffer.from_live_notes(notes))
+        buffer = NoteBuffer.from_live_notes(live_notes)
+        start_time = time.time()
+        cache.apply(buffer)
+        cache_duration = time.time() - start_time
+
+        assert cache_duration * 10 < scan_duration, "%s notes: scan %.3fs, cache %.3fs" % (
+            note_count,
+            scan_duration,
+            cache_duration,
+        )
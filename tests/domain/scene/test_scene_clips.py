@@ -1,5 +1,6 @@
 from typing import cast
 
+from protocol0.domain.lom.clip_slot.ClipSlotGrid import ClipSlotGrid
 from protocol0.domain.lom.scene.SceneClips import SceneClips
 from protocol0.shared.SongFacade import SongFacade
 from protocol0.tests.domain.fixtures.clip_slot import AbletonClipSlot
@@ -16,3 +17,21 @@ def test_scene_clips():
 
     clips = SceneClips(0)
     assert len(list(clips)) == 1
+
+
+def test_clip_slot_grid():
+    make_protocol0()
+    track = SongFacade.selected_track()
+    column = ClipSlotGrid.column(track)
+    assert column == track.clip_slots
+    assert ClipSlotGrid.get(track, 0) is track.clip_slots[0]
+    assert list(ClipSlotGrid.row([track], 0)) == [track.clip_slots[0]]
+
+    # the column is maintained in place
+    track._track.clip_slots.append(AbletonClipSlot())
+    track.on_scenes_change()
+    assert ClipSlotGrid.column(track) is column
+    assert len(column) == 2
+
+    track.disconnect()
+    assert track.live_id not in ClipSlotGrid._COLUMNS
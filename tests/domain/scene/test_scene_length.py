@@ -13,7 +13,7 @@ from protocol0.tests.domain.fixtures.p0 import make_protocol0
 def test_scene_length():
     make_protocol0()
     clips = SceneClips(0)
-    scene_length = SceneLength(clips, 0)
+    scene_length = SceneLength(clips)
     assert scene_length.length == 0
     assert scene_length.bar_length == 0
 
@@ -25,5 +25,31 @@ def test_scene_length():
     live_clip = AbletonClip()
     live_clip.length = 4
     clips._clips.append(Clip(live_clip_slot.clip, 1, ClipConfig(1)))
+    # the scene length is cached until the clips change
+    assert scene_length.length == 0
+    clips.version += 1
+    assert scene_length.length == 4
+    assert scene_length.bar_length == 1
+
+
+def test_scene_length_cache():
+    make_protocol0()
+    clip_slot = SongFacade.selected_track().clip_slots[0]
+    live_clip_slot = cast(AbletonClipSlot, clip_slot._clip_slot)
+    live_clip_slot.add_clip()
+    clip_slot.has_clip_listener()
+    scene_length = SceneLength(SceneClips(0))
     assert scene_length.length == 4
+
+    hits = SceneLength.CACHE_HITS
     assert scene_length.bar_length == 1
+    assert scene_length.longest_clip == clip_slot.clip
+    assert SceneLength.CACHE_HITS > hits
+
+    # muting the clip invalidates the cache
+    misses = SceneLength.CACHE_MISSES
+    live_clip_slot.clip.muted = True
+    clip_slot.clip._muted_listener()
+    assert scene_length.length == 0
+    assert scene_length.longest_clip is None
+    assert SceneLength.CACHE_MISSES == misses + 1
@@ -0,0 +1,39 @@
+from protocol0.domain.lom.scene.ScenePlaybackGraph import ScenePlaybackGraph
+from protocol0.shared.SongFacade import SongFacade
+from protocol0.tests.domain.fixtures.clip_slot import AbletonClipSlot
+from protocol0.tests.domain.fixtures.p0 import make_protocol0
+from protocol0.tests.domain.fixtures.scene import AbletonScene
+
+
+def test_scene_playback_graph():
+    make_protocol0()
+    live_song = SongFacade._live_song()
+    live_track = live_song.tracks[0]
+    live_song.scenes[:] = [AbletonScene() for _ in range(4)]
+    live_track.clip_slots[:] = [AbletonClipSlot() for _ in range(4)]
+    # the last scene is empty
+    for clip_slot in live_track.clip_slots[:3]:
+        clip_slot.add_clip()
+    live_song.scenes[1].name = "skip"
+
+    SongFacade.selected_track().on_scenes_change()
+    SongFacade._INSTANCE._scene_service.map_scenes()
+    scenes = list(SongFacade.scenes())
+
+    assert [scene.next_scene for scene in scenes] == [scenes[2], scenes[2], scenes[2], scenes[3]]
+    assert [scene.previous_scene for scene in scenes] == [
+        scenes[0],
+        scenes[0],
+        scenes[0],
+        scenes[2],
+    ]
+    assert SongFacade.last_scene() == scenes[2]
+    assert ScenePlaybackGraph.played_scene_count() == 2
+    assert ScenePlaybackGraph.bar_length() == 2
+    assert ScenePlaybackGraph.length() == 8
+
+    # renaming the scene is handled
+    live_song.scenes[1].name = "test scene"
+    scenes[1].scene_name._name_listener()
+    assert scenes[0].next_scene == scenes[1]
+    assert ScenePlaybackGraph.bar_length() == 3
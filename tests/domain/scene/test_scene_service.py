@@ -0,0 +1,67 @@
+from typing import cast
+
+from protocol0.domain.lom.scene.SceneService import SceneService
+from protocol0.shared.SongFacade import SongFacade
+from protocol0.shared.logging.Logger import Logger
+from protocol0.tests.domain.fixtures.clip_slot import AbletonClipSlot
+from protocol0.tests.domain.fixtures.p0 import make_protocol0
+from protocol0.tests.domain.fixtures.scene import AbletonScene
+
+
+def test_incremental_scene_mapping():
+    make_protocol0()
+    errors = []
+    error = Logger.error
+    Logger.error = classmethod(lambda _, message: errors.append(message))
+    SceneService._DEBUG = True
+    scene_service = SongFacade._INSTANCE._scene_service
+    live_song = SongFacade._live_song()
+    live_track = live_song.tracks[0]
+
+    clip_slot = SongFacade.selected_track().clip_slots[0]
+    cast(AbletonClipSlot, clip_slot._clip_slot).add_clip()
+    clip_slot.has_clip_listener()
+    scene_service.map_scenes()
+    first_scene = list(SongFacade.scenes())[0]
+
+    # insert a scene before the first one
+    live_song.scenes.insert(0, AbletonScene())
+    live_track.clip_slots.insert(0, AbletonClipSlot())
+    scene_service.scenes_listener()
+
+    scenes = list(SongFacade.scenes())
+    assert len(scenes) == 2
+    assert scenes[1] is first_scene
+    assert first_scene.index == 1
+    assert len(first_scene.clips.all) == 1
+    assert len(scenes[0].clips.all) == 0
+
+    # only the added clip slot is created, the moved one is reindexed
+    track = SongFacade.selected_track()
+    assert track.clip_slots[1] is clip_slot
+    assert clip_slot.index == 1
+    assert clip_slot.clip.index == 1
+
+    # move the first scene to the end
+    previous_clip_slot = track.clip_slots[0]
+    live_song.scenes.append(live_song.scenes.pop(0))
+    live_track.clip_slots.append(live_track.clip_slots.pop(0))
+    scene_service.scenes_listener()
+    assert track.clip_slots == [clip_slot, previous_clip_slot]
+    assert clip_slot.index == 0
+    assert list(SongFacade.scenes())[0] is first_scene
+    live_song.scenes.insert(0, live_song.scenes.pop())
+    live_track.clip_slots.insert(0, live_track.clip_slots.pop())
+    scene_service.scenes_listener()
+
+    # delete it
+    live_song.scenes.pop(0)
+    live_track.clip_slots.pop(0)
+    scene_service.scenes_listener()
+
+    assert list(SongFacade.scenes()) == [first_scene]
+    assert first_scene.index == 0
+    assert track.clip_slots == [clip_slot]
+    assert errors == []
+    SceneService._DEBUG = False
+    Logger.error = error
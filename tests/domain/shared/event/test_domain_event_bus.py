@@ -23,13 +23,13 @@ def sub():
 
 
 def test_domain_event_bus_duplicate():
-    DomainEventBus._registry = {}
+    DomainEventBus.reset()
     DomainEventBus.subscribe(TestEvent, sub)
-    assert DomainEventBus._registry[TestEvent] == [sub]
+    assert DomainEventBus._get_subscribers(TestEvent) == (sub,)
 
     # no duplicates
     DomainEventBus.subscribe(TestEvent, sub)
-    assert DomainEventBus._registry[TestEvent] == [sub]
+    assert DomainEventBus._get_subscribers(TestEvent) == (sub,)
 
 
 class Test(object):
@@ -38,11 +38,75 @@ class Test(object):
 
 
 def test_domain_event_bus_duplicate_methods():
-    DomainEventBus._registry = {}
+    DomainEventBus.reset()
     t1, t2 = Test(), Test()
     DomainEventBus.subscribe(TestEvent, t1.m)
-    assert DomainEventBus._registry[TestEvent] == [t1.m]
+    assert DomainEventBus._get_subscribers(TestEvent) == (t1.m,)
 
     # no duplicates across classes
     DomainEventBus.subscribe(TestEvent, t2.m, unique_method=True)
-    assert DomainEventBus._registry[TestEvent] == [t1.m]
+    assert DomainEventBus._get_subscribers(TestEvent) == (t1.m,)
+
+
+def test_domain_event_bus_un_subscribe():
+    DomainEventBus.reset()
+    test_res = []
+
+    def listener(_):
+        test_res.append(True)
+        DomainEventBus.un_subscribe(TestEvent, listener)
+
+    class Subscriber(object):
+        def on_event(self, _):
+            pass
+
+    t = Subscriber()
+    DomainEventBus.subscribe(TestEvent, listener)
+    DomainEventBus.subscribe(TestEvent, t.on_event)
+    DomainEventBus.emit(TestEvent())
+    DomainEventBus.emit(TestEvent())
+
+    assert test_res == [True]
+    assert DomainEventBus._get_subscribers(TestEvent) == (t.on_event,)
+    DomainEventBus.un_subscribe(TestEvent, t.on_event)
+    assert DomainEventBus._get_subscribers(TestEvent) == ()
+
+
+class TestChildEvent(TestEvent):
+    pass
+
+
+def test_domain_event_bus_inheritance():
+    DomainEventBus.reset()
+    test_res = []
+
+    DomainEventBus.subscribe(TestEvent, lambda _: test_res.append(TestEvent))
+    DomainEventBus.emit(TestChildEvent())
+    assert test_res == [TestEvent]
+
+    DomainEventBus.subscribe(TestChildEvent, lambda _: test_res.append(TestChildEvent))
+    DomainEventBus.emit(TestChildEvent())
+    assert test_res == [TestEvent, TestChildEvent, TestEvent]
+
+
+def test_domain_event_bus_dispatch_table_invalidation():
+    DomainEventBus.reset()
+
+    def listener(_):
+        pass
+
+    DomainEventBus.emit(TestEvent())
+    DomainEventBus.emit(TestChildEvent())
+    DomainEventBus.emit(BarEndingEvent())
+
+    # only the snapshots of the event type and its sub classes are dropped
+    DomainEventBus.subscribe(TestEvent, listener)
+    assert set(DomainEventBus._dispatch_table) == {BarEndingEvent}
+    assert DomainEventBus._get_subscribers(TestChildEvent) == (listener,)
+
+    test_res = []
+    DomainEventBus.subscribe(TestChildEvent, test_res.append)
+    DomainEventBus.emit(TestChildEvent())
+    assert len(test_res) == 1
+    DomainEventBus.un_subscribe(TestChildEvent, test_res.append)
+    assert DomainEventBus._get_subscribers(TestChildEvent) == (listener,)
@@ -34,3 +34,27 @@ def test_build():
     assert len(mapping.all) == 2
     assert len(mapping.added) == 0
     assert len(mapping.removed) == 1
+
+
+def test_build_callbacks():
+    class LiveObject(object):
+        def __init__(self):
+            self._live_ptr = id(self)
+
+    added = []
+    removed = []
+    mapping = LiveObjectMapping(lambda obj: [obj], on_added=added.append, on_removed=removed.append)
+
+    live_objects = [LiveObject(), LiveObject(), LiveObject()]
+    mapping.build(live_objects)
+    assert added == mapping.all
+    first_objects = list(mapping.all)
+
+    # unchanged objects are kept, in the live order
+    del added[:]
+    live_objects = [live_objects[2], LiveObject(), live_objects[0]]
+    mapping.build(live_objects)
+    assert mapping.all == [first_objects[2], [live_objects[1]], first_objects[0]]
+    assert mapping.all[0] is first_objects[2]
+    assert added == [[live_objects[1]]]
+    assert removed == [first_objects[1]]
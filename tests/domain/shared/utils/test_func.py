@@ -1,6 +1,6 @@
 from functools import partial
 
-from protocol0.domain.shared.utils.func import is_func_equal
+from protocol0.domain.shared.utils.func import is_func_equal, get_callable_key
 
 
 def test_func_equal():
@@ -31,3 +31,20 @@ def test_func_equal_method():
     t1, t2 = Test(), Test()
     assert not is_func_equal(t1.m, t2.m)
     assert is_func_equal(t1.m, t2.m, compare_methods=True)
+
+
+def test_get_callable_key():
+    t1, t2 = Test(), Test()
+    assert get_callable_key(t1.m) == get_callable_key(t1.m)
+    assert get_callable_key(t1.m) != get_callable_key(t2.m)
+    assert get_callable_key(partial(t1.m, 1)) == get_callable_key(partial(t1.m, 2))
+    assert get_callable_key(partial(t1.m)) != get_callable_key(t1.m)
+
+
+def test_get_callable_key_builtin_method():
+    # py2 bound builtin methods hash their (here unhashable) instance
+    l1, l2 = [], []
+    assert get_callable_key(l1.append) == get_callable_key(l1.append)
+    assert get_callable_key(l1.append) != get_callable_key(l2.append)
+    assert get_callable_key(l1.append) != get_callable_key(l1.extend)
+    hash(get_callable_key({}.update))
@@ -0,0 +1,73 @@
+from typing import List, Tuple, Any
+
+from protocol0.domain.lom.track.TrackMapperService import TrackMapperService
+from protocol0.shared.SongFacade import SongFacade
+from protocol0.tests.domain.fixtures.p0 import make_protocol0
+from protocol0.tests.domain.fixtures.simple_track import TrackType, add_track
+
+
+def _get_mapping():
+    # type: () -> List[Tuple[Any, ...]]
+    return [
+        (
+            track,
+            track.index,
+            track.group_track,
+            list(track.sub_tracks),
+            track.abstract_group_track,
+        )
+        for track in SongFacade.simple_tracks()
+    ]
+
+
+def _remap(track_mapper_service):
+    # type: (TrackMapperService) -> None
+    """incremental remap, checked against a full remap"""
+    track_mapper_service.tracks_listener()
+    mapping = _get_mapping()
+    scene_clip_tracks = list(SongFacade.scenes())[0].clips.tracks
+
+    track_mapper_service.map_tracks()
+    list(SongFacade.scenes())[0].on_tracks_change()
+    assert _get_mapping() == mapping
+    assert list(SongFacade.scenes())[0].clips.tracks == scene_clip_tracks
+
+
+def test_incremental_track_mapping():
+    make_protocol0()
+    track_mapper_service = SongFacade._INSTANCE._track_mapper_service
+    first_track = list(SongFacade.simple_tracks())[0]
+
+    # add a group
+    group_track = add_track(track_type=TrackType.GROUP)
+    sub_track_1 = add_track(track_type=TrackType.AUDIO)
+    sub_track_1.clip_slots[0].add_clip()
+    sub_track_2 = add_track(track_type=TrackType.AUDIO)
+    sub_track_1.group_track = sub_track_2.group_track = group_track
+    _remap(track_mapper_service)
+
+    simple_tracks = list(SongFacade.simple_tracks())
+    assert len(simple_tracks) == 4
+    assert simple_tracks[0] is first_track
+    assert simple_tracks[1].sub_tracks == simple_tracks[2:]
+    assert list(SongFacade.scenes())[0].clips.tracks == [simple_tracks[2]]
+
+    # move a sub track out of the group, at the start
+    live_tracks = SongFacade._live_song().tracks
+    live_tracks.remove(sub_track_1)
+    live_tracks.insert(0, sub_track_1)
+    sub_track_1.group_track = None
+    _remap(track_mapper_service)
+
+    simple_tracks = list(SongFacade.simple_tracks())
+    assert [t.index for t in simple_tracks] == [0, 1, 2, 3]
+    assert simple_tracks[0].group_track is None
+    assert simple_tracks[2].sub_tracks == [simple_tracks[3]]
+    assert list(SongFacade.scenes())[0].clips.tracks == [simple_tracks[0]]
+
+    # remove it
+    live_tracks.remove(sub_track_1)
+    _remap(track_mapper_service)
+
+    assert len(list(SongFacade.simple_tracks())) == 3
+    assert list(SongFacade.scenes())[0].clips.tracks == []
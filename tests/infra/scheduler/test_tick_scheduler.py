@@ -0,0 +1,63 @@
+from functools import partial
+
+from protocol0.infra.scheduler.BeatScheduler import BeatScheduler
+from protocol0.infra.scheduler.TickScheduler import TickScheduler
+from protocol0.tests.domain.fixtures.song import AbletonSong
+
+
+def make_tick_scheduler():
+    # type: () -> TickScheduler
+    song = AbletonSong()
+    return TickScheduler(BeatScheduler(song), song)
+
+
+def test_tick_scheduler_order():
+    tick_scheduler = make_tick_scheduler()
+    test_res = []
+    tick_scheduler.schedule(2, lambda: test_res.append(2))
+    tick_scheduler.schedule(1, lambda: test_res.append(1))
+    tick_scheduler.schedule(1, lambda: test_res.append(1.5))
+
+    tick_scheduler._on_tick()
+    assert test_res == []
+    tick_scheduler._on_tick()
+    assert test_res == [1, 1.5]
+    tick_scheduler._on_tick()
+    assert test_res == [1, 1.5, 2]
+
+
+def test_tick_scheduler_nested_schedule():
+    tick_scheduler = make_tick_scheduler()
+    test_res = []
+
+    def schedule_next():
+        test_res.append(1)
+        tick_scheduler.schedule(1, lambda: test_res.append(2))
+
+    tick_scheduler.schedule(1, schedule_next)
+    tick_scheduler._on_tick()
+    tick_scheduler._on_tick()
+    assert test_res == [1]
+    tick_scheduler._on_tick()
+    assert test_res == [1]
+    tick_scheduler._on_tick()
+    assert test_res == [1, 2]
+
+
+def test_tick_scheduler_cancel_and_unique():
+    tick_scheduler = make_tick_scheduler()
+    test_res = []
+
+    def append(value):
+        test_res.append(value)
+
+    event = tick_scheduler.schedule(1, partial(append, 0))
+    event.cancel()
+    tick_scheduler.schedule(1, partial(append, 1), unique=True)
+    tick_scheduler.schedule(1, partial(append, 2), unique=True)
+    for _ in range(3):
+        tick_scheduler._on_tick()
+
+    assert test_res == [2]
+    assert tick_scheduler._heap == []
+    assert tick_scheduler._events_by_callback == {}
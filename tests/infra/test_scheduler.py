@@ -1,6 +1,13 @@
 from collections import namedtuple
 
+import pytest
+
+from protocol0.domain.lom.scene.SceneLastBarPassedEvent import SceneLastBarPassedEvent
+from protocol0.domain.shared.event.DomainEventBus import DomainEventBus
+from protocol0.domain.shared.scheduler.BarChangedEvent import BarChangedEvent
+from protocol0.infra.scheduler.BeatScheduler import BeatScheduler
 from protocol0.infra.scheduler.BeatTime import BeatTime
+from protocol0.shared.SongFacade import SongFacade
 from protocol0.tests.domain.fixtures.p0 import make_protocol0
 from protocol0.tests.domain.fixtures.song import AbletonSong
 
@@ -48,8 +55,103 @@ def test_beat_time_is_after():
     beat_time_same = BeatTime.make_from_beat_offset(1)
     beat_time_future = BeatTime.make_from_beat_offset(2)
     assert beat_time_same == beat_time
-    assert beat_time_future._to_tick_count > beat_time._to_tick_count
+    assert beat_time_future.tick_count > beat_time.tick_count
     assert beat_time_future > beat_time
     assert beat_time < beat_time_future
     assert beat_time <= beat_time_same
     assert beat_time >= beat_time_same
+
+
+def test_beat_time_flags():
+    beat_time = BeatTime(1, 1, 1, 1, 4)
+    assert beat_time.is_start
+    assert not beat_time.in_last_beat
+
+    beat_time = BeatTime(2, 4, 4, 50, 4)
+    assert not beat_time.is_start
+    assert beat_time.in_last_beat
+    assert beat_time.in_last_8th
+    assert beat_time.in_last_16th
+    assert beat_time.in_last_32th
+    assert beat_time.in_bar_ending
+
+    beat_time = BeatTime(2, 4, 3, 50, 4)
+    assert beat_time.in_last_8th
+    assert not beat_time.in_last_16th
+    assert not BeatTime(2, 4, 4, 50, 5).in_last_beat
+
+
+def test_beat_time_immutable():
+    beat_time = BeatTime(1, 1, 1, 1, 4)
+    for attribute in ("bars", "beats", "tick_count", "is_start"):
+        with pytest.raises(AttributeError):
+            setattr(beat_time, attribute, 2)
+    with pytest.raises(AttributeError):
+        beat_time.color = 1  # type: ignore[attr-defined]
+
+
+def test_beat_scheduler_deadlines():
+    make_protocol0()
+    beat_scheduler = BeatScheduler(AbletonSong())
+    test_res = []
+    beat_scheduler.wait_beats(2, lambda: test_res.append(2), False)
+    beat_scheduler.wait_beats(1, lambda: test_res.append(1), False)
+    beat_scheduler.wait_beats(0, lambda: test_res.append(0), False)
+    assert test_res == [0]
+
+    beats_song_time = namedtuple("beats_song_time", ["bars", "beats", "sub_division", "ticks"])
+    get_current_beats_song_time = AbletonSong.get_current_beats_song_time
+    AbletonSong.get_current_beats_song_time = lambda s: beats_song_time(1, 2, 1, 1)
+    beat_scheduler._on_tick()
+    assert test_res == [0, 1]
+
+    AbletonSong.get_current_beats_song_time = lambda s: beats_song_time(1, 4, 1, 1)
+    beat_scheduler._on_tick()
+    assert test_res == [0, 1, 2]
+    assert beat_scheduler._scheduled_events == []
+    AbletonSong.get_current_beats_song_time = get_current_beats_song_time
+
+
+def test_beat_scheduler_song_stop():
+    make_protocol0()
+    beat_scheduler = BeatScheduler(AbletonSong())
+    test_res = []
+    beat_scheduler.wait_beats(1, lambda: test_res.append(1), False)
+    beat_scheduler.wait_beats(2, lambda: test_res.append(2), True)
+
+    beat_scheduler._is_playing_listener()
+    assert test_res == [2]
+    assert beat_scheduler._scheduled_events == []
+
+
+def test_beat_scheduler_lazy_timing_events(monkeypatch):
+    make_protocol0()
+    DomainEventBus.reset()
+    beat_scheduler = BeatScheduler(AbletonSong())
+    beat_scheduler._last_beats_song_time = BeatTime(1, 4, 4, 60, 4)
+    playing_scene_calls = []
+    monkeypatch.setattr(
+        SongFacade, "playing_scene", classmethod(lambda _: playing_scene_calls.append(True))
+    )
+
+    beats_song_time = namedtuple("beats_song_time", ["bars", "beats", "sub_division", "ticks"])
+    monkeypatch.setattr(
+        AbletonSong, "get_current_beats_song_time", lambda s: beats_song_time(2, 1, 1, 1)
+    )
+    beat_scheduler._on_tick()
+    assert playing_scene_calls == []
+
+    test_res = []
+
+    def listener(event):
+        test_res.append(event)
+
+    DomainEventBus.subscribe(BarChangedEvent, listener)
+    DomainEventBus.subscribe(SceneLastBarPassedEvent, listener)
+    monkeypatch.setattr(
+        AbletonSong, "get_current_beats_song_time", lambda s: beats_song_time(3, 1, 1, 1)
+    )
+    beat_scheduler._on_tick()
+    assert playing_scene_calls == [True]
+    assert len(test_res) == 1 and isinstance(test_res[0], BarChangedEvent)
+    DomainEventBus.reset()
@@ -1,10 +1,18 @@
+import gc
+
+import pytest
+
 from protocol0.application.CommandBus import CommandBus
 from protocol0.application.command.EmitBackendEventCommand import (
     EmitBackendEventCommand,
 )
+from protocol0.domain.shared.errors.Protocol0Error import Protocol0Error
 from protocol0.domain.shared.event.DomainEventBus import DomainEventBus
 from protocol0.domain.shared.scheduler.BarEndingEvent import BarEndingEvent
 from protocol0.shared.sequence.Sequence import Sequence
+from protocol0.shared.sequence.SequenceProfiler import SequenceProfiler
+from protocol0.shared.sequence.SequenceState import SequenceState
+from protocol0.shared.sequence.SequenceTransition import SequenceStateEnum
 from protocol0.tests.domain.fixtures.p0 import make_protocol0
 
 
@@ -135,3 +143,106 @@ def test_cancel():
     seq.done()
 
     assert test_res == []
+
+
+def test_sequence_name():
+    seq = Sequence()
+    assert seq._name is None
+    assert seq.name == "[seq test_sequence.test_sequence_name]"
+    seq.add(lambda: None, name="first")
+    assert repr(seq._steps[0]) == "[seq test_sequence.test_sequence_name] : step first"
+    assert Sequence("named").name == "named"
+
+
+def test_sequence_state_flyweight():
+    seq, other_seq = Sequence(), Sequence()
+    assert seq.state is other_seq.state is SequenceState.UN_STARTED
+    assert not hasattr(seq, "__dict__")
+
+    seq.done()
+    assert seq.state.terminated
+    assert other_seq.state is SequenceState.UN_STARTED
+    with pytest.raises(Protocol0Error):
+        seq.state.change_to(SequenceStateEnum.STARTED)
+
+
+def test_synchronous_sequence_is_not_registered():
+    test_res = []
+    seq = Sequence()
+    seq.add(lambda: test_res.append(1))
+    seq.add(lambda: Sequence().add(lambda: test_res.append(2)).done())
+    seq.add(lambda: test_res.append(3))
+    seq.done()
+
+    assert test_res == [1, 2, 3]
+    assert seq.state.terminated
+    assert seq not in Sequence.running_sequences()
+
+    seq = Sequence()
+    seq.wait_for_event(BarEndingEvent)
+    seq.add(lambda: test_res.append(4))
+    seq.done()
+    assert seq in Sequence.running_sequences()
+
+    DomainEventBus.emit(BarEndingEvent())
+    assert test_res == [1, 2, 3, 4]
+    assert seq.state.terminated
+    assert seq not in Sequence.running_sequences()
+
+
+def test_running_sequences_stats():
+    Sequence.reset()
+    seq = Sequence()
+    seq.wait_for_event(BarEndingEvent)
+    seq.done()
+    seq_2 = Sequence("backend")
+    seq_2.wait_for_backend_event("option_selected")
+    seq_2.done()
+
+    stats = Sequence.get_running_sequences_stats()
+    assert stats["count"] == 2
+    assert stats["by_name"] == {seq.name: 1, "backend": 1}
+    assert stats["by_waiting_for"] == {"event BarEndingEvent": 1, "backend option_selected": 1}
+
+    Sequence.reset()
+    assert Sequence.get_running_sequences_stats()["count"] == 0
+
+
+def test_running_sequences_weak_references():
+    Sequence.reset()
+    seq = Sequence()
+    seq.add(lambda: None, notify_terminated=False)
+    seq.done()
+    assert Sequence.get_running_sequences_stats()["by_waiting_for"] == {"callback": 1}
+
+    del seq
+    gc.collect()
+    assert Sequence.running_sequences() == []
+    assert len(Sequence.RUNNING_SEQUENCES) == 0
+
+
+def test_sequence_profiler():
+    SequenceProfiler.reset()
+    SequenceProfiler.ENABLED = True
+    try:
+        seq = Sequence()
+        seq.add(lambda: None, name="sync step")
+        seq.wait_for_event(BarEndingEvent)
+        seq.add(lambda: None, name="sync step")
+        seq.done()
+        DomainEventBus.emit(BarEndingEvent())
+        assert seq.state.terminated
+    finally:
+        SequenceProfiler.ENABLED = False
+
+    profile = SequenceProfiler.to_dict()
+    step_name = "%s : step sync step" % seq
+    assert profile[step_name]["executions"] == 2
+    assert profile[step_name]["execution"]["count"] == 2
+    waits = [p["wait"] for p in profile.values() if p["wait"]]
+    assert len(waits) == 1
+    assert waits[0]["event BarEndingEvent"]["count"] == 1
+    assert SequenceProfiler.slowest_steps(1)[0] in profile
+
+    SequenceProfiler.reset()
+    assert SequenceProfiler.to_dict() == {}